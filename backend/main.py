@@ -1,13 +1,17 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from pathlib import Path
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 import os
-from typing import Dict
-import asyncio
-from video_analysis.tools.video_tools.clip_analyzer import ClipAnalyzer
-from video_analysis.tools.audio_tools.whisper_transcriber import WhisperTranscriber
+import time
+import threading
+import uuid
+from typing import Dict, Optional
+from upload_stream import UploadError, receive_upload
+from video_analysis.tools.video_tools.frame_extractor import FrameExtractor
+from video_analysis.models.model_registry import model_registry
+from video_analysis.utils.tracing import Tracer
 
 app = FastAPI()
 
@@ -24,35 +28,174 @@ app.add_middleware(
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-@app.post("/api/analyze")
-async def analyze_video(file: UploadFile = File(...)):
-    try:
-        # Save uploaded file
-        file_path = UPLOAD_DIR / file.filename
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+# Job settings
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", 2))
+MAX_ACTIVE_JOBS = int(os.environ.get("MAX_ACTIVE_JOBS", 16))  # queued + running
+JOB_TTL_SECONDS = int(os.environ.get("JOB_TTL_SECONDS", 3600))  # keep finished jobs this long
+MAX_UPLOAD_MB = int(os.environ.get("MAX_UPLOAD_MB", 1024))
 
-        # Initialize analyzers
-        clip_analyzer = ClipAnalyzer()
-        whisper_transcriber = WhisperTranscriber()
+# Analyses run on a bounded pool of threads sharing the preloaded models,
+# so CPU-bound work never blocks the event loop
+executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="analysis")
+jobs: Dict[str, Dict] = {}
+jobs_lock = threading.Lock()
 
-        # Process video
-        visual_results = await clip_analyzer.analyze(str(file_path))
-        audio_results = await whisper_transcriber.transcribe(str(file_path))
+@app.on_event("startup")
+async def load_models():
+    # Load and warm up models in the background so the server can accept
+    # health checks while they load; /api/ready reports when they are done.
+    model_registry.start_warm_up()
 
-        # Clean up
-        os.remove(file_path)
+@app.on_event("shutdown")
+def stop_workers():
+    executor.shutdown(wait=False, cancel_futures=True)
 
-        return {
-            "visual_analysis": visual_results,
-            "audio_analysis": audio_results
+def run_analysis(file_path: Path, tracer: Tracer) -> Dict:
+    """Run the visual and audio analysis of one video on the shared models."""
+    with tracer.span("model_load"):
+        clip_analyzer = model_registry.get_clip()
+        whisper_transcriber = model_registry.get_whisper()
+
+    with tracer.span("frame_decode"):
+        frames, timestamps = FrameExtractor().extract_keyframes(str(file_path))
+    with tracer.span("clip"):
+        analyses = clip_analyzer.batch_analyze_frames(frames)
+    visual_results = [
+        {
+            'timestamp': timestamp,
+            'classifications': analysis['classifications'],
+            'top_categories': analysis['top_categories']
         }
+        for timestamp, analysis in zip(timestamps, analyses)
+    ]
+    with tracer.span("transcribe"):
+        audio_results = whisper_transcriber.transcribe_audio(str(file_path))
+
+    return {
+        "visual_analysis": visual_results,
+        "audio_analysis": audio_results
+    }
+
+def run_job(job_id: str, file_path: Path, tracer: Tracer) -> None:
+    """Run one queued job on a worker thread and record its outcome."""
+    with jobs_lock:
+        jobs[job_id].update(status="running", started_at=time.time())
+
+    try:
+        with tracer.span("analysis"):
+            result = run_analysis(file_path, tracer)
+        # Timings cover the whole request, from the first uploaded byte
+        result["timings"] = tracer.to_dict()
+        with jobs_lock:
+            jobs[job_id].update(status="completed", result=result, finished_at=time.time())
+    except Exception as e:
+        with jobs_lock:
+            jobs[job_id].update(
+                status="failed", error=str(e), timings=tracer.to_dict(), finished_at=time.time()
+            )
+    finally:
+        # Clean up
+        if file_path.exists():
+            os.remove(file_path)
+
+def prune_jobs() -> None:
+    """Forget finished jobs older than JOB_TTL_SECONDS. Caller holds jobs_lock."""
+    cutoff = time.time() - JOB_TTL_SECONDS
+    for job_id in [
+        job_id for job_id, job in jobs.items()
+        if job.get("finished_at") and job["finished_at"] < cutoff
+    ]:
+        del jobs[job_id]
+
+def find_duplicate(content_hash: str) -> Optional[Dict]:
+    """Find a live job for the same upload bytes. Caller holds jobs_lock."""
+    for job in jobs.values():
+        if job.get("content_hash") == content_hash and job["status"] != "failed":
+            return job
+    return None
+
+@app.post("/api/analyze", status_code=202)
+async def analyze_video(request: Request):
+    # Reserve a slot before awaiting the upload, so concurrent uploads
+    # cannot all pass the limit check before any of them is registered
+    job_id = uuid.uuid4().hex
+    with jobs_lock:
+        prune_jobs()
+        active = sum(job["status"] in ("receiving", "queued", "running") for job in jobs.values())
+        if active >= MAX_ACTIVE_JOBS:
+            raise HTTPException(status_code=503, detail="Too many analyses in progress, try again later")
+        jobs[job_id] = {"job_id": job_id, "status": "receiving", "created_at": time.time()}
+
+    # Stream the body straight to a uniquely named file, hashing as it goes
+    tracer = Tracer("request")
+    upload = None
+    try:
+        with tracer.span("upload"):
+            upload = await receive_upload(request, UPLOAD_DIR, MAX_UPLOAD_MB * 1024 * 1024)
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if upload is None:
+            # Release the reserved slot, also when the request is cancelled
+            with jobs_lock:
+                jobs.pop(job_id, None)
+
+    file_path = upload['path']
+    with jobs_lock:
+        duplicate = find_duplicate(upload['sha256'])
+        if duplicate is None:
+            jobs[job_id].update(
+                status="queued",
+                filename=upload['filename'],
+                content_hash=upload['sha256'],
+                size=upload['size']
+            )
+        else:
+            jobs.pop(job_id, None)
+            # Snapshot under the lock, including the result of a finished job
+            duplicate = dict(duplicate)
+
+    if duplicate is not None:
+        # Same bytes already queued or analyzed: reuse that job
+        os.remove(file_path)
+        return {
+            **duplicate,
+            "status_url": f"/api/jobs/{duplicate['job_id']}",
+            "duplicate": True
+        }
+
+    executor.submit(run_job, job_id, file_path, tracer)
+
+    return {"job_id": job_id, "status": "queued", "status_url": f"/api/jobs/{job_id}"}
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return dict(job)
 
 @app.get("/api/health")
 async def health_check():
-    return {"status": "healthy"}
+    with jobs_lock:
+        receiving = sum(job["status"] == "receiving" for job in jobs.values())
+        queued = sum(job["status"] == "queued" for job in jobs.values())
+        running = sum(job["status"] == "running" for job in jobs.values())
+    return {
+        "status": "healthy",
+        "models": model_registry.status(),
+        "jobs": {"receiving": receiving, "queued": queued, "running": running, "workers": ANALYSIS_WORKERS}
+    }
+
+@app.get("/api/ready")
+async def readiness_check():
+    status = model_registry.status()
+    if not status['ready']:
+        raise HTTPException(status_code=503, detail=status)
+    return status
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
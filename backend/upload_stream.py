@@ -0,0 +1,192 @@
+from multipart.multipart import MultipartParser, parse_options_header
+from pathlib import Path
+from typing import Dict, Optional
+import hashlib
+import logging
+import os
+import re
+import time
+import uuid
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class UploadError(Exception):
+    """Raised when an upload is malformed or rejected."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+class MultipartFileWriter:
+    """Writes one multipart file field straight to disk while hashing it."""
+
+    def __init__(
+        self,
+        boundary: bytes,
+        upload_dir: Path,
+        field_name: str = "file",
+        max_bytes: Optional[int] = None,
+        buffer_size: int = 1 << 20
+    ):
+        self.upload_dir = upload_dir
+        self.field_name = field_name
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+
+        self.path: Optional[Path] = None
+        self.filename: Optional[str] = None
+        self.size = 0
+        self._sha = hashlib.sha256()
+        self._file = None
+        self._in_file_part = False
+        self._file_complete = False
+        self._body_complete = False
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+
+        self._parser = MultipartParser(boundary, {
+            'on_part_begin': self._on_part_begin,
+            'on_header_field': self._on_header_field,
+            'on_header_value': self._on_header_value,
+            'on_header_end': self._on_header_end,
+            'on_headers_finished': self._on_headers_finished,
+            'on_part_data': self._on_part_data,
+            'on_part_end': self._on_part_end,
+            'on_end': self._on_end
+        })
+
+    @property
+    def sha256(self) -> str:
+        """Hex digest of the file field's bytes."""
+        return self._sha.hexdigest()
+
+    def write(self, chunk: bytes) -> None:
+        """Feed the next chunk of the request body."""
+        self._parser.write(chunk)
+
+    def finish(self) -> None:
+        """Finish parsing and check a complete file field was received."""
+        self._parser.finalize()
+        self._close()
+        if self.path is None:
+            raise UploadError(f"Missing '{self.field_name}' file field")
+        # A truncated body never reaches the closing boundary
+        if not self._file_complete or not self._body_complete:
+            raise UploadError("Incomplete upload: the multipart body ended before its closing boundary")
+
+    def discard(self) -> None:
+        """Close and delete the partially written file."""
+        self._close()
+        if self.path is not None and self.path.exists():
+            os.remove(self.path)
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode(errors="replace")
+        if name != self.field_name or b"filename" not in options or self.path is not None:
+            self._in_file_part = False
+            return
+
+        self.filename = options[b"filename"].decode(errors="replace")
+        # Never trust the client filename for the path; keep only a sane extension
+        suffix = Path(self.filename).suffix.lower()
+        if not re.fullmatch(r"\.[a-z0-9]{1,8}", suffix):
+            suffix = ""
+        self.path = self.upload_dir / f"{uuid.uuid4().hex}{suffix}"
+        self._file = open(self.path, "wb", buffering=self.buffer_size)
+        self._in_file_part = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self._in_file_part:
+            return
+        chunk = data[start:end]
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise UploadError(f"Upload exceeds the {self.max_bytes // (1024 * 1024)} MB limit", status_code=413)
+        self._sha.update(chunk)
+        self._file.write(chunk)
+
+    def _on_part_end(self) -> None:
+        if self._in_file_part:
+            self._file_complete = True
+        self._in_file_part = False
+
+    def _on_end(self) -> None:
+        self._body_complete = True
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+async def receive_upload(
+    request,
+    upload_dir: Path,
+    max_bytes: int,
+    field_name: str = "file"
+) -> Dict:
+    """
+    Stream a multipart/form-data request's file field to a unique file.
+
+    The body is parsed as it arrives, so every byte is written to disk once
+    and hashed on the way. Oversized uploads are rejected from the
+    Content-Length header when possible, otherwise as soon as the limit is
+    crossed.
+
+    Args:
+        request: Incoming Starlette/FastAPI request
+        upload_dir: Directory for the stored file
+        max_bytes: Maximum accepted file size
+        field_name: Name of the form field holding the file
+
+    Returns:
+        Dictionary with 'path', 'filename', 'size' and 'sha256'
+    """
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in options:
+        raise UploadError("Expected a multipart/form-data upload", status_code=415)
+
+    content_length = request.headers.get("content-length")
+    # Allow a little room for the multipart framing around the file
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes + 64 * 1024:
+        raise UploadError(f"Upload exceeds the {max_bytes // (1024 * 1024)} MB limit", status_code=413)
+
+    writer = MultipartFileWriter(options[b"boundary"], upload_dir, field_name, max_bytes)
+    start_time = time.perf_counter()
+
+    try:
+        async for chunk in request.stream():
+            writer.write(chunk)
+        writer.finish()
+    except Exception:
+        writer.discard()
+        raise
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(
+        f"Received {writer.size / (1024 * 1024):.1f} MB upload in {elapsed:.2f}s "
+        f"({writer.size / (1024 * 1024) / max(elapsed, 1e-6):.1f} MB/s)"
+    )
+
+    return {
+        'path': writer.path,
+        'filename': writer.filename,
+        'size': writer.size,
+        'sha256': writer.sha256
+    }
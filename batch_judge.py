@@ -0,0 +1,201 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from config.settings import settings
+from video_analysis.tools.judging_tools.rubric_scorer import analyze_presentation
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MEDIA_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.mp3', '.wav', '.m4a', '.ogg'}
+
+SCORE_CATEGORIES = [
+    "innovation_and_creativity",
+    "functioning_prototype",
+    "technical_complexity",
+    "business_utility",
+    "presentation_quality",
+    "bonus_integration"
+]
+
+# Transcriber loaded once per worker process
+_worker_transcriber = None
+
+def _init_worker(model_size: str, threads: int, engine: str) -> None:
+    """Load and warm up the Whisper model once in a worker process."""
+    global _worker_transcriber
+    import torch
+    from video_analysis.tools.audio_tools.whisper_transcriber import WhisperTranscriber
+
+    torch.set_num_threads(threads)
+    _worker_transcriber = WhisperTranscriber(model_size, engine=engine)
+    # The model loads lazily; load it here so per-submission timings exclude it
+    _worker_transcriber.warm_up()
+
+def judge_submission(media_path: str, vad: bool = False) -> Dict:
+    """
+    Transcribe and score one submission in a worker process.
+
+    Args:
+        media_path: Path to the video or audio file
+        vad: Whether to skip silence before transcription
+
+    Returns:
+        Dictionary containing the transcript, scores and timing
+    """
+    start_time = time.perf_counter()
+    transcription = _worker_transcriber.transcribe_audio(media_path, vad=vad)
+    results = analyze_presentation(transcription['segments'])
+
+    return {
+        'submission': media_path,
+        'transcription': transcription,
+        'results': results,
+        'seconds': time.perf_counter() - start_time
+    }
+
+def find_submissions(source: Path) -> List[Path]:
+    """
+    List submissions from a directory or a manifest file.
+
+    A manifest is either a JSON list of paths or a text file with one path
+    per line; relative paths are resolved against the manifest's directory.
+    """
+    if source.is_dir():
+        return sorted(
+            path for path in source.rglob('*')
+            if path.is_file() and path.suffix.lower() in MEDIA_EXTENSIONS
+        )
+
+    if source.suffix.lower() == '.json':
+        with open(source) as f:
+            entries = json.load(f)
+    else:
+        with open(source) as f:
+            entries = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    return [(source.parent / entry) if not Path(entry).is_absolute() else Path(entry) for entry in entries]
+
+def result_path(output_dir: Path, submission: Path, source: Path) -> Path:
+    """Get the per-submission result file, unique across subdirectories."""
+    base = source if source.is_dir() else source.parent
+    try:
+        name = submission.resolve().relative_to(base.resolve())
+    except ValueError:
+        name = Path(submission.name)
+    return output_dir / (str(name.with_suffix('')).replace(os.sep, '__') + '.json')
+
+def write_json(path: Path, data: Dict) -> None:
+    """Write JSON atomically so an interrupted run never leaves partial results."""
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def write_summary(output_dir: Path, rows: List[Dict]) -> None:
+    """Write the summary table as CSV and print it."""
+    fieldnames = ['submission', 'status', 'total_score', 'categories_scored'] + SCORE_CATEGORIES
+    with open(output_dir / 'summary.csv', 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"\n{'Submission':<50} {'Status':<8} {'Total':>5}")
+    for row in sorted(rows, key=lambda row: -(row.get('total_score') or 0)):
+        print(f"{row['submission'][:50]:<50} {row['status']:<8} {row.get('total_score', ''):>5}")
+
+def summary_row(submission: str, results: Optional[Dict], status: str) -> Dict:
+    """Flatten one submission's scores into a summary table row."""
+    row = {'submission': submission, 'status': status}
+    if results:
+        row['total_score'] = results['total_score']
+        row['categories_scored'] = results['categories_scored']
+        for category in SCORE_CATEGORIES:
+            row[category] = results[category]['score']
+    return row
+
+def main():
+    """Judge every submission in a directory or manifest."""
+    parser = argparse.ArgumentParser(description="Batch-judge hackathon submissions")
+    parser.add_argument('source', type=Path, help="Directory of submissions or manifest file (.json or .txt)")
+    parser.add_argument('--output', type=Path, default=Path('judging_results'), help="Directory for results")
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 1) // 4), help="Worker processes")
+    parser.add_argument('--model', default="base", help="Whisper model size")
+    parser.add_argument('--vad', action='store_true', help="Skip silence before transcription")
+    parser.add_argument('--engine', choices=['fp32', 'int8'], default=settings.WHISPER_ENGINE,
+                        help="Whisper inference engine (int8 quantizes for CPU hosts)")
+    args = parser.parse_args()
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    submissions = find_submissions(args.source)
+    rows = []
+    pending = []
+
+    # Resume: submissions with a result file were finished by an earlier run
+    for submission in submissions:
+        path = result_path(args.output, submission, args.source)
+        if path.exists():
+            with open(path) as f:
+                rows.append(summary_row(str(submission), json.load(f)['results'], 'done'))
+        else:
+            pending.append(submission)
+
+    logger.info(
+        f"Found {len(submissions)} submissions, {len(submissions) - len(pending)} already judged, "
+        f"judging {len(pending)} with {args.workers} workers"
+    )
+
+    start_time = time.perf_counter()
+    completed = 0
+    threads = max(1, (os.cpu_count() or 1) // args.workers)
+
+    if pending:
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.model, threads, args.engine)
+        ) as executor:
+            futures = {
+                executor.submit(judge_submission, str(submission), args.vad): submission
+                for submission in pending
+            }
+            for future in as_completed(futures):
+                submission = futures[future]
+                try:
+                    judged = future.result()
+                except Exception as e:
+                    # Failures get no result file, so the next run retries them
+                    logger.error(f"Error judging {submission}: {str(e)}")
+                    rows.append(summary_row(str(submission), None, 'error'))
+                    continue
+
+                write_json(result_path(args.output, submission, args.source), judged)
+                rows.append(summary_row(str(submission), judged['results'], 'done'))
+                completed += 1
+                logger.info(
+                    f"[{completed}/{len(pending)}] {submission.name}: "
+                    f"{judged['results']['total_score']} points in {judged['seconds']:.1f}s"
+                )
+
+    elapsed = time.perf_counter() - start_time
+    write_summary(args.output, rows)
+    if completed:
+        logger.info(
+            f"Judged {completed} submissions in {elapsed:.1f}s "
+            f"({completed / elapsed * 3600:.1f} submissions/hour)"
+        )
+
+if __name__ == "__main__":
+    main()
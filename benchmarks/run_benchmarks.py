@@ -0,0 +1,450 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.10  # allowed relative slowdown before a metric counts as a regression
+# Whisper decodes whatever it hallucinates on synthetic audio, so its runtime
+# varies between runs far more than the other benchmarks
+NOISY_THRESHOLD = 0.25
+
+# ---------------------------------------------------------------------------
+# Synthetic media
+# ---------------------------------------------------------------------------
+
+def generate_video(path: Path, seconds: float, width: int, height: int, fps: int = 30, scene_length: float = 5.0) -> Path:
+    """
+    Write a synthetic video: moving gradients with a new scene every scene_length seconds.
+
+    Args:
+        path: Output .mp4 path
+        seconds: Video length
+        width: Frame width
+        height: Frame height
+        fps: Frames per second
+        scene_length: Seconds per scene, so scene detection has work to do
+
+    Returns:
+        The output path
+    """
+    import cv2
+
+    rng = np.random.default_rng(0)
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+    gradient = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+    color = rng.integers(0, 255, size=3)
+
+    for i in range(int(seconds * fps)):
+        if i % int(scene_length * fps) == 0:
+            color = rng.integers(0, 255, size=3)
+        frame = (gradient * 0.5 + color * 0.5 + (i % fps)).astype(np.uint8)
+        frame = np.broadcast_to(frame, (height, width, 3)).copy()
+        cv2.putText(frame, f"Scene {i // int(scene_length * fps)}", (width // 10, height // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX, max(0.5, width / 640), (255, 255, 255), 2)
+        writer.write(frame)
+
+    writer.release()
+    return path
+
+def generate_speech_like_audio(seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Generate speech-like audio: voiced, syllable-length harmonic bursts with pauses.
+
+    Each 'syllable' is a 100-250 ms harmonic tone with a wandering pitch and
+    a smooth envelope; pauses between words and sentences give voice
+    activity detection and Whisper realistic structure to work through.
+
+    Args:
+        seconds: Audio length
+        sample_rate: Samples per second
+
+    Returns:
+        Mono float32 samples in [-1, 1]
+    """
+    rng = np.random.default_rng(0)
+    audio = np.zeros(int(seconds * sample_rate), dtype=np.float32)
+    position = 0
+
+    while position < len(audio):
+        length = int(rng.uniform(0.10, 0.25) * sample_rate)
+        t = np.arange(length) / sample_rate
+        pitch = rng.uniform(100, 220) * (1 + 0.05 * np.sin(2 * np.pi * 3 * t))
+        phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+        syllable = sum(np.sin(k * phase) / k for k in range(1, 6))
+        syllable *= np.hanning(length)
+        end = min(position + length, len(audio))
+        audio[position:end] = 0.3 * syllable[:end - position]
+
+        # Short gaps between syllables, longer ones between words and sentences
+        position = end + int(rng.choice([0.03, 0.03, 0.15, 0.6]) * sample_rate)
+
+    audio += rng.normal(0, 0.005, len(audio)).astype(np.float32)
+    return np.clip(audio, -1, 1)
+
+def write_wav(path: Path, audio: np.ndarray, sample_rate: int = 16000) -> Path:
+    """Write float samples as 16-bit mono PCM."""
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes((audio * 32767).astype(np.int16).tobytes())
+    return path
+
+def mux_submission(video_path: Path, audio_path: Path, path: Path) -> Path:
+    """Combine the synthetic video and audio into one submission file, like an uploaded recording."""
+    subprocess.run(
+        ['ffmpeg', '-nostdin', '-loglevel', 'error', '-y', '-i', str(video_path), '-i', str(audio_path),
+         '-c:v', 'copy', '-c:a', 'aac', '-shortest', str(path)],
+        check=True
+    )
+    return path
+
+def generate_segments(count: int, seed: int = 0) -> List[Dict]:
+    """Generate transcript segments mixing rubric keywords with filler words."""
+    from video_analysis.tools.judging_tools.rubric_scorer import RUBRIC_KEYWORD_GROUPS
+
+    rng = random.Random(seed)
+    keywords = [keyword for group in RUBRIC_KEYWORD_GROUPS.values() for keyword in group]
+    filler = "so we built this and then the team used it to show how it works for our users".split()
+    segments = []
+    for i in range(count):
+        words = [rng.choice(filler) for _ in range(rng.randint(8, 20))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        segments.append({'start': i * 4.0, 'end': i * 4.0 + 3.5, 'text': ' '.join(words)})
+    return segments
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def metric(value: float, unit: str, higher_is_better: bool, threshold: float = 0.0) -> Dict:
+    """
+    Build one benchmark metric record.
+
+    Args:
+        value: Measured value
+        unit: Unit of the value
+        higher_is_better: Direction of improvement
+        threshold: Minimum allowed relative regression for this metric,
+            for metrics noisier than the run's --threshold
+    """
+    record = {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+    if threshold:
+        record['threshold'] = threshold
+    return record
+
+def info(value, unit: str) -> Dict:
+    """Build a behaviour record: reported and checked for changes, never gated as performance."""
+    return {'value': value, 'unit': unit, 'info': True}
+
+def best_of(repeats: int, func: Callable[[], None]) -> float:
+    """Run func repeatedly and return the fastest wall time in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+def median_of(repeats: int, func: Callable[[], None]) -> float:
+    """Run func repeatedly and return the median wall time in seconds."""
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start_time)
+    return float(np.median(times))
+
+def bench_frame_extraction(media: Dict, args) -> Dict:
+    """FrameExtractor.extract_keyframes throughput over the synthetic video."""
+    from video_analysis.tools.video_tools.frame_extractor import FrameExtractor
+
+    extractor = FrameExtractor()
+    metadata = {}
+    keyframes = []
+
+    def run():
+        keyframes[:] = extractor.extract_keyframes(str(media['video']), metadata=metadata)[1]
+
+    seconds = best_of(args.repeats, run)
+    return {
+        'frame_extraction_fps': metric(metadata['frame_count'] / seconds, "source frames/s", True),
+        'keyframes_extracted': info(len(keyframes), "frames")
+    }
+
+def bench_clip(media: Dict, args) -> Dict:
+    """CLIPAnalyzer batched image throughput."""
+    from video_analysis.tools.video_tools.clip_analyzer import CLIPAnalyzer
+
+    analyzer = CLIPAnalyzer()
+    analyzer.warm_up()
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8) for _ in range(args.clip_images)]
+
+    seconds = best_of(args.repeats, lambda: analyzer.batch_analyze_frames(frames))
+    return {'clip_images_per_second': metric(len(frames) / seconds, "images/s", True)}
+
+def bench_whisper(media: Dict, args) -> Dict:
+    """Whisper real-time factor on the synthetic speech-like audio."""
+    from video_analysis.tools.audio_tools.whisper_transcriber import WhisperTranscriber
+
+    transcriber = WhisperTranscriber(args.whisper_model)
+    transcriber.warm_up()
+
+    def run():
+        try:
+            transcriber.transcribe_audio(str(media['audio']))
+        except ValueError:
+            pass  # Synthetic audio may contain no recognizable words
+
+    # The median is steadier than the best run when decode length varies
+    seconds = median_of(args.repeats, run)
+    return {'whisper_rtf': metric(seconds / args.seconds, "s/s of audio", False, threshold=NOISY_THRESHOLD)}
+
+def bench_scoring(media: Dict, args) -> Dict:
+    """analyze_presentation throughput on synthetic transcript segments."""
+    from video_analysis.tools.judging_tools.rubric_scorer import analyze_presentation
+
+    segments = generate_segments(args.segments)
+    seconds = best_of(args.repeats, lambda: analyze_presentation(segments))
+    return {'scoring_segments_per_second': metric(len(segments) / seconds, "segments/s", True)}
+
+def bench_judging(media: Dict, args) -> Dict:
+    """
+    Latency of judging one submission through the batch judging worker.
+
+    Runs batch_judge's worker initializer and judge_submission with voice
+    activity detection, then a repeat submission of the same bytes answered
+    from a fresh ArtifactCache, as the Streamlit page answers it.
+    """
+    import batch_judge
+    from config.settings import settings
+    from video_analysis.tools.integration_tools.artifact_cache import ArtifactCache
+    from video_analysis.tools.judging_tools.rubric_scorer import RUBRIC_FINGERPRINT
+
+    batch_judge._init_worker(args.whisper_model, os.cpu_count() or 1, settings.WHISPER_ENGINE)
+    judged = {}
+
+    def run():
+        try:
+            judged.update(batch_judge.judge_submission(str(media['audio']), vad=True))
+        except ValueError:
+            judged.update(transcription={'segments': [], 'text': ''}, results={})  # No recognizable words
+
+    seconds = median_of(args.repeats, run)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        params = {'model': f"whisper-{args.whisper_model}", 'engine': settings.WHISPER_ENGINE}
+        media_hash = ArtifactCache(cache_dir).hash_media(str(media['audio']))
+        ArtifactCache(cache_dir).put(media_hash, 'transcript', judged['transcription'], **params)
+        ArtifactCache(cache_dir).put(media_hash, 'scores', judged['results'], rubric=RUBRIC_FINGERPRINT, **params)
+
+        def cached_run():
+            # A new instance per run, so the media is hashed again like a new upload
+            cache = ArtifactCache(cache_dir)
+            media_hash = cache.hash_media(str(media['audio']))
+            cache.get(media_hash, 'transcript', **params)
+            cache.get(media_hash, 'scores', rubric=RUBRIC_FINGERPRINT, **params)
+
+        cached_seconds = best_of(args.repeats, cached_run)
+
+    return {
+        'judging_seconds': metric(seconds, "s", False, threshold=NOISY_THRESHOLD),
+        'cached_judging_seconds': metric(cached_seconds, "s", False)
+    }
+
+def bench_end_to_end(media: Dict, args) -> Dict:
+    """
+    Latency of analyze_video_content on one submission with video and audio.
+
+    Runs the real entry point: the visual branch (keyframes streamed into
+    batched CLIP) and the audio branch (chunked transcription in worker
+    processes) concurrently, then the summaries. Nothing is cached between
+    runs. Branch wall times come from the analysis's own timing spans.
+    """
+    sys.path.append(str(project_root / 'video_analysis' / 'examples'))
+    from test_clip_analyzer import analyze_video_content
+
+    runs = []
+
+    def run():
+        runs.append(analyze_video_content(media['submission']))
+
+    seconds = median_of(args.repeats, run)
+
+    def branch_seconds(name: str) -> float:
+        return float(np.median([
+            span['wall_seconds']
+            for results in runs
+            for span in results['timings']['children']
+            if span['name'] == name
+        ]))
+
+    return {
+        'end_to_end_seconds': metric(seconds, "s", False, threshold=NOISY_THRESHOLD),
+        'visual_branch_seconds': metric(branch_seconds('visual_branch'), "s", False),
+        'audio_branch_seconds': metric(branch_seconds('audio_branch'), "s", False, threshold=NOISY_THRESHOLD),
+        'end_to_end_frames_analyzed': info(runs[-1]['summary']['total_frames_analyzed'], "frames")
+    }
+
+BENCHMARKS = {
+    'frame_extraction': bench_frame_extraction,
+    'clip': bench_clip,
+    'whisper': bench_whisper,
+    'scoring': bench_scoring,
+    'judging': bench_judging,
+    'end_to_end': bench_end_to_end
+}
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+def compare_to_baseline(results: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """
+    Compare metrics with a saved baseline run.
+
+    Behaviour records under 'info' (such as keyframe counts) are not
+    compared; see compare_info.
+
+    Args:
+        results: Current run
+        baseline: Saved run
+        threshold: Allowed relative change in the worse direction; metrics
+            with their own (looser) threshold use the larger of the two
+
+    Returns:
+        One row per metric present in both runs, with its relative change
+        (positive is better) and whether it regressed
+    """
+    rows = []
+    for name, current in results['metrics'].items():
+        previous = baseline['metrics'].get(name)
+        if previous is None or not previous['value']:
+            continue
+        change = (current['value'] - previous['value']) / previous['value']
+        if not current['higher_is_better']:
+            change = -change
+        rows.append({
+            'metric': name,
+            'baseline': previous['value'],
+            'current': current['value'],
+            'unit': current['unit'],
+            'change': change,
+            'regressed': change < -max(threshold, current.get('threshold', 0.0))
+        })
+    return rows
+
+def compare_info(results: Dict, baseline: Dict) -> List[Dict]:
+    """List behaviour records whose value differs from the baseline in either direction."""
+    return [
+        {'name': name, 'baseline': baseline['info'][name]['value'], 'current': current['value']}
+        for name, current in results['info'].items()
+        if name in baseline.get('info', {}) and baseline['info'][name]['value'] != current['value']
+    ]
+
+def main():
+    """Run the judging pipeline benchmarks and compare them with a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the judging pipeline on synthetic media")
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument('--seconds', type=float, default=60, help="Synthetic video/audio length")
+    parser.add_argument('--width', type=int, default=640, help="Synthetic video width")
+    parser.add_argument('--height', type=int, default=360, help="Synthetic video height")
+    parser.add_argument('--clip-images', type=int, default=64, help="Images per CLIP benchmark run")
+    parser.add_argument('--segments', type=int, default=2000, help="Transcript segments per scoring run")
+    parser.add_argument('--whisper-model', default="base", help="Whisper model size")
+    parser.add_argument('--repeats', type=int, default=3, help="Timed runs per benchmark (best is kept; median for Whisper, judging and end-to-end)")
+    parser.add_argument('--output', type=Path, default=Path('benchmarks/results/latest.json'), help="Results JSON")
+    parser.add_argument('--baseline', type=Path, help="Baseline JSON to compare against")
+    parser.add_argument('--save-baseline', type=Path, help="Also save this run as a baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    selected = args.only or list(BENCHMARKS)
+    results = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            key: value for key, value in vars(args).items()
+            if key in ('seconds', 'width', 'height', 'clip_images', 'segments', 'whisper_model', 'repeats')
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'metrics': {},
+        'info': {}
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        media = {}
+        if {'frame_extraction', 'end_to_end'} & set(selected):
+            media['video'] = generate_video(Path(temp_dir) / 'synthetic.mp4', args.seconds, args.width, args.height)
+        if {'whisper', 'judging', 'end_to_end'} & set(selected):
+            media['audio'] = write_wav(Path(temp_dir) / 'synthetic.wav', generate_speech_like_audio(args.seconds))
+        if 'end_to_end' in selected:
+            media['submission'] = mux_submission(media['video'], media['audio'], Path(temp_dir) / 'submission.mp4')
+
+        for name in selected:
+            logger.info(f"Running {name} benchmark")
+            metrics = BENCHMARKS[name](media, args)
+            for metric_name, value in metrics.items():
+                logger.info(f"  {metric_name}: {value['value']:.3f} {value['unit']}")
+                section = 'info' if value.pop('info', False) else 'metrics'
+                results[section][metric_name] = value
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    logger.info(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('config') != results['config']:
+            logger.warning("Baseline was recorded with a different configuration; comparisons may not be meaningful")
+
+        rows = compare_to_baseline(results, baseline, args.threshold)
+        print(f"\n{'Metric':<30} {'Baseline':>12} {'Current':>12} {'Change':>8}")
+        for row in rows:
+            flag = "  REGRESSION" if row['regressed'] else ""
+            print(f"{row['metric']:<30} {row['baseline']:>12.3f} {row['current']:>12.3f} {row['change']:>+8.1%}{flag}")
+
+        # A behaviour change is not a slowdown, but it makes the timings
+        # incomparable, so it is reported as a mismatch
+        for row in compare_info(results, baseline):
+            logger.warning(f"{row['name']} changed from {row['baseline']} to {row['current']}: behaviour differs from the baseline")
+
+        regressions = [row['metric'] for row in rows if row['regressed']]
+        if regressions:
+            logger.error(f"{len(regressions)} metrics regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        logger.info("No regressions against the baseline")
+
+if __name__ == "__main__":
+    main()
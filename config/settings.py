@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from pathlib import Path
 from typing import Optional
 
 class Settings(BaseModel):
@@ -6,16 +7,31 @@ class Settings(BaseModel):
     
     # CLIP Model settings
     CLIP_MODEL_NAME: str = "openai/clip-vit-base-patch32"
+    CLIP_ENGINE: str = "fp32"  # "fp32", or "int8" for dynamic quantization on CPU
     
     # Whisper Model settings
     WHISPER_MODEL_NAME: str = "base"
+    WHISPER_ENGINE: str = "fp32"  # "fp32", or "int8" for dynamic quantization on CPU
+    
+    # Audio settings
+    AUDIO_CHUNK_LENGTH: int = 30  # seconds
+    AUDIO_CHUNK_OVERLAP: int = 2  # seconds shared by consecutive chunks
     
     # Processing settings
     BATCH_SIZE: int = 32
     MAX_FRAMES: int = 100
     FRAME_INTERVAL: int = 30  # Process every Nth frame
+    FRAME_SAMPLING_RATE: int = 1  # Seconds between sampled frames
+    FRAME_EXTRACTION_WORKERS: int = 1  # Processes decoding keyframe time ranges; 1 is sequential
+    PIPELINE_QUEUE_SIZE: int = 64  # Preprocessed frames buffered between decode and CLIP
+    PIPELINE_FLUSH_TIMEOUT: float = 0.5  # Seconds before a partial CLIP batch is flushed
     
     # Device settings
     FORCE_CPU: bool = False
+    
+    # Cache settings
+    CACHE_DIR: Path = Path(__file__).parent.parent / ".cache"
+    ARTIFACT_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # 2 GB
+    DOWNLOAD_CACHE_MAX_BYTES: int = 5 * 1024 ** 3  # 5 GB of downloaded YouTube media
 
 settings = Settings()
@@ -1,6 +1,8 @@
 import { useState } from 'react';
 import axios from 'axios';
 
+const POLL_INTERVAL_MS = 2000;
+
 const VideoUpload = () => {
   const [file, setFile] = useState<File | null>(null);
   const [loading, setLoading] = useState(false);
@@ -37,7 +39,21 @@ const VideoUpload = () => {
           },
         }
       );
-      setResults(response.data);
+
+      // Analysis runs as a background job; poll until it finishes
+      let job = response.data;
+      while (job.status === 'queued' || job.status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+        const status = await axios.get(
+          `${process.env.NEXT_PUBLIC_API_URL}/api/jobs/${job.job_id}`
+        );
+        job = status.data;
+      }
+
+      if (job.status !== 'completed') {
+        throw new Error(job.error || 'Analysis failed');
+      }
+      setResults(job.result);
     } catch (err) {
       setError('Error analyzing video. Please try again.');
       console.error(err);
@@ -1,20 +1,21 @@
 import streamlit as st
 from pathlib import Path
+from contextlib import closing
 import tempfile
 import os
 import sys
-import cv2
-from PIL import Image
-import numpy as np
-import yt_dlp
 import re
 
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-from video_analysis.tools.video_tools.clip_analyzer import CLIPAnalyzer
-from video_analysis.tools.audio_tools.whisper_transcriber import WhisperTranscriber
+from config.settings import settings
+from video_analysis.models.model_registry import model_registry
+from video_analysis.tools.integration_tools.artifact_cache import ArtifactCache
+from video_analysis.tools.integration_tools.youtube_downloader import YouTubeDownloader
+from video_analysis.tools.judging_tools.rubric_scorer import analyze_presentation, PresentationScorer, RUBRIC_FINGERPRINT
+from video_analysis.utils.tracing import Tracer, flatten_spans
 
 st.set_page_config(
     page_title="Hackathon Judge",
@@ -24,315 +25,270 @@ st.set_page_config(
 
 st.title("🏆 Hackathon Judge")
 
-def analyze_presentation(segments):
-    """Analyze presentation segments according to A2A hackathon judging criteria."""
-    results = {
-        "innovation_and_creativity": {"score": None, "feedback": [], "observable": False},
-        "functioning_prototype": {"score": None, "feedback": [], "observable": False},
-        "technical_complexity": {"score": None, "feedback": [], "observable": False},
-        "business_utility": {"score": None, "feedback": [], "observable": False},
-        "presentation_quality": {"score": None, "feedback": [], "observable": False},
-        "bonus_integration": {"score": None, "feedback": [], "observable": False}
-    }
-    
-    # Keywords for each category
-    a2a_specific_keywords = [
-        "agent to agent", "a2a", "agent-to-agent", 
-        "between agents", "agent transaction", "agent transfer",
-        "autonomous agent", "agent payment", "agent interaction"
-    ]
-    
-    innovation_keywords = [
-        "novel", "unique", "innovative", "creative", "new approach", "unconventional",
-        "future of a2a", "agent innovation", "agent automation"
-    ]
-    
-    prototype_keywords = [
-        "demo", "demonstration", "transaction", "working", "prototype", "live",
-        "agent demo", "agent transaction demo", "a2a transfer"
-    ]
-    
-    technical_keywords = [
-        "implementation", "architecture", "integration", "api", "backend", "security",
-        "authentication", "database", "infrastructure", "technical", "agent protocol",
-        "agent communication", "agent interface"
-    ]
-    
-    business_keywords = [
-        "market", "problem", "solution", "opportunity", "customer", "user",
-        "business case", "roi", "implementation path", "adoption",
-        "agent economy", "agent marketplace", "agent use case"
-    ]
-    
-    presentation_keywords = [
-        "clear", "organized", "structure", "story", "professional",
-        "explanation", "walkthrough", "demonstration"
-    ]
+@st.cache_resource
+def start_model_warm_up():
+    """Load and warm up the transcription model once per process, shared by all sessions."""
+    return model_registry.start_warm_up(load_clip=False)
+
+@st.cache_resource
+def get_artifact_cache():
+    """
+    Get the artifact cache shared by all reruns and sessions.
     
-    integration_keywords = {
-        "story": ["story integration", "integrated with story", "using story", "story platform"],
-        "fxn": ["fxn integration", "integrated with fxn", "using fxn", "fxn platform"],
-        "alliance": ["alliance integration", "integrated with alliance", "using alliance", "alliance platform"],
-        "masumi": ["masumi network integration", "integrated with masumi", "using masumi network", "masumi platform"]
-    }
+    Keeps its in-memory memo of media hashes alive across reruns instead of
+    rebuilding the cache on every interaction.
+    """
+    return ArtifactCache()
+
+start_model_warm_up()
+if not model_registry.is_ready():
+    st.info("⏳ Loading transcription model... the first analysis will start once it is ready.")
+
+# Per-stage analysis artifacts, keyed by media content and shared by all sessions
+artifact_cache = get_artifact_cache()
+
+@st.cache_resource
+def get_youtube_downloader():
+    """
+    Get the YouTube downloader shared by all reruns and sessions.
     
-    # Track evidence for each category
-    evidence = {category: [] for category in results.keys()}
+    Streamlit re-executes this script on every interaction, so a module-level
+    downloader would be rebuilt each time and its per-video locks would never
+    serialize concurrent downloads of the same video.
+    """
+    return YouTubeDownloader()
+
+# YouTube media cached by video ID
+youtube_downloader = get_youtube_downloader()
+WHISPER_MODEL_SIZE = "base"
+PROGRESSIVE_CHUNK_SECONDS = 30  # audio per progressive update
+
+def transcript_params(progressive):
+    """Cache parameters of a transcript; chunked and whole-file transcripts differ."""
+    params = {'model': f"whisper-{WHISPER_MODEL_SIZE}", 'engine': settings.WHISPER_ENGINE}
+    if progressive:
+        params['chunk_size'] = PROGRESSIVE_CHUNK_SECONDS
+    return params
+
+def get_transcript(media_path, media_hash, tracer):
+    """Transcribe media, reusing the cached transcript of identical bytes."""
+    def transcribe():
+        # Get the shared, pre-warmed transcriber
+        with tracer.span("model_load"):
+            whisper_transcriber = model_registry.get_whisper(WHISPER_MODEL_SIZE)
+        with tracer.span("whisper"):
+            return whisper_transcriber.transcribe_audio(media_path)
     
-    # Track if A2A transactions are demonstrated
-    has_a2a_focus = False
-    a2a_evidence = []
+    return artifact_cache.get_or_compute(
+        media_hash, 'transcript', transcribe,
+        **transcript_params(progressive=False)
+    )
+
+def iter_transcript(media_path, media_hash, tracer):
+    """
+    Transcribe media in chunks, yielding (new segments, progress) as each completes.
     
-    # Track which partners are integrated
-    integrated_partners = set()
+    A cached transcript of identical bytes is yielded at once; a freshly
+    completed transcript is cached for next time.
+    """
+    params = transcript_params(progressive=True)
+    with tracer.span("cache_lookup"):
+        cached = artifact_cache.get(media_hash, 'transcript', **params)
+    if cached is not None:
+        yield cached['segments'], 1.0
+        return
     
-    for segment in segments:
-        text = segment['text'].lower()
-        timestamp = f"[{int(segment['start'])}s]"
-        
-        # Check for A2A specific content
-        if any(keyword in text for keyword in a2a_specific_keywords):
-            has_a2a_focus = True
-            a2a_evidence.append(f"{timestamp} {text}")
-        
-        # Innovation and Creativity (only count if A2A-related)
-        if any(keyword in text for keyword in innovation_keywords):
-            if any(a2a_kw in text for a2a_kw in a2a_specific_keywords):
-                results["innovation_and_creativity"]["observable"] = True
-                evidence["innovation_and_creativity"].append(
-                    f"{timestamp} {text}"
-                )
-        
-        # Functioning Prototype (must show A2A transaction)
-        if any(keyword in text for keyword in prototype_keywords):
-            if any(a2a_kw in text for a2a_kw in a2a_specific_keywords):
-                results["functioning_prototype"]["observable"] = True
-                evidence["functioning_prototype"].append(
-                    f"{timestamp} {text}"
-                )
-            else:
-                # Note non-A2A demo as feedback
-                results["functioning_prototype"]["feedback"].append(
-                    f"{timestamp} Demo shown but not focused on A2A transactions"
-                )
-        
-        # Technical Complexity
-        if any(keyword in text for keyword in technical_keywords):
-            if any(a2a_kw in text for a2a_kw in a2a_specific_keywords):
-                results["technical_complexity"]["observable"] = True
-                evidence["technical_complexity"].append(
-                    f"{timestamp} {text}"
-                )
-        
-        # Business Utility
-        if any(keyword in text for keyword in business_keywords):
-            if any(a2a_kw in text for a2a_kw in a2a_specific_keywords):
-                results["business_utility"]["observable"] = True
-                evidence["business_utility"].append(
-                    f"{timestamp} {text}"
-                )
-        
-        # Presentation Quality
-        if any(keyword in text for keyword in presentation_keywords):
-            results["presentation_quality"]["observable"] = True
-            evidence["presentation_quality"].append(
-                f"{timestamp} {text}"
-            )
-        
-        # Bonus Integration - Check each partner specifically
-        for partner, partner_keywords in integration_keywords.items():
-            if any(keyword in text for keyword in partner_keywords):
-                results["bonus_integration"]["observable"] = True
-                integrated_partners.add(partner)
-                evidence["bonus_integration"].append(
-                    f"{timestamp} Integration with {partner}: {text}"
-                )
+    # Get the shared, pre-warmed transcriber; chunks are transcribed one at
+    # a time with its in-process model as they are consumed
+    with tracer.span("model_load"):
+        whisper_transcriber = model_registry.get_whisper(WHISPER_MODEL_SIZE)
+    segments = []
+    with closing(whisper_transcriber.iter_transcribe(media_path, chunk_size=PROGRESSIVE_CHUNK_SECONDS)) as chunks:
+        for chunk in chunks:
+            segments.extend(chunk['segments'])
+            yield chunk['segments'], chunk['progress']
     
-    # If no A2A focus is found, add warning feedback
-    if not has_a2a_focus:
-        for category in ["innovation_and_creativity", "functioning_prototype", "technical_complexity", "business_utility"]:
-            results[category]["feedback"].append(
-                "WARNING: No clear focus on A2A (Agent-to-Agent) transactions detected"
-            )
-    else:
-        # Add A2A evidence as positive feedback
-        results["functioning_prototype"]["feedback"].extend([
-            "A2A transaction focus detected:",
-            *[evidence for evidence in a2a_evidence[:2]]  # Show first 2 pieces of evidence
-        ])
+    artifact_cache.put(media_hash, 'transcript', {
+        'segments': segments,
+        'text': ' '.join(segment['text'] for segment in segments).strip()
+    }, **params)
+
+def get_scores(segments, media_hash):
+    """Score a transcript, reusing cached scores for the same transcript and rubric."""
+    return artifact_cache.get_or_compute(
+        media_hash, 'scores', lambda: analyze_presentation(segments),
+        rubric=RUBRIC_FINGERPRINT,
+        **transcript_params(progressive=False)
+    )
+
+def format_segment(segment):
+    """Format a transcript segment with its time range."""
+    start_time = int(segment['start'])
+    end_time = int(segment['end'])
+    return f"[{start_time:02d}:{(start_time%60):02d} - {end_time:02d}:{(end_time%60):02d}] {segment['text']}"
+
+def render_scores(results):
+    """Display scores with progress bars, feedback and totals."""
+    col1, col2 = st.columns(2)
     
-    # Score only categories with sufficient evidence
-    for category, data in results.items():
-        if data["observable"]:
-            # Base score on amount and quality of evidence
-            if category == "bonus_integration":
-                # Score based on number of partners integrated
-                data["score"] = len(integrated_partners)
-                if data["score"] == 0:
-                    data["feedback"] = ["No clear integration with event partners detected"]
-                else:
-                    data["feedback"].append(f"Integrated with {len(integrated_partners)} partners: {', '.join(integrated_partners)}")
-            else:
-                evidence_count = len(evidence[category])
-                if evidence_count > 0:
-                    # Score out of 5 points
-                    base_score = min(5, evidence_count)
-                    
-                    # For categories requiring A2A focus, only give full score if A2A is demonstrated
-                    if category in ["innovation_and_creativity", "functioning_prototype", "technical_complexity", "business_utility"]:
-                        if not has_a2a_focus:
-                            base_score = 0  # No points if no A2A focus
-                            data["feedback"].append("Score: 0 - Project does not demonstrate A2A transactions")
-                        else:
-                            data["feedback"].append(f"Score: {base_score} - Shows A2A transaction focus")
-                    
-                    data["score"] = base_score
-                    
-                    # Add detailed feedback with timestamps
-                    data["feedback"].extend([
-                        f"Evidence found: {e}" for e in evidence[category][:3]  # Show top 3 pieces of evidence
-                    ])
+    with col1:
+        st.write("📊 Scores:")
+        for category, data in results.items():
+            if category not in ["total_score", "categories_scored"]:
+                st.write(f"{category.replace('_', ' ').title()}")
+                if data["score"] is not None:
+                    st.progress(data["score"] / 5)
+                    st.write(f"Score: {data['score']}/5")
                 else:
-                    data["feedback"].append("Insufficient evidence for scoring")
-        else:
-            data["feedback"].append("No observable evidence in video")
-    
-    # Calculate total score from validated categories only
-    validated_scores = [
-        data["score"] for data in results.values() 
-        if data["score"] is not None
-    ]
+                    st.write("Score: N/A")
+                st.write("")
     
-    if validated_scores:
-        results["total_score"] = sum(validated_scores)
-        results["categories_scored"] = len(validated_scores)
-    else:
-        results["total_score"] = 0
-        results["categories_scored"] = 0
+    with col2:
+        st.write("💡 Feedback:")
+        for category, data in results.items():
+            if category not in ["total_score", "categories_scored"]:
+                if data["feedback"]:
+                    st.write(f"{category.replace('_', ' ').title()}:")
+                    for feedback in data["feedback"][:3]:  # Show top 3 feedback items
+                        st.write(f"- {feedback}")
+                    st.write("")
     
-    return results
+    st.write(f"Total Score: {results['total_score']}")
+    st.write(f"Categories Scored: {results['categories_scored']}")
 
-def process_audio(audio_file):
-    """Process audio file for transcription and analysis."""
-    # Create a temporary file to store the uploaded audio
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
-        tmp_file.write(audio_file.getvalue())
-        audio_path = tmp_file.name
+def render_timings(tracer):
+    """Display the per-stage timing breakdown of an analysis."""
+    timings = tracer.to_dict()
+    with st.expander(f"⏱️ Timing breakdown ({timings['wall_seconds']:.1f}s)"):
+        st.table(flatten_spans(timings))
+        st.caption(
+            "Thread CPU is the stage's own thread; process CPU covers every thread of the app, "
+            "including other sessions. Peak RSS is the highest process RSS sampled during the stage."
+        )
 
+def process_media(media_path, media_hash=None, progressive=True, tracer=None):
+    """
+    Transcribe and score a media file where it already sits on disk.
+    
+    Args:
+        media_path: Path to the video or audio file
+        media_hash: Digest of the file's bytes, hashed from the file if omitted
+        progressive: Whether to show transcript segments and scores chunk by
+            chunk as they are transcribed instead of all at the end
+        tracer: Optional Tracer that earlier stages (download, upload) were
+            recorded on
+    """
+    tracer = tracer or Tracer()
     try:
+        if media_hash is None:
+            with tracer.span("hash"):
+                media_hash = artifact_cache.hash_media(media_path)
+        
+        if progressive:
+            process_media_progressively(media_path, media_hash, tracer)
+            return
+        
         with st.spinner('Analyzing presentation...'):
-            # Initialize transcriber
-            whisper_transcriber = WhisperTranscriber()
-            
-            # Transcribe audio
-            audio_results = whisper_transcriber.transcribe_audio(audio_path)
+            # Transcribe audio, reusing the transcript of identical media
+            with tracer.span("transcript"):
+                audio_results = get_transcript(media_path, media_hash, tracer)
             
             # Display timestamped segments
             st.subheader("⏱️ Presentation Transcript")
             segments = audio_results.get('segments', [])
             for segment in segments:
-                start_time = int(segment['start'])
-                end_time = int(segment['end'])
-                st.write(f"[{start_time:02d}:{(start_time%60):02d} - {end_time:02d}:{(end_time%60):02d}] {segment['text']}")
+                st.write(format_segment(segment))
             
             # Analyze presentation and display results
             st.subheader("🎯 Hackathon Judge Results")
-            results = analyze_presentation(segments)
-            
-            # Display scores with progress bars
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("📊 Scores:")
-                for category, data in results.items():
-                    if category not in ["total_score", "categories_scored"]:
-                        st.write(f"{category.replace('_', ' ').title()}")
-                        if data["score"] is not None:
-                            st.progress(data["score"] / 5)
-                            st.write(f"Score: {data['score']}/5")
-                        else:
-                            st.write("Score: N/A")
-                        st.write("")
-            
-            with col2:
-                st.write("💡 Feedback:")
-                for category, data in results.items():
-                    if category not in ["total_score", "categories_scored"]:
-                        if data["feedback"]:
-                            st.write(f"{category.replace('_', ' ').title()}:")
-                            for feedback in data["feedback"][:3]:  # Show top 3 feedback items
-                                st.write(f"- {feedback}")
-                            st.write("")
-            
-            st.write(f"Total Score: {results['total_score']}")
-            st.write(f"Categories Scored: {results['categories_scored']}")
+            with tracer.span("scoring"):
+                results = get_scores(segments, media_hash)
+            render_scores(results)
 
     except Exception as e:
         st.error(f"An error occurred: {str(e)}")
     finally:
-        # Clean up temporary file
-        os.unlink(audio_path)
+        render_timings(tracer)
 
-def process_video(video_file):
-    """Process video file for transcription and analysis."""
-    # Create a temporary file to store the uploaded video
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-        tmp_file.write(video_file.getvalue())
-        video_path = tmp_file.name
-
-    try:
-        with st.spinner('Analyzing presentation...'):
-            # Initialize transcriber
-            whisper_transcriber = WhisperTranscriber()
-            
-            # Transcribe audio
-            audio_results = whisper_transcriber.transcribe_audio(video_path)
-            
-            # Display timestamped segments
-            st.subheader("⏱️ Presentation Transcript")
-            segments = audio_results.get('segments', [])
-            for segment in segments:
-                start_time = int(segment['start'])
-                end_time = int(segment['end'])
-                st.write(f"[{start_time:02d}:{(start_time%60):02d} - {end_time:02d}:{(end_time%60):02d}] {segment['text']}")
-            
-            # Analyze presentation and display results
-            st.subheader("🎯 Hackathon Judge Results")
-            results = analyze_presentation(segments)
-            
-            # Display scores with progress bars
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("📊 Scores:")
-                for category, data in results.items():
-                    if category not in ["total_score", "categories_scored"]:
-                        st.write(f"{category.replace('_', ' ').title()}")
-                        if data["score"] is not None:
-                            st.progress(data["score"] / 5)
-                            st.write(f"Score: {data['score']}/5")
-                        else:
-                            st.write("Score: N/A")
-                        st.write("")
+def process_media_progressively(media_path, media_hash, tracer):
+    """Append transcript segments and refresh scores as each chunk completes."""
+    progress_bar = st.progress(0.0, text="Transcribing...")
+    st.subheader("⏱️ Presentation Transcript")
+    transcript_container = st.container()
+    st.subheader("🎯 Hackathon Judge Results")
+    scores_placeholder = st.empty()
+    
+    scorer = PresentationScorer()
+    # A Streamlit rerun interrupts this loop with an exception; closing the
+    # generator then stops transcribing the remaining chunks
+    with closing(iter_transcript(media_path, media_hash, tracer)) as chunks:
+        while True:
+            # Time each chunk from the consumer's side so rendering is not
+            # counted as transcription
+            with tracer.span("transcribe", aggregate=True):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            new_segments, progress = chunk
             
-            with col2:
-                st.write("💡 Feedback:")
-                for category, data in results.items():
-                    if category not in ["total_score", "categories_scored"]:
-                        if data["feedback"]:
-                            st.write(f"{category.replace('_', ' ').title()}:")
-                            for feedback in data["feedback"][:3]:  # Show top 3 feedback items
-                                st.write(f"- {feedback}")
-                            st.write("")
+            # Fold only the new segments into the running scores
+            with tracer.span("scoring", aggregate=True):
+                scorer.add_segments(new_segments)
+                results = scorer.snapshot()
             
-            st.write(f"Total Score: {results['total_score']}")
-            st.write(f"Categories Scored: {results['categories_scored']}")
+            with tracer.span("render", aggregate=True):
+                for segment in new_segments:
+                    transcript_container.write(format_segment(segment))
+                with scores_placeholder.container():
+                    render_scores(results)
+                progress_bar.progress(progress, text=f"Transcribing... {progress:.0%}")
+    
+    progress_bar.empty()
+    if not scorer.segment_count:
+        st.warning("No speech detected in audio")
+        return
+    
+    # Cache the final scores alongside the transcript
+    artifact_cache.put(
+        media_hash, 'scores', scorer.snapshot(),
+        rubric=RUBRIC_FINGERPRINT,
+        **transcript_params(progressive=True)
+    )
 
-    except Exception as e:
-        st.error(f"An error occurred: {str(e)}")
+def process_audio(audio_path, media_hash=None, progressive=True, tracer=None):
+    """Process an audio file on disk for transcription and analysis."""
+    process_media(audio_path, media_hash, progressive, tracer)
+
+def process_video(video_path, media_hash=None, progressive=True, tracer=None):
+    """Process a video file on disk for transcription and analysis."""
+    process_media(video_path, media_hash, progressive, tracer)
+
+def process_upload(uploaded_file, process, progressive=True):
+    """
+    Spill an in-memory upload to disk once and process it by path.
+    
+    The upload's buffer is written and hashed without copying it into a new
+    bytes object; the file is removed once processing finishes.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile
+        process: process_audio or process_video
+        progressive: Whether to show results chunk by chunk
+    """
+    tracer = Tracer()
+    suffix = Path(uploaded_file.name).suffix.lower()
+    with uploaded_file.getbuffer() as buffer:
+        with tracer.span("hash"):
+            media_hash = artifact_cache.hash_bytes(buffer)
+        with tracer.span("temp_file_write"), tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+            tmp_file.write(buffer)
+            media_path = tmp_file.name
+    
+    try:
+        process(media_path, media_hash, progressive, tracer)
     finally:
         # Clean up temporary file
-        os.unlink(video_path)
+        os.unlink(media_path)
 
 def is_youtube_url(url):
     """Check if the URL is a valid YouTube URL."""
@@ -344,55 +300,31 @@ def is_youtube_url(url):
     match = re.match(youtube_regex, url)
     return bool(match)
 
-def download_youtube_video(url):
-    """Download YouTube video and return the path to the temporary file."""
+def download_youtube_video(url, audio_only=True):
+    """
+    Download YouTube media into the download cache.
+    
+    Only the audio track is fetched unless visual analysis needs the full
+    video; repeat submissions of the same video reuse the cached file.
+    
+    Returns:
+        Path to the cached media file, or None if the download failed
+    """
     try:
-        with st.spinner('Downloading YouTube video...'):
-            # Create a temporary directory
-            temp_dir = tempfile.mkdtemp()
-            output_path = os.path.join(temp_dir, 'video.mp4')
-            
-            # Configure yt-dlp options
-            ydl_opts = {
-                'format': 'best[ext=mp4]/best',  # Best quality MP4
-                'outtmpl': output_path,
-                'quiet': True,
-                'no_warnings': True,
-            }
-            
-            # Download the video
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-            
-            # Check if file exists and has content
-            if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
-                raise Exception("Failed to download video")
-            
-            # Create final temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
-            final_path = temp_file.name
-            temp_file.close()
-            
-            # Copy the file to its final location
-            import shutil
-            shutil.copy2(output_path, final_path)
-            
-            # Clean up temporary directory
-            shutil.rmtree(temp_dir)
-            
-            return final_path
-            
+        with st.spinner('Downloading YouTube audio...' if audio_only else 'Downloading YouTube video...'):
+            return str(youtube_downloader.download(url, audio_only=audio_only))
     except Exception as e:
         st.error(f"Error downloading YouTube video: {str(e)}")
-        if 'temp_dir' in locals() and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-        if 'final_path' in locals() and os.path.exists(final_path):
-            os.unlink(final_path)
         return None
 
 # File uploader section
 st.write("Upload your hackathon presentation recording or provide a YouTube URL:")
 input_type = st.radio("Select input type:", ["Video File", "Audio File", "YouTube URL"])
+progressive = st.checkbox(
+    "Show results as they are transcribed",
+    value=True,
+    help="Transcribe in chunks and update the transcript and scores as each chunk completes"
+)
 
 if input_type == "Video File":
     uploaded_file = st.file_uploader("Upload video", type=['mp4', 'avi', 'mov', 'mkv'])
@@ -402,7 +334,7 @@ if input_type == "Video File":
         
         # Process button
         if st.button("Analyze Video"):
-            process_video(uploaded_file)
+            process_upload(uploaded_file, process_video, progressive)
 
 elif input_type == "Audio File":
     uploaded_file = st.file_uploader("Upload audio", type=['mp3', 'wav', 'm4a', 'ogg'])
@@ -412,7 +344,7 @@ elif input_type == "Audio File":
         
         # Process button
         if st.button("Analyze Audio"):
-            process_audio(uploaded_file)
+            process_upload(uploaded_file, process_audio, progressive)
 
 else:  # YouTube URL
     youtube_url = st.text_input("Enter YouTube URL")
@@ -423,22 +355,12 @@ else:  # YouTube URL
             
             # Process button
             if st.button("Analyze YouTube Video"):
-                video_path = download_youtube_video(youtube_url)
-                if video_path:
-                    try:
-                        # Create a file-like object that properly implements getvalue
-                        class VideoFile:
-                            def __init__(self, video_bytes):
-                                self._bytes = video_bytes
-                            
-                            def getvalue(self):
-                                return self._bytes
-                        
-                        with open(video_path, 'rb') as f:
-                            video_bytes = f.read()
-                        video_file = VideoFile(video_bytes)
-                        process_video(video_file)
-                    finally:
-                        os.unlink(video_path)
+                # Judging only transcribes, so fetch just the audio track
+                tracer = Tracer()
+                with tracer.span("download"):
+                    audio_path = download_youtube_video(youtube_url, audio_only=True)
+                if audio_path:
+                    # Analyze the cached download in place
+                    process_audio(audio_path, progressive=progressive, tracer=tracer)
         else:
             st.error("Please enter a valid YouTube URL")
@@ -1,7 +1,11 @@
 from crewai import Agent
 from ..tools.video_tools.clip_analyzer import CLIPAnalyzer
 from ..tools.video_tools.frame_extractor import FrameExtractor
-from typing import Dict, List
+from ..tools.video_tools.frame_pipeline import FramePipeline
+from ..tools.integration_tools.artifact_cache import ArtifactCache
+from ..config.settings import settings
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -10,9 +14,17 @@ logger = logging.getLogger(__name__)
 class VideoAnalysisAgent:
     """Agent responsible for video analysis tasks."""
     
-    def __init__(self):
+    def __init__(self, artifact_cache: Optional[ArtifactCache] = None):
         self.clip_analyzer = CLIPAnalyzer()
-        self.frame_extractor = FrameExtractor()
+        self.frame_extractor = FrameExtractor(workers=settings.FRAME_EXTRACTION_WORKERS)
+        self.frame_pipeline = FramePipeline(
+            self.frame_extractor,
+            self.clip_analyzer,
+            batch_size=max(1, min(settings.BATCH_SIZE, settings.MAX_FRAME_CACHE)),
+            queue_size=settings.PIPELINE_QUEUE_SIZE,
+            flush_timeout=settings.PIPELINE_FLUSH_TIMEOUT
+        )
+        self.artifact_cache = artifact_cache
         
     def create_agent(self) -> Agent:
         """
@@ -49,23 +61,19 @@ class VideoAnalysisAgent:
         logger.info(f"Starting video content analysis for {video_path}")
         
         try:
-            # Extract frames
-            frames, timestamps = self.frame_extractor.extract_keyframes(video_path)
-            logger.info(f"Extracted {len(frames)} keyframes")
-            
-            # Get video metadata
-            metadata = self.frame_extractor.get_video_metadata(video_path)
-            
-            # Analyze frames
-            frame_analyses = self.clip_analyzer.batch_analyze_frames(frames)
+            if self.artifact_cache is not None:
+                timestamps, metadata, frame_analyses, pipeline_stats = self._cached_extract_and_analyze(video_path)
+            else:
+                timestamps, metadata, frame_analyses, _, pipeline_stats = self._extract_and_analyze(video_path)
             
             # Combine results
             results = {
                 'metadata': metadata,
-                'frame_count': len(frames),
+                'frame_count': len(timestamps),
                 'timestamps': timestamps,
                 'frame_analyses': frame_analyses,
-                'summary': self._generate_video_summary(frame_analyses)
+                'summary': self._generate_video_summary(frame_analyses),
+                'pipeline_stats': pipeline_stats  # None when served from the cache
             }
             
             return results
@@ -74,6 +82,57 @@ class VideoAnalysisAgent:
             logger.error(f"Error analyzing video content: {str(e)}")
             raise
     
+    def _extract_and_analyze(
+        self,
+        video_path: str
+    ) -> Tuple[List[float], Dict, List[Dict], np.ndarray, Dict]:
+        """
+        Pipeline keyframes into CLIP and return timestamps, metadata,
+        analyses, embeddings and per-stage pipeline statistics.
+        """
+        # Decoding and CLIP overlap through a bounded queue, so at most
+        # PIPELINE_QUEUE_SIZE preprocessed frames plus one batch are held
+        metadata = {}
+        timestamps, frame_analyses, pipeline_stats = self.frame_pipeline.run(video_path, metadata=metadata)
+        logger.info(f"Extracted and analyzed {len(timestamps)} keyframes")
+        
+        embeddings = np.array([analysis['embeddings'] for analysis in frame_analyses], dtype=np.float32)
+        return timestamps, metadata, frame_analyses, embeddings, pipeline_stats
+    
+    def _cached_extract_and_analyze(
+        self,
+        video_path: str
+    ) -> Tuple[List[float], Dict, List[Dict], Optional[Dict]]:
+        """
+        Reuse cached keyframe timestamps and CLIP embeddings when available.
+        
+        On a hit nothing is decoded or encoded; classifications are
+        recomputed from the cached embeddings, which is only a matrix
+        multiply against the cached text embeddings.
+        """
+        media_hash = self.artifact_cache.hash_media(video_path)
+        keyframe_params = {
+            'sampling_rate': self.frame_extractor.sampling_rate,
+            'scene_metric': self.frame_extractor.scene_detector.metric,
+            'scene_threshold': self.frame_extractor.scene_detector.threshold
+        }
+        embedding_params = {'model': self.clip_analyzer.model_name, 'engine': self.clip_analyzer.engine, **keyframe_params}
+        
+        keyframes = self.artifact_cache.get(media_hash, 'keyframes', **keyframe_params)
+        embeddings = self.artifact_cache.get(media_hash, 'clip_embeddings', **embedding_params)
+        if keyframes is not None and embeddings is not None:
+            frame_analyses = self.clip_analyzer.analyze_embeddings(embeddings)
+            return keyframes['timestamps'], keyframes['metadata'], frame_analyses, None
+        
+        timestamps, metadata, frame_analyses, embeddings, pipeline_stats = self._extract_and_analyze(video_path)
+        self.artifact_cache.put(
+            media_hash, 'keyframes',
+            {'timestamps': timestamps, 'metadata': metadata},
+            **keyframe_params
+        )
+        self.artifact_cache.put(media_hash, 'clip_embeddings', embeddings, **embedding_params)
+        return timestamps, metadata, frame_analyses, pipeline_stats
+    
     def extract_keyframes(
         self,
         video_path: str,
@@ -90,13 +149,13 @@ class VideoAnalysisAgent:
             Dictionary containing extracted frames and metadata
         """
         try:
+            metadata = {}
             frames, timestamps = self.frame_extractor.extract_keyframes(
                 video_path,
-                max_frames=max_frames
+                max_frames=max_frames,
+                metadata=metadata
             )
             
-            metadata = self.frame_extractor.get_video_metadata(video_path)
-            
             return {
                 'frames': frames,
                 'timestamps': timestamps,
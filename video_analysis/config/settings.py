@@ -9,17 +9,27 @@ class Settings(BaseSettings):
     
     # Model Settings
     CLIP_MODEL_NAME: str = "openai/clip-vit-base-patch32"
+    CLIP_ENGINE: str = "fp32"  # "fp32", or "int8" for dynamic quantization on CPU
     WHISPER_MODEL_SIZE: str = "base"
+    WHISPER_ENGINE: str = "fp32"  # "fp32", or "int8" for dynamic quantization on CPU
     IMAGEBIND_MODEL_TYPE: str = "facebook/imagebind-huge"
     
     # Video Processing Settings
     FRAME_SAMPLING_RATE: int = 1  # frames per second
     MAX_FRAME_CACHE: int = 1000   # maximum number of frames to keep in memory
+    FRAME_EXTRACTION_WORKERS: int = 1  # processes decoding keyframe time ranges; 1 is sequential
     BATCH_SIZE: int = 32
+    PIPELINE_QUEUE_SIZE: int = 64  # preprocessed frames buffered between decode and CLIP
+    PIPELINE_FLUSH_TIMEOUT: float = 0.5  # seconds before a partial CLIP batch is flushed
     
     # Audio Processing Settings
     AUDIO_SAMPLE_RATE: int = 16000
     AUDIO_CHUNK_LENGTH: int = 30  # seconds
+    AUDIO_CHUNK_OVERLAP: int = 2  # seconds shared by consecutive chunks
+    
+    # Artifact Cache Settings
+    ARTIFACT_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # 2 GB
+    DOWNLOAD_CACHE_MAX_BYTES: int = 5 * 1024 ** 3  # 5 GB of downloaded YouTube media
     
     # Vector Store Settings
     VECTOR_DIMENSION: int = 512
@@ -0,0 +1,265 @@
+import sys
+from pathlib import Path
+import argparse
+import json
+import logging
+
+import cv2
+import numpy as np
+
+# Add parent directory to path to import our modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tools.video_tools.scene_detector import SceneDetector
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+METRICS = tuple(SceneDetector.DEFAULT_THRESHOLDS)
+# Also calibrated, to show why they have no default threshold
+CALIBRATED_METRICS = METRICS + SceneDetector.UNCALIBRATED_METRICS
+BASELINE_THRESHOLD = 30.0  # Threshold of the original full-frame detector
+
+def baseline_is_scene_change(prev_frame: np.ndarray, curr_frame: np.ndarray) -> bool:
+    """The original detector: full-resolution uint8 MSE, including its wrap-around."""
+    prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
+    curr_gray = cv2.cvtColor(curr_frame, cv2.COLOR_BGR2GRAY)
+    mse = np.mean((prev_gray - curr_gray) ** 2)
+    return mse > BASELINE_THRESHOLD
+
+# ---------------------------------------------------------------------------
+# Labeled synthetic presentation footage
+# ---------------------------------------------------------------------------
+
+def render_slide(rng: np.random.Generator, size, background, accent) -> np.ndarray:
+    """Render a slide: title bar, bullet lines of 'text' and sometimes a chart."""
+    width, height = size
+    frame = np.full((height, width, 3), background, dtype=np.uint8)
+    cv2.rectangle(frame, (0, 0), (width, height // 8), accent, -1)
+    words = ["agent", "payments", "demo", "latency", "API", "users", "model", "A2A", "results", "ledger"]
+    cv2.putText(frame, " ".join(rng.choice(words, 3)), (width // 20, height // 12),
+                cv2.FONT_HERSHEY_SIMPLEX, width / 900, (255, 255, 255), 2)
+    ink = (20, 20, 20) if np.mean(background) > 128 else (235, 235, 235)
+    for line in range(rng.integers(3, 7)):
+        y = height // 4 + line * height // 10
+        cv2.putText(frame, "- " + " ".join(rng.choice(words, rng.integers(3, 7))), (width // 12, y),
+                    cv2.FONT_HERSHEY_SIMPLEX, width / 1400, ink, 2)
+    if rng.random() < 0.5:
+        # Bar chart on the right
+        for bar in range(5):
+            bar_height = int(rng.uniform(0.1, 0.45) * height)
+            x = int(width * 0.62) + bar * width // 20
+            cv2.rectangle(frame, (x, int(height * 0.85) - bar_height), (x + width // 30, int(height * 0.85)), accent, -1)
+    return frame
+
+def render_camera(rng: np.random.Generator, size) -> np.ndarray:
+    """Render a talking-head shot: smooth background with a head-and-shoulders blob."""
+    width, height = size
+    gradient = np.linspace(60, 140, width, dtype=np.float32)[None, :, None]
+    frame = np.broadcast_to(gradient + rng.uniform(-20, 20, 3), (height, width, 3)).astype(np.uint8).copy()
+    center = (int(width * rng.uniform(0.4, 0.6)), int(height * 0.45))
+    cv2.ellipse(frame, center, (width // 10, height // 5), 0, 0, 360, (120, 150, 200), -1)
+    cv2.ellipse(frame, (center[0], height), (width // 4, height // 3), 0, 180, 360, (60, 50, 40), -1)
+    return frame
+
+def perturb(rng: np.random.Generator, frame: np.ndarray, moving: bool) -> np.ndarray:
+    """Apply same-scene changes: small motion, cursor, lighting drift, sensor noise and JPEG compression."""
+    height, width = frame.shape[:2]
+    out = frame
+    if moving:
+        shift = np.float32([[1, 0, rng.integers(-4, 5)], [0, 1, rng.integers(-3, 4)]])
+        out = cv2.warpAffine(out, shift, (width, height), borderMode=cv2.BORDER_REPLICATE)
+    else:
+        out = out.copy()
+        x, y = rng.integers(0, width - 20), rng.integers(0, height - 20)
+        cv2.circle(out, (int(x), int(y)), 6, (0, 0, 255), -1)  # Pointer
+    out = out.astype(np.float32) + rng.uniform(-4, 4) + rng.normal(0, 2.5 if moving else 1.0, out.shape)
+    out = np.clip(out, 0, 255).astype(np.uint8)
+    _, encoded = cv2.imencode(".jpg", out, [cv2.IMWRITE_JPEG_QUALITY, int(rng.integers(55, 90))])
+    return cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+
+def synthetic_pairs(count: int, size, seed: int = 0):
+    """
+    Generate labeled pairs of frames sampled one interval apart.
+
+    Scene changes are slide advances within a deck (same template, new
+    text), switches between decks and cuts between camera and slides.
+    Same-scene pairs differ only by motion, pointer, lighting, noise and
+    compression.
+
+    Returns:
+        List of (previous frame, current frame, is_scene_change, kind)
+    """
+    rng = np.random.default_rng(seed)
+    backgrounds = [(250, 250, 250), (245, 240, 230), (40, 30, 30), (90, 60, 20)]
+    accents = [(180, 90, 30), (40, 40, 200), (60, 160, 60), (150, 60, 150)]
+    pairs = []
+
+    def new_scene(kind):
+        if kind == "camera":
+            return render_camera(rng, size)
+        deck = rng.integers(len(backgrounds)) if kind == "new_deck" else new_scene.deck
+        new_scene.deck = deck
+        return render_slide(rng, size, backgrounds[deck], accents[deck])
+    new_scene.deck = 0
+
+    for _ in range(count):
+        kind = rng.choice(["same_slide", "same_camera", "next_slide", "new_deck", "cut_to_camera", "cut_to_slides"])
+        if kind == "same_slide":
+            base = new_scene("slide")
+            pairs.append((perturb(rng, base, False), perturb(rng, base, False), False, kind))
+        elif kind == "same_camera":
+            base = new_scene("camera")
+            pairs.append((perturb(rng, base, True), perturb(rng, base, True), False, kind))
+        elif kind == "next_slide":
+            first = new_scene("slide")
+            pairs.append((perturb(rng, first, False), perturb(rng, new_scene("slide"), False), True, kind))
+        elif kind == "new_deck":
+            first = new_scene("slide")
+            pairs.append((perturb(rng, first, False), perturb(rng, new_scene("new_deck"), False), True, kind))
+        elif kind == "cut_to_camera":
+            first = new_scene("slide")
+            pairs.append((perturb(rng, first, False), perturb(rng, new_scene("camera"), True), True, kind))
+        else:
+            first = new_scene("camera")
+            pairs.append((perturb(rng, first, True), perturb(rng, new_scene("new_deck"), False), True, kind))
+    return pairs
+
+# ---------------------------------------------------------------------------
+# Calibration
+# ---------------------------------------------------------------------------
+
+def pair_distances(pairs, metric: str) -> np.ndarray:
+    """Distance of every pair under one metric."""
+    # The threshold does not affect distances; uncalibrated metrics require one
+    detector = SceneDetector(metric=metric, threshold=SceneDetector.DEFAULT_THRESHOLDS.get(metric, 0.0))
+    return np.array([
+        detector.distance(detector.signature(prev), detector.signature(curr))
+        for prev, curr, _, _ in pairs
+    ])
+
+def best_threshold(distances: np.ndarray, labels: np.ndarray) -> dict:
+    """
+    Pick the threshold with the fewest errors, centred in the widest gap.
+
+    Returns:
+        Dictionary with the threshold, its errors and the gap between the
+        largest same-scene and smallest scene-change distance
+    """
+    candidates = np.unique(distances)
+    midpoints = np.concatenate([[candidates[0] - 1], (candidates[:-1] + candidates[1:]) / 2, [candidates[-1] + 1]])
+    errors = np.array([np.count_nonzero((distances > t) != labels) for t in midpoints])
+    best = midpoints[errors == errors.min()]
+    return {
+        # Centre of the error-free (or least-error) range
+        'threshold': float((best.min() + best.max()) / 2),
+        'errors': int(errors.min()),
+        'same_scene_max': float(distances[~labels].max()),
+        'scene_change_min': float(distances[labels].min())
+    }
+
+def evaluate(decisions: np.ndarray, labels: np.ndarray) -> dict:
+    """Count detected scene changes and misses/false alarms against the labels."""
+    return {
+        'scene_changes': int(decisions.sum()),
+        'missed': int(np.count_nonzero(labels & ~decisions)),
+        'false_alarms': int(np.count_nonzero(~labels & decisions))
+    }
+
+def calibrate(pairs) -> dict:
+    """Calibrate every metric on labeled pairs and compare with the baseline detector."""
+    labels = np.array([is_change for _, _, is_change, _ in pairs])
+    baseline = np.array([baseline_is_scene_change(prev, curr) for prev, curr, _, _ in pairs])
+    report = {
+        'pairs': len(pairs),
+        'true_scene_changes': int(labels.sum()),
+        'baseline': evaluate(baseline, labels),
+        'metrics': {}
+    }
+    for metric in CALIBRATED_METRICS:
+        distances = pair_distances(pairs, metric)
+        default = SceneDetector.DEFAULT_THRESHOLDS.get(metric)
+        report['metrics'][metric] = {
+            'default_threshold': default,
+            'at_default': evaluate(distances > default, labels) if default is not None else None,
+            'calibrated': best_threshold(distances, labels)
+        }
+    return report
+
+def count_video_scene_changes(video_path: Path, sampling_rate: float) -> dict:
+    """Count scene changes of an unlabeled video for the baseline and every metric at its default."""
+    cap = cv2.VideoCapture(str(video_path))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30
+    step = max(1, int(round(fps * sampling_rate)))
+    detectors = {metric: SceneDetector(metric=metric) for metric in METRICS}
+    counts = {'baseline': 0, **{metric: 0 for metric in METRICS}}
+    previous_frame = None
+    previous_signatures = {}
+    index = 0
+
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        if index % step == 0:
+            signatures = {metric: detector.signature(frame) for metric, detector in detectors.items()}
+            if previous_frame is not None:
+                counts['baseline'] += bool(baseline_is_scene_change(previous_frame, frame))
+                for metric, detector in detectors.items():
+                    counts[metric] += detector.is_scene_change(previous_signatures[metric], signatures[metric])
+            previous_frame, previous_signatures = frame, signatures
+        index += 1
+    cap.release()
+    return counts
+
+def main():
+    """Calibrate scene-change thresholds and compare keyframe counts with the original detector."""
+    parser = argparse.ArgumentParser(description="Calibrate SceneDetector thresholds")
+    parser.add_argument('videos', nargs='*', type=Path, help="Optional real videos to count scene changes on")
+    parser.add_argument('--pairs', type=int, default=600, help="Labeled synthetic frame pairs")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the synthetic pairs")
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--sampling-rate', type=float, default=1.0, help="Seconds between sampled frames")
+    parser.add_argument('--output', type=Path, help="Optional JSON report path")
+    args = parser.parse_args()
+
+    pairs = synthetic_pairs(args.pairs, (args.width, args.height), args.seed)
+    report = calibrate(pairs)
+
+    logger.info(f"\n=== Scene detector calibration ({report['pairs']} pairs, {report['true_scene_changes']} scene changes) ===")
+    baseline = report['baseline']
+    logger.info(
+        f"{'baseline (full-frame uint8 MSE > 30)':<38} detected {baseline['scene_changes']:>4}, "
+        f"missed {baseline['missed']:>4}, false alarms {baseline['false_alarms']:>4}"
+    )
+    for metric, result in report['metrics'].items():
+        at_default = result['at_default']
+        calibrated = result['calibrated']
+        if at_default is None:
+            summary = f"{metric + ' (no default)':<38} "
+        else:
+            summary = (
+                f"{metric + ' > ' + str(result['default_threshold']):<38} detected {at_default['scene_changes']:>4}, "
+                f"missed {at_default['missed']:>4}, false alarms {at_default['false_alarms']:>4}; "
+            )
+        logger.info(
+            summary +
+            f"same-scene max {calibrated['same_scene_max']:.2f}, scene-change min {calibrated['scene_change_min']:.2f}, "
+            f"calibrated threshold {calibrated['threshold']:.2f} ({calibrated['errors']} errors)"
+        )
+
+    if args.videos:
+        report['videos'] = {}
+        for video_path in args.videos:
+            counts = count_video_scene_changes(video_path, args.sampling_rate)
+            report['videos'][str(video_path)] = counts
+            logger.info(f"{video_path.name}: " + ", ".join(f"{name} {count}" for name, count in counts.items()))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import sys
+from pathlib import Path
+import argparse
+import io
+import json
+import logging
+import time
+
+import numpy as np
+import torch
+
+# Add parent directory to path to import our modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tools.video_tools.frame_extractor import FrameExtractor
+from tools.video_tools.clip_analyzer import CLIPAnalyzer, CLIP_ENGINES
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def model_size_mb(model: torch.nn.Module) -> float:
+    """Get the serialized size of a model's weights in MB."""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+def benchmark(analyzer: CLIPAnalyzer, frames, repeats: int = 3):
+    """Run batched analysis and return (results, embeddings, best frames/s)."""
+    analyzer.warm_up()
+    best = 0.0
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        results = analyzer.batch_analyze_frames(frames)
+        best = max(best, len(frames) / (time.perf_counter() - start_time))
+    embeddings = np.stack([
+        analyzer.get_frame_embedding(frame) for frame in frames
+    ])
+    return results, embeddings, best
+
+def compare_engines(frames, reference: CLIPAnalyzer, candidate: CLIPAnalyzer) -> dict:
+    """
+    Compare a candidate CLIP engine against the fp32 reference.
+
+    Args:
+        frames: Frames to analyze
+        reference: Full-precision analyzer
+        candidate: Analyzer using the engine under test
+
+    Returns:
+        Dictionary with top-1/top-3 category agreement, embedding cosine
+        similarity, throughput and model size for both engines
+    """
+    reference_results, reference_embeddings, reference_fps = benchmark(reference, frames)
+    candidate_results, candidate_embeddings, candidate_fps = benchmark(candidate, frames)
+
+    top1 = np.mean([
+        r['top_categories'][0] == c['top_categories'][0]
+        for r, c in zip(reference_results, candidate_results)
+    ])
+    top3_exact = np.mean([
+        set(r['top_categories']) == set(c['top_categories'])
+        for r, c in zip(reference_results, candidate_results)
+    ])
+    top3_overlap = np.mean([
+        len(set(r['top_categories']) & set(c['top_categories'])) / 3
+        for r, c in zip(reference_results, candidate_results)
+    ])
+
+    # Raw embeddings, so this also checks the unnormalized get_frame_embedding path
+    reference_unit = reference_embeddings / np.linalg.norm(reference_embeddings, axis=1, keepdims=True)
+    candidate_unit = candidate_embeddings / np.linalg.norm(candidate_embeddings, axis=1, keepdims=True)
+    cosine = np.sum(reference_unit * candidate_unit, axis=1)
+
+    return {
+        'frames': len(frames),
+        'engines': {
+            reference.engine: {'frames_per_second': reference_fps, 'model_mb': model_size_mb(reference.model)},
+            candidate.engine: {'frames_per_second': candidate_fps, 'model_mb': model_size_mb(candidate.model)}
+        },
+        'speedup': candidate_fps / reference_fps,
+        'top1_agreement': float(top1),
+        'top3_set_agreement': float(top3_exact),
+        'top3_overlap': float(top3_overlap),
+        'cosine_similarity': {
+            'mean': float(cosine.mean()),
+            'min': float(cosine.min())
+        }
+    }
+
+def synthetic_frames(count: int, size: int = 224):
+    """Generate simple frames with shapes and gradients when no video is given."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(count):
+        frame = np.tile(np.linspace(0, 255, size, dtype=np.uint8)[:, None, None], (1, size, 3))
+        frame = np.roll(frame, i * 7, axis=0)
+        x, y = rng.integers(0, size - 64, size=2)
+        frame[y:y + 64, x:x + 64] = rng.integers(0, 255, size=3, dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+def main():
+    """Report accuracy versus speed of a quantized CLIP engine against fp32."""
+    parser = argparse.ArgumentParser(description="Compare CLIP inference engines")
+    parser.add_argument('--video', type=Path, help="Video to sample frames from (synthetic frames if omitted)")
+    parser.add_argument('--frames', type=int, default=64, help="Maximum frames to compare")
+    parser.add_argument('--engine', default="int8", choices=[e for e in CLIP_ENGINES if e != "fp32"])
+    parser.add_argument('--output', type=Path, help="Optional JSON report path")
+    args = parser.parse_args()
+
+    if args.video:
+        frames, _ = FrameExtractor().extract_keyframes(str(args.video), max_frames=args.frames)
+    else:
+        frames = synthetic_frames(args.frames)
+    logger.info(f"Comparing engines on {len(frames)} frames")
+
+    report = compare_engines(frames, CLIPAnalyzer(engine="fp32"), CLIPAnalyzer(engine=args.engine))
+
+    logger.info("\n=== CLIP engine report ===")
+    for engine, stats in report['engines'].items():
+        logger.info(f"{engine}: {stats['frames_per_second']:.1f} frames/s, {stats['model_mb']:.0f} MB")
+    logger.info(f"Speedup: {report['speedup']:.2f}x")
+    logger.info(f"Top-1 agreement: {report['top1_agreement']:.1%}")
+    logger.info(f"Top-3 set agreement: {report['top3_set_agreement']:.1%} (mean overlap {report['top3_overlap']:.1%})")
+    logger.info(
+        f"Embedding cosine similarity: mean {report['cosine_similarity']['mean']:.4f}, "
+        f"min {report['cosine_similarity']['min']:.4f}"
+    )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,11 @@ import json
 # Add parent directory to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-from tools.video_tools.frame_extractor import FrameExtractor
 from tools.video_tools.clip_analyzer import CLIPAnalyzer
 from tools.audio_tools.whisper_transcriber import WhisperTranscriber
+from tools.audio_tools.audio_buffer import AudioBuffer
 from tools.integration_tools.vector_store import VectorStore
+from tools.integration_tools.artifact_cache import ArtifactCache
 from agents.video_agent import VideoAnalysisAgent
 
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +21,8 @@ class VideoContentSearch:
     """Search for specific content within videos."""
     
     def __init__(self):
-        self.video_agent = VideoAnalysisAgent()
+        self.artifact_cache = ArtifactCache()
+        self.video_agent = VideoAnalysisAgent(artifact_cache=self.artifact_cache)
         self.transcriber = WhisperTranscriber()
         self.vector_store = VectorStore()
         self.clip_analyzer = CLIPAnalyzer()
@@ -51,43 +53,39 @@ class VideoContentSearch:
         timestamps = frame_data['timestamps']
         
         # 2. Analyze frames with custom categories
-        frame_analyses = []
-        frame_embeddings = []
+        frame_analyses = self.clip_analyzer.batch_analyze_frames(
+            frames,
+            custom_categories=search_categories
+        )
+        frame_embeddings = [analysis['embeddings'] for analysis in frame_analyses]
         
-        for frame in frames:
-            analysis = self.clip_analyzer.analyze_frame(
-                frame,
-                custom_categories=search_categories
-            )
-            frame_analyses.append(analysis)
-            frame_embeddings.append(analysis['embeddings'])
-        
-        # 3. Transcribe audio
-        transcription = self.transcriber.transcribe_audio(video_path)
-        
-        # 4. Store results if requested
-        if store_results:
-            # Store frame embeddings
-            self.vector_store.add_frame_embeddings(
-                video_id=video_id,
-                embeddings=frame_embeddings,
-                timestamps=timestamps,
-                metadata=[
-                    {
-                        'frame_index': i,
-                        'categories': analysis['top_categories']
-                    }
-                    for i, analysis in enumerate(frame_analyses)
-                ]
-            )
+        # 3. Decode the audio track once for transcription and features
+        with self._load_audio(video_path) as audio:
+            transcription = self.transcriber.transcribe_audio(audio)
             
-            # Extract and store audio features
-            audio_features = self.transcriber.get_audio_features(video_path)
-            self.vector_store.add_audio_embeddings(
-                video_id=video_id,
-                embeddings=[audio_features.flatten()],
-                segments=transcription['segments']
-            )
+            # 4. Store results if requested
+            if store_results:
+                # Store frame embeddings
+                self.vector_store.add_frame_embeddings(
+                    video_id=video_id,
+                    embeddings=frame_embeddings,
+                    timestamps=timestamps,
+                    metadata=[
+                        {
+                            'frame_index': i,
+                            'categories': analysis['top_categories']
+                        }
+                        for i, analysis in enumerate(frame_analyses)
+                    ]
+                )
+                
+                # Extract and store audio features
+                audio_features = self.transcriber.get_audio_features(audio)
+                self.vector_store.add_audio_embeddings(
+                    video_id=video_id,
+                    embeddings=[audio_features.flatten()],
+                    segments=transcription['segments']
+                )
         
         # 5. Compile results
         return {
@@ -102,6 +100,17 @@ class VideoContentSearch:
             )
         }
     
+    def _load_audio(self, video_path: str) -> AudioBuffer:
+        """Decode the audio track, reusing decoded samples of identical media."""
+        media_hash = self.artifact_cache.hash_media(video_path)
+        samples = self.artifact_cache.get(media_hash, 'audio', sample_rate=16000)
+        if samples is not None:
+            return AudioBuffer(samples, source=video_path)
+        
+        audio = AudioBuffer.from_file(video_path)
+        self.artifact_cache.put(media_hash, 'audio', audio.samples, sample_rate=16000)
+        return audio
+    
     def _generate_content_summary(
         self,
         frame_analyses: List[Dict],
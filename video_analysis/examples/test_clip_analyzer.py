@@ -1,6 +1,13 @@
 import sys
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 import logging
+import cv2
+import torch
 
 # Add parent directory to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent))
@@ -9,6 +16,7 @@ from tools.video_tools.frame_extractor import FrameExtractor
 from tools.video_tools.clip_analyzer import CLIPAnalyzer
 from tools.audio_tools.whisper_transcriber import WhisperTranscriber
 from config.settings import settings
+from utils.tracing import Tracer, flatten_spans
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -136,16 +144,121 @@ def generate_hackathon_judging_analysis(video_categories, transcription):
     
     return analysis
 
-def analyze_video_content(video_path: Path, progress_callback=None):
-    """Analyze both video and audio content of a video file."""
+def default_thread_budgets():
+    """
+    Split the machine's cores between the audio and visual branches.
+    
+    Returns:
+        Tuple of (audio worker processes, torch threads per audio worker,
+        visual threads)
+    """
+    cpu_count = os.cpu_count() or 1
+    audio_workers = max(1, cpu_count // 4)
+    audio_threads = max(1, (cpu_count // 2) // audio_workers)
+    visual_threads = max(1, cpu_count - audio_workers * audio_threads)
+    return audio_workers, audio_threads, visual_threads
+
+def analyze_frames(video_path: Path, clip_analyzer, tracer, on_progress):
+    """Stream keyframes into batched CLIP analysis (the visual branch)."""
+    frame_extractor = FrameExtractor()
+    video_categories = []
+    timestamps = []
+    batch = []
+    metadata = {}
+    
+    def flush():
+        with tracer.span("clip", aggregate=True):
+            video_categories.extend(clip_analyzer.batch_analyze_frames(batch))
+        batch.clear()
+        if metadata.get('duration'):
+            on_progress(min(1.0, timestamps[-1] / metadata['duration']))
+    
+    keyframes = frame_extractor.iter_keyframes(str(video_path), metadata=metadata)
+    while True:
+        with tracer.span("frame_decode", aggregate=True):
+            keyframe = next(keyframes, None)
+        if keyframe is None:
+            break
+        timestamp, frame = keyframe
+        timestamps.append(timestamp)
+        batch.append(frame)
+        if len(batch) >= settings.BATCH_SIZE:
+            flush()
+    if batch:
+        flush()
+    
+    on_progress(1.0)
+    return video_categories, timestamps
+
+def transcribe(video_path: Path, whisper_transcriber, workers: int, threads: int, tracer, on_progress):
+    """Transcribe audio chunk by chunk in worker processes (the audio branch)."""
+    segments = []
+    chunks = whisper_transcriber.iter_transcribe(str(video_path), workers=workers, threads=threads)
+    while True:
+        # Includes audio decoding and worker start-up on the first chunk
+        with tracer.span("whisper_chunk", aggregate=True):
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        segments.extend(chunk['segments'])
+        on_progress(chunk['progress'])
+    
+    return {
+        'segments': segments,
+        'text': ' '.join(segment['text'] for segment in segments).strip()
+    }
+
+def analyze_video_content(
+    video_path: Path,
+    progress_callback=None,
+    audio_workers: Optional[int] = None,
+    audio_threads: Optional[int] = None,
+    visual_threads: Optional[int] = None
+):
+    """
+    Analyze both video and audio content of a video file.
+    
+    The Whisper branch and the frame extraction/CLIP branch are independent,
+    so they run concurrently: the visual branch on a thread of this process
+    with visual_threads torch/OpenCV threads, the audio branch in
+    audio_workers processes with audio_threads torch threads each. Latency
+    approaches that of the slower branch instead of the sum of both.
+    
+    Per-stage timings (wall time, CPU time and peak RSS) are returned under
+    results["timings"] as a span tree from Tracer.to_dict.
+    
+    Args:
+        video_path: Path to the video file
+        progress_callback: Optional callable(message, percentage); called
+            from both branches with their combined progress
+        audio_workers: Whisper worker processes (defaults to a quarter of the cores)
+        audio_threads: Torch threads per Whisper worker
+        visual_threads: Torch and OpenCV threads for decoding and CLIP
+    """
     if progress_callback:
         progress_callback("Starting analysis...", 0)
     logger.info("Starting comprehensive video analysis")
+    tracer = Tracer()
     
-    # Initialize components
-    frame_extractor = FrameExtractor()
-    clip_analyzer = CLIPAnalyzer()
-    whisper_transcriber = WhisperTranscriber()
+    default_audio_workers, default_audio_threads, default_visual_threads = default_thread_budgets()
+    audio_workers = audio_workers or default_audio_workers
+    audio_threads = audio_threads or default_audio_threads
+    visual_threads = visual_threads or default_visual_threads
+    logger.info(
+        f"Thread budgets: audio {audio_workers} workers x {audio_threads} threads, "
+        f"visual {visual_threads} threads"
+    )
+    
+    # Whisper runs in its worker processes, so the threads of this process
+    # belong to the visual branch
+    torch.set_num_threads(visual_threads)
+    cv2.setNumThreads(visual_threads)
+    
+    # Initialize components; the transcriber's model is loaded lazily, so
+    # only the pool workers below load Whisper
+    with tracer.span("model_load"):
+        clip_analyzer = CLIPAnalyzer()
+        whisper_transcriber = WhisperTranscriber()
     
     results = {
         "video_categories": [],
@@ -153,83 +266,109 @@ def analyze_video_content(video_path: Path, progress_callback=None):
         "transcription": None,
         "summary": None,
         "hackathon_analysis": None,
-        "human_readable_summary": None
+        "human_readable_summary": None,
+        "timings": None
     }
     
-    # Extract and analyze frames (30% of progress)
-    if progress_callback:
-        progress_callback("Extracting video frames...", 5)
-    logger.info(f"Extracting frames from {video_path}")
-    frames, timestamps = frame_extractor.extract_keyframes(str(video_path))
+    # Both branches share 5-70% of the progress, reported as their average
+    branch_progress = {"visual": 0.0, "audio": 0.0}
+    progress_lock = threading.Lock()
+    
+    def report(branch, fraction):
+        with progress_lock:
+            branch_progress[branch] = fraction
+            overall = int(5 + 65 * sum(branch_progress.values()) / 2)
+            message = (
+                f"Analyzing frames ({branch_progress['visual']:.0%}) "
+                f"and audio ({branch_progress['audio']:.0%})..."
+            )
+            if progress_callback:
+                progress_callback(message, overall)
+    
+    def timed(branch, func, *args):
+        # Branch threads have no open span, so each branch span attaches to the root
+        start_time = time.perf_counter()
+        try:
+            with tracer.span(f"{branch}_branch"):
+                return func(*args, tracer, lambda fraction: report(branch, fraction))
+        finally:
+            logger.info(f"{branch.title()} branch finished in {time.perf_counter() - start_time:.1f}s")
     
     if progress_callback:
-        progress_callback("Analyzing frames with CLIP...", 30)
-    logger.info("Analyzing frames with CLIP")
-    total_frames = len(frames)
-    for i, (frame, timestamp) in enumerate(zip(frames, timestamps)):
-        categories = clip_analyzer.analyze_frame(frame)
-        results["video_categories"].append(categories)
-        results["timestamps"].append(timestamp)
-        if progress_callback and total_frames > 0:
-            frame_progress = int(30 + (i / total_frames * 20))  # 30-50% progress during frame analysis
-            progress_callback(f"Analyzing frame {i+1} of {total_frames}...", frame_progress)
-    
-    # Transcribe audio (20% of progress)
-    if progress_callback:
-        progress_callback("Processing audio...", 50)
-    logger.info("Transcribing audio")
+        progress_callback("Extracting frames and transcribing audio...", 5)
+    logger.info(f"Analyzing frames and audio of {video_path} concurrently")
+    start_time = time.perf_counter()
+    
     try:
-        transcription = whisper_transcriber.transcribe_audio(str(video_path))
-        if not transcription or not transcription.get('text'):
-            raise ValueError("No transcription result returned")
-        results["transcription"] = transcription
-    except Exception as e:
-        error_msg = f"Audio transcription failed: {str(e)}"
-        logger.warning(error_msg)
-        # Continue with analysis but mark audio as unavailable
-        results["transcription"] = {
-            "text": "[Audio transcription unavailable]",
-            "segments": []
-        }
-        if progress_callback:
-            progress_callback("Audio transcription failed - continuing with video analysis only", 60)
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="branch") as executor:
+            visual_future = executor.submit(timed, "visual", analyze_frames, video_path, clip_analyzer)
+            audio_future = executor.submit(
+                timed, "audio", transcribe, video_path, whisper_transcriber, audio_workers, audio_threads
+            )
+            
+            try:
+                transcription = audio_future.result()
+                if not transcription or not transcription.get('text'):
+                    raise ValueError("No transcription result returned")
+                results["transcription"] = transcription
+            except Exception as e:
+                error_msg = f"Audio transcription failed: {str(e)}"
+                logger.warning(error_msg)
+                # Continue with analysis but mark audio as unavailable
+                results["transcription"] = {
+                    "text": "[Audio transcription unavailable]",
+                    "segments": []
+                }
+                if progress_callback:
+                    progress_callback("Audio transcription failed - continuing with video analysis only", 60)
+            
+            results["video_categories"], results["timestamps"] = visual_future.result()
+    finally:
+        # Stop the worker processes even if a branch failed
+        with tracer.span("worker_shutdown"):
+            whisper_transcriber.close()
+    logger.info(f"Audio and visual branches finished in {time.perf_counter() - start_time:.1f}s")
     
     # Generate summary (10% of progress)
     if progress_callback:
         progress_callback("Generating summary...", 70)
     
-    unique_categories = set()
-    for cats in results["video_categories"]:
-        unique_categories.update(cats)
-    
-    summary = {
-        "total_frames_analyzed": len(frames),
-        "video_duration": timestamps[-1] if timestamps else 0,
-        "main_visual_elements": list(unique_categories),
-        "audio_transcription": results["transcription"].get("text", ""),
-        "segments": results["transcription"].get("segments", [])
-    }
-    
-    results["summary"] = summary
+    with tracer.span("summary"):
+        unique_categories = set()
+        for cats in results["video_categories"]:
+            unique_categories.update(cats)
+        
+        summary = {
+            "total_frames_analyzed": len(results["video_categories"]),
+            "video_duration": results["timestamps"][-1] if results["timestamps"] else 0,
+            "main_visual_elements": list(unique_categories),
+            "audio_transcription": results["transcription"].get("text", ""),
+            "segments": results["transcription"].get("segments", [])
+        }
+        
+        results["summary"] = summary
     
     # Generate human-readable summary (10% of progress)
     if progress_callback:
         progress_callback("Generating human-readable summary...", 80)
     
-    results["human_readable_summary"] = generate_human_readable_summary(
-        results["video_categories"],
-        results["transcription"],
-        results["summary"]
-    )
+    with tracer.span("human_readable_summary"):
+        results["human_readable_summary"] = generate_human_readable_summary(
+            results["video_categories"],
+            results["transcription"],
+            results["summary"]
+        )
     
     # Generate hackathon analysis (10% of progress)
     if progress_callback:
         progress_callback("Generating hackathon analysis...", 90)
-    results["hackathon_analysis"] = generate_hackathon_judging_analysis(
-        results["video_categories"],
-        results["transcription"]
-    )
+    with tracer.span("hackathon_analysis"):
+        results["hackathon_analysis"] = generate_hackathon_judging_analysis(
+            results["video_categories"],
+            results["transcription"]
+        )
     
+    results["timings"] = tracer.to_dict()
     if progress_callback:
         progress_callback("Analysis complete!", 100)
     
@@ -269,6 +408,15 @@ def main():
     # Print hackathon judging analysis
     logger.info("\n" + results['hackathon_analysis'])
     
+    # Print per-stage timings
+    logger.info("\n=== Timing Breakdown ===")
+    for row in flatten_spans(results['timings']):
+        logger.info(
+            f"{row['stage']:<40} {row['wall_s']:>8.2f}s wall {row['process_cpu_s']:>8.2f}s process cpu "
+            f"{row['peak_rss_mb'] or 0:>8.0f} MB peak {row['share']:>5}"
+        )
+    logger.info(f"Whisper worker processes: {results['timings']['child_process_cpu_seconds']:.2f}s cpu")
+    
     logger.info("\nAnalysis completed!")
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 import logging
+import time
 
 # Add parent directory to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent))
@@ -26,12 +27,43 @@ def main():
     
     # Extract frames
     logger.info(f"Extracting frames from {video_path}")
-    frames, timestamps = frame_extractor.extract_keyframes(str(video_path))
+    metadata = {}
+    frames, timestamps = frame_extractor.extract_keyframes(str(video_path), metadata=metadata)
     
     logger.info(f"Extracted {len(frames)} frames")
     for i, (frame, ts) in enumerate(zip(frames, timestamps)):
         logger.info(f"Frame {i}: shape={frame.shape}, timestamp={ts:.2f}s")
     
+    # Compare decode speed of each sampling mode against full decoding
+    logger.info("Comparing sampling modes")
+    for mode in FrameExtractor.SAMPLING_MODES:
+        extractor = FrameExtractor(sampling_mode=mode)
+        start_time = time.perf_counter()
+        _, mode_timestamps = extractor.extract_keyframes(str(video_path))
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"{mode}: {elapsed:.3f}s "
+            f"({metadata['frame_count'] / elapsed:.1f} source frames/s), "
+            f"timestamps match: {mode_timestamps == timestamps}"
+        )
+    
+    # Compare time-range parallel extraction against sequential extraction
+    logger.info("Comparing sequential and parallel extraction")
+    for workers in (1, 2, 4):
+        extractor = FrameExtractor(workers=workers)
+        start_time = time.perf_counter()
+        worker_frames, worker_timestamps = extractor.extract_keyframes(str(video_path))
+        elapsed = time.perf_counter() - start_time
+        frames_match = len(worker_frames) == len(frames) and all(
+            (a == b).all() for a, b in zip(worker_frames, frames)
+        )
+        logger.info(
+            f"{workers} worker(s): {elapsed:.3f}s "
+            f"({metadata['frame_count'] / elapsed:.1f} source frames/s), "
+            f"{len(worker_frames)} frames, timestamps match: {worker_timestamps == timestamps}, "
+            f"frames match: {frames_match}"
+        )
+    
     logger.info("Test completed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+import sys
+from pathlib import Path
+import argparse
+import json
+import logging
+import time
+
+import torch
+
+# Add parent directory to path to import our modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tools.audio_tools.whisper_transcriber import WhisperTranscriber, WHISPER_ENGINES
+from tools.audio_tools.audio_buffer import AudioBuffer
+from utils.text_metrics import word_error_rate
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {'.wav', '.mp3', '.m4a', '.ogg', '.flac', '.mp4', '.webm'}
+
+def load_test_set(test_dir: Path):
+    """
+    Load a local test set: media files with optional same-named .txt references.
+
+    Returns:
+        List of (name, AudioBuffer, reference text or None)
+    """
+    items = []
+    for path in sorted(test_dir.iterdir()):
+        if path.suffix.lower() not in AUDIO_EXTENSIONS:
+            continue
+        reference_path = path.with_suffix('.txt')
+        reference = reference_path.read_text().strip() if reference_path.exists() else None
+        items.append((path.name, AudioBuffer.from_file(str(path)), reference))
+    return items
+
+def run_engine(model_size: str, engine: str, test_set) -> dict:
+    """Transcribe the test set with one model size and engine, timing each file."""
+    transcriber = WhisperTranscriber(model_size, engine=engine)
+    transcriber.warm_up()
+
+    transcripts = {}
+    audio_seconds = 0.0
+    compute_seconds = 0.0
+    for name, audio, _ in test_set:
+        start_time = time.perf_counter()
+        try:
+            transcripts[name] = transcriber.transcribe_audio(audio)['text']
+        except ValueError:
+            transcripts[name] = ""  # No speech detected
+        compute_seconds += time.perf_counter() - start_time
+        audio_seconds += audio.duration
+
+    return {
+        'transcripts': transcripts,
+        'audio_seconds': audio_seconds,
+        'compute_seconds': compute_seconds,
+        # Real-time factor: processing time per second of audio (lower is faster)
+        'rtf': compute_seconds / audio_seconds if audio_seconds else 0.0
+    }
+
+def compare(model_size: str, test_set, engine: str) -> dict:
+    """
+    Compare a quantized engine against fp32 for one model size.
+
+    WER is measured against the .txt references where they exist; the
+    candidate is also scored against the fp32 transcript, which isolates
+    the error introduced by quantization.
+    """
+    runs = {name: run_engine(model_size, name, test_set) for name in ("fp32", engine)}
+
+    report = {'model_size': model_size, 'files': len(test_set)}
+    for name, run in runs.items():
+        report[name] = {
+            'rtf': run['rtf'],
+            'audio_seconds': run['audio_seconds'],
+            'compute_seconds': run['compute_seconds']
+        }
+
+    references = [(item_name, reference) for item_name, _, reference in test_set if reference]
+    if references:
+        for name, run in runs.items():
+            report[name]['wer'] = sum(
+                word_error_rate(reference, run['transcripts'][item_name])
+                for item_name, reference in references
+            ) / len(references)
+        report['wer_delta'] = report[engine]['wer'] - report['fp32']['wer']
+
+    report['wer_vs_fp32'] = sum(
+        word_error_rate(runs['fp32']['transcripts'][item_name], runs[engine]['transcripts'][item_name])
+        for item_name, _, _ in test_set
+    ) / max(1, len(test_set))
+    report['speedup'] = runs['fp32']['rtf'] / runs[engine]['rtf'] if runs[engine]['rtf'] else 0.0
+    return report
+
+def main():
+    """Report WER deltas and real-time factors of quantized Whisper per model size."""
+    parser = argparse.ArgumentParser(description="Compare Whisper inference engines")
+    parser.add_argument('test_set', type=Path, help="Directory of audio files with optional .txt references")
+    parser.add_argument('--models', nargs='+', default=["tiny", "base"], help="Whisper model sizes")
+    parser.add_argument('--engine', default="int8", choices=[e for e in WHISPER_ENGINES if e != "fp32"])
+    parser.add_argument('--threads', type=int, help="Torch threads (defaults to all cores)")
+    parser.add_argument('--output', type=Path, help="Optional JSON report path")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    test_set = load_test_set(args.test_set)
+    if not test_set:
+        logger.error(f"No audio files found in {args.test_set}")
+        return
+    logger.info(
+        f"Loaded {len(test_set)} files ({sum(audio.duration for _, audio, _ in test_set):.0f}s of audio), "
+        f"{sum(reference is not None for _, _, reference in test_set)} with references"
+    )
+
+    reports = [compare(model_size, test_set, args.engine) for model_size in args.models]
+
+    logger.info("\n=== Whisper engine report ===")
+    logger.info(f"{'Model':<8} {'RTF fp32':>9} {'RTF ' + args.engine:>9} {'Speedup':>8} {'WER delta':>10} {'WER vs fp32':>12}")
+    for report in reports:
+        wer_delta = f"{report['wer_delta']:+.2%}" if 'wer_delta' in report else "n/a"
+        logger.info(
+            f"{report['model_size']:<8} {report['fp32']['rtf']:>9.3f} {report[args.engine]['rtf']:>9.3f} "
+            f"{report['speedup']:>7.2f}x {wer_delta:>10} {report['wer_vs_fp32']:>12.2%}"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+from ..tools.video_tools.clip_analyzer import CLIPAnalyzer
+from ..tools.audio_tools.whisper_transcriber import WhisperTranscriber
+from config.settings import settings
+from typing import Dict, Optional, Tuple
+import threading
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ModelRegistry:
+    """Process-wide store of loaded, warmed-up models shared by every caller."""
+
+    def __init__(self):
+        self._models: Dict[Tuple[str, str], object] = {}
+        # Serializes loading, which can take minutes
+        self._lock = threading.Lock()
+        # Guards _models itself, so status() never waits on a load
+        self._models_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._warm_up_thread: Optional[threading.Thread] = None
+        self._warm_up_error: Optional[str] = None
+
+    def get_whisper(self, model_size: str = "base", engine: Optional[str] = None) -> WhisperTranscriber:
+        """
+        Get the shared Whisper transcriber, loading it on first use.
+
+        Args:
+            model_size: Whisper model size
+            engine: Optional inference engine, "fp32" or "int8" (defaults to
+                the configured engine)
+
+        Returns:
+            Shared WhisperTranscriber instance
+        """
+        # Key on the resolved engine so the default and an explicit engine
+        # share one instance
+        engine = engine or settings.WHISPER_ENGINE
+        return self._get_or_load(
+            ("whisper", f"{model_size}:{engine}"),
+            lambda: WhisperTranscriber(model_size, engine=engine)
+        )
+
+    def get_clip(self, model_name: Optional[str] = None, engine: Optional[str] = None) -> CLIPAnalyzer:
+        """
+        Get the shared CLIP analyzer, loading it on first use.
+
+        Args:
+            model_name: Optional CLIP model name (defaults to the configured model)
+            engine: Optional inference engine, "fp32" or "int8" (defaults to
+                the configured engine)
+
+        Returns:
+            Shared CLIPAnalyzer instance
+        """
+        # Key on the resolved name and engine so defaults and explicit values
+        # share one instance
+        model_name = model_name or settings.CLIP_MODEL_NAME
+        engine = engine or settings.CLIP_ENGINE
+        return self._get_or_load(
+            ("clip", f"{model_name}:{engine}"),
+            lambda: CLIPAnalyzer(model_name=model_name, engine=engine)
+        )
+
+    def _get_or_load(self, key: Tuple[str, str], loader) -> object:
+        """Return a cached model, or load and warm it up exactly once."""
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                logger.info(f"Loading {key[0]} model ({key[1]}) into registry")
+                model = loader()
+                model.warm_up()
+                with self._models_lock:
+                    self._models[key] = model
+        return model
+
+    def warm_up(self, load_whisper: bool = True, load_clip: bool = True) -> None:
+        """
+        Load and warm up the default models, then mark the registry ready.
+
+        Args:
+            load_whisper: Whether to preload the Whisper transcriber
+            load_clip: Whether to preload the CLIP analyzer
+        """
+        try:
+            if load_whisper:
+                self.get_whisper()
+            if load_clip:
+                self.get_clip()
+            self._ready.set()
+            logger.info("Model registry ready")
+        except Exception as e:
+            self._warm_up_error = str(e)
+            logger.error(f"Error warming up models: {str(e)}")
+            raise
+
+    def start_warm_up(self, load_whisper: bool = True, load_clip: bool = True) -> threading.Thread:
+        """
+        Warm up the default models in a background thread.
+
+        Safe to call repeatedly; only the first call starts a thread.
+
+        Returns:
+            The warm-up thread
+        """
+        with self._lock:
+            if self._warm_up_thread is None:
+                def run():
+                    try:
+                        self.warm_up(load_whisper, load_clip)
+                    except Exception:
+                        pass  # Already logged and exposed through status()
+
+                self._warm_up_thread = threading.Thread(
+                    target=run,
+                    name="model-registry-warm-up",
+                    daemon=True
+                )
+                self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def is_ready(self) -> bool:
+        """Check whether the default models are loaded and warmed up."""
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the default models are ready.
+
+        Args:
+            timeout: Optional maximum wait in seconds
+
+        Returns:
+            Boolean indicating if the registry became ready in time
+        """
+        return self._ready.wait(timeout)
+
+    def status(self) -> Dict:
+        """Get a readiness summary suitable for health checks."""
+        with self._models_lock:
+            keys = list(self._models)
+        return {
+            'ready': self.is_ready(),
+            'loaded_models': [f"{kind}:{name}" for kind, name in keys],
+            'error': self._warm_up_error
+        }
+
+# Shared registry for the whole process
+model_registry = ModelRegistry()
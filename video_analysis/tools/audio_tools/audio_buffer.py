@@ -0,0 +1,136 @@
+import numpy as np
+from pathlib import Path
+from typing import Optional
+import subprocess
+import tempfile
+import logging
+import os
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STDERR_TAIL_BYTES = 4096  # ffmpeg output kept in decode errors
+
+class AudioBuffer:
+    """Mono float32 audio decoded once and shared by every audio consumer."""
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int = 16000,
+        source: Optional[str] = None,
+        backing_file: Optional[str] = None
+    ):
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.source = source
+        self._backing_file = backing_file
+
+    @classmethod
+    def from_file(
+        cls,
+        media_path: str,
+        sample_rate: int = 16000,
+        mmap_threshold: float = 600,
+        read_size: int = 1 << 20
+    ) -> "AudioBuffer":
+        """
+        Decode the audio track of a media file once with ffmpeg.
+
+        Short tracks are kept in memory. Once the decoded audio exceeds
+        mmap_threshold seconds it is spilled to a temporary file and exposed
+        as a memory map, so long recordings do not sit in RAM.
+
+        Args:
+            media_path: Path to an audio or video file
+            sample_rate: Target sample rate (Whisper expects 16 kHz)
+            mmap_threshold: Seconds of audio above which a memory map is used
+            read_size: Bytes read from ffmpeg per iteration
+
+        Returns:
+            AudioBuffer with the decoded samples
+        """
+        if not Path(media_path).exists():
+            raise FileNotFoundError(f"Audio file not found: {media_path}")
+
+        cmd = [
+            "ffmpeg", "-nostdin", "-threads", "0", "-i", str(media_path),
+            "-f", "f32le", "-ac", "1", "-acodec", "pcm_f32le", "-ar", str(sample_rate),
+            "-loglevel", "error", "-"
+        ]
+        threshold_bytes = int(mmap_threshold * sample_rate) * 4
+        chunks = []
+        buffered = 0
+        spill = None
+
+        # ffmpeg's messages go to a file: a stderr pipe nobody reads while
+        # stdout is drained blocks ffmpeg once its pipe buffer fills
+        stderr_file = tempfile.TemporaryFile()
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            while True:
+                data = process.stdout.read(read_size)
+                if not data:
+                    break
+                if spill is None and buffered + len(data) > threshold_bytes:
+                    spill = tempfile.NamedTemporaryFile(delete=False, suffix='.f32')
+                    for chunk in chunks:
+                        spill.write(chunk)
+                    chunks = []
+                if spill is not None:
+                    spill.write(data)
+                else:
+                    chunks.append(data)
+                buffered += len(data)
+
+            if process.wait() != 0:
+                # The end of the log holds the error; keep the message short
+                stderr_file.seek(max(0, stderr_file.seek(0, os.SEEK_END) - STDERR_TAIL_BYTES))
+                stderr = stderr_file.read().decode(errors='replace')
+                raise RuntimeError(f"Failed to decode audio: {stderr}")
+        except Exception:
+            process.kill()
+            process.wait()
+            if spill is not None:
+                spill.close()
+                os.unlink(spill.name)
+            raise
+        finally:
+            process.stdout.close()
+            stderr_file.close()
+
+        if spill is None:
+            samples = np.frombuffer(b"".join(chunks), dtype=np.float32).copy()
+            backing_file = None
+        else:
+            spill.close()
+            backing_file = spill.name
+            # Copy-on-write keeps the array writable for torch without touching the file
+            samples = np.memmap(backing_file, dtype=np.float32, mode='c')
+
+        logger.info(
+            f"Decoded {len(samples) / sample_rate:.1f}s of audio from {Path(media_path).name}"
+            + (" (memory-mapped)" if backing_file else "")
+        )
+        return cls(samples, sample_rate, source=str(media_path), backing_file=backing_file)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return len(self.samples) / self.sample_rate
+
+    def close(self) -> None:
+        """Release the samples and delete the backing file, if any."""
+        self.samples = np.zeros(0, dtype=np.float32)
+        if self._backing_file is not None:
+            try:
+                os.unlink(self._backing_file)
+            except FileNotFoundError:
+                pass
+            self._backing_file = None
+
+    def __enter__(self) -> "AudioBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
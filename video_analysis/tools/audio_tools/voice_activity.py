@@ -0,0 +1,185 @@
+import numpy as np
+from typing import Dict, List, Tuple
+import bisect
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class VoiceActivityDetector:
+    """Finds speech regions in a waveform using energy and spectral cues."""
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_duration: float = 0.03,
+        energy_margin_db: float = 10.0,
+        min_energy_db: float = -50.0,
+        max_noise_floor_db: float = -40.0,
+        speech_band_ratio: float = 0.5,
+        min_speech: float = 0.25,
+        min_silence: float = 0.5,
+        padding: float = 0.2
+    ):
+        self.sample_rate = sample_rate
+        self.frame_length = int(frame_duration * sample_rate)
+        self.energy_margin_db = energy_margin_db  # dB above the noise floor
+        self.min_energy_db = min_energy_db  # absolute floor in dBFS
+        # Cap on the estimated noise floor, so audio with no quiet frames
+        # (continuous or close-miked speech) cannot push the threshold above
+        # the speech itself
+        self.max_noise_floor_db = max_noise_floor_db
+        self.speech_band_ratio = speech_band_ratio  # share of energy in 300-3400 Hz
+        self.min_speech = min_speech
+        self.min_silence = min_silence
+        self.padding = padding
+
+    def detect(self, audio: np.ndarray) -> List[Tuple[float, float]]:
+        """
+        Detect speech regions.
+
+        A frame counts as speech when its energy is clearly above the
+        estimated noise floor and most of its energy lies in the speech
+        band. Gaps shorter than min_silence are bridged, regions shorter
+        than min_speech are dropped and the rest are padded.
+
+        Args:
+            audio: Mono float waveform at sample_rate
+
+        Returns:
+            List of (start, end) times in seconds, sorted and non-overlapping
+        """
+        frame_count = len(audio) // self.frame_length
+        if frame_count == 0:
+            return []
+
+        frames = audio[:frame_count * self.frame_length].reshape(frame_count, self.frame_length)
+        energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+
+        spectrum = np.abs(np.fft.rfft(frames * np.hanning(self.frame_length), axis=1)) ** 2
+        freqs = np.fft.rfftfreq(self.frame_length, 1 / self.sample_rate)
+        in_band = (freqs >= 300) & (freqs <= 3400)
+        band_ratio = spectrum[:, in_band].sum(axis=1) / (spectrum.sum(axis=1) + 1e-10)
+
+        noise_floor = min(np.percentile(energy_db, 10), self.max_noise_floor_db)
+        threshold = max(self.min_energy_db, noise_floor + self.energy_margin_db)
+        is_speech = (energy_db > threshold) & (band_ratio > self.speech_band_ratio)
+
+        # Convert runs of speech frames into regions
+        edges = np.diff(np.concatenate([[0], is_speech.astype(np.int8), [0]]))
+        frame_duration = self.frame_length / self.sample_rate
+        regions = [
+            [start * frame_duration, end * frame_duration]
+            for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1))
+        ]
+
+        regions = self._merge(regions, self.min_silence)
+        regions = [region for region in regions if region[1] - region[0] >= self.min_speech]
+
+        duration = len(audio) / self.sample_rate
+        padded = [
+            [max(0.0, start - self.padding), min(duration, end + self.padding)]
+            for start, end in regions
+        ]
+        return [(float(start), float(end)) for start, end in self._merge(padded, 0.0)]
+
+    def compact(
+        self,
+        audio: np.ndarray,
+        regions: List[Tuple[float, float]]
+    ) -> Tuple[np.ndarray, List[Tuple[float, float, float]]]:
+        """
+        Concatenate the speech regions into one shorter waveform.
+
+        Args:
+            audio: Mono float waveform at sample_rate
+            regions: Speech regions from detect()
+
+        Returns:
+            Tuple containing:
+            - Compacted waveform
+            - List of (compact_start, original_start, duration) per region,
+              used to map timestamps back with remap_segments()
+        """
+        pieces = []
+        offsets = []
+        compact_start = 0.0
+
+        for start, end in regions:
+            piece = audio[int(start * self.sample_rate):int(end * self.sample_rate)]
+            duration = len(piece) / self.sample_rate
+            pieces.append(piece)
+            offsets.append((compact_start, start, duration))
+            compact_start += duration
+
+        if not pieces:
+            return np.zeros(0, dtype=audio.dtype), offsets
+        return np.concatenate(pieces), offsets
+
+    def remap_segments(
+        self,
+        segments: List[Dict],
+        offsets: List[Tuple[float, float, float]]
+    ) -> List[Dict]:
+        """
+        Map segment timestamps from the compacted timeline to the original one.
+
+        Args:
+            segments: Segments with 'start'/'end' on the compacted timeline
+            offsets: Region offsets returned by compact()
+
+        Returns:
+            Segments with 'start'/'end' on the original timeline
+        """
+        starts = [compact_start for compact_start, _, _ in offsets]
+        remapped = []
+
+        for segment in segments:
+            remapped.append({
+                **segment,
+                'start': self._remap_time(segment['start'], offsets, starts, is_end=False),
+                'end': self._remap_time(segment['end'], offsets, starts, is_end=True)
+            })
+
+        return remapped
+
+    def has_signal(self, audio: np.ndarray) -> bool:
+        """Check whether the waveform's overall energy is above the absolute floor."""
+        if len(audio) == 0:
+            return False
+        return 10 * np.log10(np.mean(np.square(audio, dtype=np.float64)) + 1e-10) > self.min_energy_db
+
+    def skipped_fraction(self, audio: np.ndarray, regions: List[Tuple[float, float]]) -> float:
+        """Get the fraction of the audio that falls outside the speech regions."""
+        duration = len(audio) / self.sample_rate
+        if duration == 0:
+            return 0.0
+        speech = sum(end - start for start, end in regions)
+        return max(0.0, 1 - speech / duration)
+
+    def _remap_time(
+        self,
+        time: float,
+        offsets: List[Tuple[float, float, float]],
+        starts: List[float],
+        is_end: bool
+    ) -> float:
+        """Map one compacted timestamp, keeping region-boundary ends in their region."""
+        if not offsets:
+            return time
+        if is_end:
+            index = bisect.bisect_left(starts, time) - 1
+        else:
+            index = bisect.bisect_right(starts, time) - 1
+        compact_start, original_start, duration = offsets[max(0, index)]
+        return original_start + min(max(time - compact_start, 0.0), duration)
+
+    def _merge(self, regions: List[List[float]], max_gap: float) -> List[List[float]]:
+        """Merge sorted regions separated by at most max_gap seconds."""
+        merged = []
+        for start, end in regions:
+            if merged and start - merged[-1][1] <= max_gap:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
@@ -1,82 +1,417 @@
 import whisper
 import torch
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from config.settings import settings
+from .voice_activity import VoiceActivityDetector
+from .audio_buffer import AudioBuffer
 import logging
+import multiprocessing
+import threading
+import os
 import librosa
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Inference engines: full-precision, or dynamic int8 quantization of the
+# encoder/decoder linear layers for CPU-only hosts
+WHISPER_ENGINES = ("fp32", "int8")
+
+# Model loaded once per chunk transcription worker process
+_worker_model = None
+
+def load_model(model_size: str, device: str = "cpu", engine: str = "fp32") -> whisper.Whisper:
+    """
+    Load a Whisper model for the given inference engine.
+    
+    Args:
+        model_size: Whisper model size
+        device: Device to load the model on ("int8" always uses the CPU)
+        engine: "fp32", or "int8" to quantize the linear layers' weights
+            (activations are quantized on the fly)
+        
+    Returns:
+        Loaded Whisper model
+    """
+    if engine not in WHISPER_ENGINES:
+        raise ValueError(f"Unknown Whisper engine '{engine}', expected one of {WHISPER_ENGINES}")
+    if engine == "fp32":
+        return whisper.load_model(model_size, device=device)
+    
+    model = whisper.load_model(model_size, device="cpu")
+    # Whisper's Linear subclass only casts weights to the input dtype, which
+    # is a no-op in fp32; make it a plain nn.Linear so it can be quantized
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+    if torch.backends.quantized.engine == "none":
+        # Pick a backend the CPU supports (fbgemm on x86, qnnpack on ARM)
+        torch.backends.quantized.engine = torch.backends.quantized.supported_engines[-1]
+    # In place, so loading does not hold an fp32 copy alongside the quantized model
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+def _init_chunk_worker(model_size: str, threads: int, engine: str = "fp32") -> None:
+    """Load the Whisper model once in a worker process."""
+    global _worker_model
+    torch.set_num_threads(threads)
+    _worker_model = load_model(model_size, device="cpu", engine=engine)
+
+def _transcribe_chunk(chunk: np.ndarray, language: Optional[str]) -> Dict:
+    """Transcribe one audio chunk with the worker's preloaded model."""
+    return _worker_model.transcribe(
+        chunk,
+        language=language,
+        task='transcribe',
+        fp16=False
+    )
+
 class WhisperTranscriber:
     """Transcribes audio using OpenAI's Whisper model."""
     
-    def __init__(self, model_size: str = "base"):
-        logger.info(f"Initializing Whisper transcriber with model size: {model_size}")
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+    def __init__(self, model_size: str = "base", engine: str = settings.WHISPER_ENGINE):
+        logger.info(f"Initializing Whisper transcriber with model size: {model_size} ({engine})")
+        # Quantized kernels only run on the CPU
+        self.device = "cuda" if torch.cuda.is_available() and engine == "fp32" else "cpu"
         logger.info(f"Using device: {self.device}")
         
-        self.model = whisper.load_model(model_size).to(self.device)
+        self.model_size = model_size
+        self.engine = engine
+        # Loaded on first use: callers that only transcribe in the worker
+        # pool never need the in-process model
+        self._model = None
+        self._model_lock = threading.Lock()
         self.sample_rate = 16000  # Whisper expects 16kHz audio
-        self.chunk_length = 30  # default chunk length
+        self.chunk_length = settings.AUDIO_CHUNK_LENGTH  # default chunk length
+        self.chunk_overlap = settings.AUDIO_CHUNK_OVERLAP
+        self._pool = None
+        self._pool_workers = 0
+        self._pool_threads = 0
+        # The instance is shared process-wide, so pool creation, resizing,
+        # submission and shutdown are serialized
+        self._pool_lock = threading.Lock()
+        self.vad = VoiceActivityDetector(sample_rate=self.sample_rate)
+        # Whisper installs kv-cache hooks on the model during decoding, so a
+        # shared instance must not run two transcriptions at the same time.
+        self._lock = threading.Lock()
+    
+    @property
+    def model(self) -> whisper.Whisper:
+        """The in-process Whisper model, loaded on first use."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = load_model(self.model_size, device=self.device, engine=self.engine)
+        return self._model
+    
+    def warm_up(self) -> None:
+        """Run a short inference on silence so the first real request is fast."""
+        logger.info("Warming up Whisper model")
+        silence = np.zeros(self.sample_rate, dtype=np.float32)
+        with self._lock:
+            self.model.transcribe(
+                silence,
+                task='transcribe',
+                fp16=self.device == "cuda"
+            )
     
     def transcribe_audio(
         self,
-        audio_path: str,
+        audio_path: Union[str, AudioBuffer],
         language: Optional[str] = None,
-        chunk_size: Optional[int] = None
+        chunk_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        vad: bool = False
     ) -> Dict:
         """
         Transcribe audio file with timestamps.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or an already decoded AudioBuffer
             language: Optional language code
-            chunk_size: Optional chunk size in seconds
+            chunk_size: Optional chunk size in seconds; when given, the audio
+                is split into overlapping chunks transcribed in parallel
+            workers: Number of worker processes for chunked transcription
+                (defaults to CPU count)
+            vad: Whether to skip silence and noise with a voice-activity
+                pre-pass; timestamps still refer to the original audio
             
         Returns:
             Dictionary containing transcription results
         """
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio_path, AudioBuffer):
+            self._check_sample_rate(audio_path)
+            audio = audio_path.samples
+            source = audio_path.source
+        else:
+            if not Path(audio_path).exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            audio = None
+            source = audio_path
+        if chunk_size:
+            self._check_chunk_size(chunk_size)
         
-        logger.info(f"Starting transcription of {audio_path}")
+        logger.info(f"Starting transcription of {source}")
         
         try:
-            # Use whisper's built-in audio loading instead of librosa
+            if vad:
+                return self._transcribe_speech_regions(
+                    audio if audio is not None else whisper.load_audio(audio_path),
+                    source, language, chunk_size, workers
+                )
+            if chunk_size:
+                return self._transcribe_chunked(
+                    audio if audio is not None else whisper.load_audio(audio_path),
+                    language, chunk_size, workers
+                )
+            
+            # Use whisper's built-in audio loading for paths instead of librosa
+            return self._transcribe_whole(audio if audio is not None else audio_path, language)
+            
+        except Exception as e:
+            logger.error(f"Error transcribing audio: {str(e)}")
+            raise
+    
+    def _transcribe_whole(self, audio, language: Optional[str]) -> Dict:
+        """Transcribe a file path or waveform in a single model call."""
+        with self._lock:
             result = self.model.transcribe(
-                audio_path,
+                audio,
                 language=language,
                 task='transcribe',
-                fp16=torch.cuda.is_available()
+                fp16=self.device == "cuda"
             )
+        
+        if not result or not result.get('text'):
+            raise ValueError("No speech detected in audio")
             
-            if not result or not result.get('text'):
+        # Format results
+        segments = []
+        for segment in result['segments']:
+            segments.append({
+                'start': segment['start'],
+                'end': segment['end'],
+                'text': segment['text'].strip()
+            })
+        
+        return {
+            'segments': segments,
+            'text': result['text'].strip()
+        }
+    
+    def _transcribe_speech_regions(
+        self,
+        audio: np.ndarray,
+        source: Optional[str],
+        language: Optional[str],
+        chunk_size: Optional[int],
+        workers: Optional[int]
+    ) -> Dict:
+        """Transcribe only the detected speech regions and remap timestamps."""
+        regions = self.vad.detect(audio)
+        skipped = self.vad.skipped_fraction(audio, regions)
+        logger.info(
+            f"Voice activity: {len(regions)} speech regions, "
+            f"skipping {skipped:.1%} of {Path(source).name if source else 'audio'}"
+        )
+        
+        if not regions:
+            if not self.vad.has_signal(audio):
                 raise ValueError("No speech detected in audio")
-                
-            # Format results
-            segments = []
-            for segment in result['segments']:
-                segments.append({
-                    'start': segment['start'],
-                    'end': segment['end'],
-                    'text': segment['text'].strip()
-                })
-            
-            return {
-                'segments': segments,
-                'text': result['text'].strip()
-            }
+            # Audible but no regions found: let Whisper decide on the whole file
+            logger.info("Voice activity found no speech regions in audible audio, transcribing all of it")
+            if chunk_size:
+                return self._transcribe_chunked(audio, language, chunk_size, workers)
+            return self._transcribe_whole(audio, language)
+        
+        speech, offsets = self.vad.compact(audio, regions)
+        if chunk_size:
+            result = self._transcribe_chunked(speech, language, chunk_size, workers)
+        else:
+            result = self._transcribe_whole(speech, language)
+        
+        result['segments'] = self.vad.remap_segments(result['segments'], offsets)
+        result['vad'] = {
+            'speech_regions': regions,
+            'skipped_fraction': skipped
+        }
+        return result
+    
+    def iter_transcribe(
+        self,
+        audio_path: Union[str, AudioBuffer],
+        language: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        threads: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Transcribe audio chunk by chunk, yielding segments as they are ready.
+        
+        Chunks are yielded in order, with the same seam de-duplication as
+        chunked transcribe_audio, so the concatenated segments equal its
+        result. By default each chunk is transcribed on demand with this
+        instance's model, so closing the generator stops the transcription;
+        passing workers or threads opts into the worker pool instead, for
+        batch use where throughput matters more than memory.
+        
+        Args:
+            audio_path: Path to audio file, or an already decoded AudioBuffer
+            language: Optional language code
+            chunk_size: Chunk size in seconds (defaults to settings.AUDIO_CHUNK_LENGTH)
+            workers: Number of worker processes; when given, chunks are
+                transcribed in parallel in the worker pool
+            threads: Torch threads per worker process; when given, chunks
+                always run in the worker pool so the transcription stays
+                within workers * threads cores
             
-        except Exception as e:
-            logger.error(f"Error transcribing audio: {str(e)}")
-            raise
+        Yields:
+            Dictionaries with the chunk's new 'segments', the audio time
+            transcribed so far ('end') and the fraction done ('progress')
+        """
+        chunk_size = chunk_size or self.chunk_length
+        self._check_chunk_size(chunk_size)
+        if isinstance(audio_path, AudioBuffer):
+            self._check_sample_rate(audio_path)
+            audio = audio_path.samples
+        else:
+            if not Path(audio_path).exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            audio = whisper.load_audio(audio_path)
+        
+        duration = len(audio) / self.sample_rate
+        chunk_count, offsets, results = self._iter_chunk_results(
+            audio, language, chunk_size, workers, threads,
+            in_process=workers is None and threads is None
+        )
+        
+        try:
+            for i, result in enumerate(results):
+                lower, upper = self._seam_bounds(i, offsets)
+                end = min(offsets[i] + chunk_size, duration)
+                yield {
+                    'segments': [
+                        segment for segment in result['segments']
+                        if segment['text'] and lower <= (segment['start'] + segment['end']) / 2 < upper
+                    ],
+                    'end': end,
+                    'progress': (i + 1) / chunk_count
+                }
+        finally:
+            # Stop transcribing (or cancel pending pool chunks) when abandoned
+            results.close()
+    
+    def _transcribe_chunked(
+        self,
+        audio: np.ndarray,
+        language: Optional[str],
+        chunk_size: int,
+        workers: Optional[int]
+    ) -> Dict:
+        """Transcribe overlapping chunks of a waveform in parallel and merge them."""
+        _, offsets, results = self._iter_chunk_results(audio, language, chunk_size, workers)
+        merged = self._merge_chunk_results(list(results), offsets)
+        
+        if not merged['text']:
+            raise ValueError("No speech detected in audio")
+        
+        return merged
+    
+    def _iter_chunk_results(
+        self,
+        audio: np.ndarray,
+        language: Optional[str],
+        chunk_size: int,
+        workers: Optional[int],
+        threads: Optional[int] = None,
+        in_process: bool = False
+    ) -> Tuple[int, List[float], Iterator[Dict]]:
+        """
+        Start transcribing overlapping chunks of a waveform.
+        
+        Args:
+            in_process: Transcribe each chunk lazily with this instance's
+                model instead of in the worker pool
+        
+        Returns:
+            Tuple of (chunk count, chunk start offsets, iterator of offset
+            chunk results in chunk order, each available as soon as it and
+            all earlier chunks are done)
+        """
+        chunks = self._split_audio(audio, chunk_size, self.chunk_overlap)
+        step = chunk_size - self.chunk_overlap
+        offsets = [i * step for i in range(len(chunks))]
+        workers = min(workers or os.cpu_count() or 1, len(chunks))
+        # A single GPU (or core) gains nothing from extra processes
+        in_process = in_process or self.device == "cuda" or (workers == 1 and threads is None)
+        
+        logger.info(
+            f"Transcribing {len(audio) / self.sample_rate:.1f}s of audio in {len(chunks)} chunks "
+            + ("in process" if in_process else f"with {workers} workers")
+        )
+        
+        if in_process:
+            def transcribe(chunk):
+                with self._lock:
+                    return self.model.transcribe(
+                        chunk,
+                        language=language,
+                        task='transcribe',
+                        fp16=self.device == "cuda"
+                    )
+            results = map(transcribe, chunks)
+        else:
+            # map() submits every chunk at once, so a later resize or close
+            # still lets these chunks finish
+            with self._pool_lock:
+                pool = self._get_pool(workers, threads)
+                results = pool.map(_transcribe_chunk, chunks, [language] * len(chunks))
+        
+        return len(chunks), offsets, (
+            self._process_chunk_result(result, offset) for result, offset in zip(results, offsets)
+        )
+    
+    def _get_pool(self, workers: int, threads: Optional[int] = None) -> ProcessPoolExecutor:
+        """Get the worker pool, creating it with preloaded models if needed. Caller holds _pool_lock."""
+        if (
+            self._pool is None or self._pool_workers < workers
+            # An explicit thread budget needs exactly the requested pool
+            or (threads is not None and (self._pool_workers, self._pool_threads) != (workers, threads))
+        ):
+            # Work already submitted to the old pool still runs to completion
+            self._shutdown_pool(wait=False)
+            threads = threads or max(1, (os.cpu_count() or 1) // workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                # Forking a process with running torch/OpenCV threads can deadlock
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_chunk_worker,
+                initargs=(self.model_size, threads, self.engine)
+            )
+            self._pool_workers = workers
+            self._pool_threads = threads
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the chunk transcription worker pool, if any."""
+        with self._pool_lock:
+            self._shutdown_pool(wait=True)
+    
+    def _shutdown_pool(self, wait: bool) -> None:
+        """Shut down the worker pool. Caller holds _pool_lock."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+            self._pool_workers = 0
+            self._pool_threads = 0
     
     def _split_audio(
         self,
         audio: np.ndarray,
-        chunk_size: int
+        chunk_size: int,
+        overlap: float = 0
     ) -> List[np.ndarray]:
         """
         Split audio into chunks.
@@ -84,16 +419,51 @@ class WhisperTranscriber:
         Args:
             audio: Audio array
             chunk_size: Size of chunks in seconds
+            overlap: Seconds shared by consecutive chunks
             
         Returns:
-            List of audio chunks
+            List of audio chunks, chunk i starting at i * (chunk_size - overlap) seconds
         """
-        chunk_length = chunk_size * self.sample_rate
+        self._check_chunk_size(chunk_size, overlap)
+        chunk_length = int(chunk_size * self.sample_rate)
+        overlap_length = int(overlap * self.sample_rate)
+        step = chunk_length - overlap_length
         return [
             audio[i:i + chunk_length]
-            for i in range(0, len(audio), chunk_length)
+            for i in range(0, max(len(audio) - overlap_length, 1), step)
         ]
     
+    def _merge_chunk_results(
+        self,
+        chunk_results: List[Dict],
+        offsets: List[float]
+    ) -> Dict:
+        """
+        Merge offset chunk results, de-duplicating segments at the seams.
+        
+        Each overlap is cut at its midpoint: a segment is kept only by the
+        chunk whose side of the seam contains the segment's midpoint.
+        """
+        segments = []
+        
+        for i, result in enumerate(chunk_results):
+            lower, upper = self._seam_bounds(i, offsets)
+            for segment in result['segments']:
+                midpoint = (segment['start'] + segment['end']) / 2
+                if segment['text'] and lower <= midpoint < upper:
+                    segments.append(segment)
+        
+        return {
+            'segments': segments,
+            'text': ' '.join(segment['text'] for segment in segments).strip()
+        }
+    
+    def _seam_bounds(self, index: int, offsets: List[float]) -> Tuple[float, float]:
+        """Get the time range whose segment midpoints belong to chunk index."""
+        lower = offsets[index] + self.chunk_overlap / 2 if index > 0 else float('-inf')
+        upper = offsets[index + 1] + self.chunk_overlap / 2 if index + 1 < len(offsets) else float('inf')
+        return lower, upper
+    
     def _process_chunk_result(
         self,
         result: Dict,
@@ -115,21 +485,25 @@ class WhisperTranscriber:
     
     def get_audio_features(
         self,
-        audio_path: str,
+        audio_path: Union[str, AudioBuffer],
         feature_type: str = 'mfcc'
     ) -> np.ndarray:
         """
         Extract audio features from file.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or an already decoded AudioBuffer
             feature_type: Type of features to extract ('mfcc' or 'mel')
             
         Returns:
             Numpy array of audio features
         """
-        # Load audio
-        audio, _ = librosa.load(audio_path, sr=self.sample_rate, mono=True)
+        # Load audio, reusing the decoded buffer when given
+        if isinstance(audio_path, AudioBuffer):
+            self._check_sample_rate(audio_path)
+            audio = np.asarray(audio_path.samples)
+        else:
+            audio, _ = librosa.load(audio_path, sr=self.sample_rate, mono=True)
         
         if feature_type == 'mfcc':
             features = librosa.feature.mfcc(y=audio, sr=self.sample_rate)
@@ -139,3 +513,18 @@ class WhisperTranscriber:
             raise ValueError(f"Unsupported feature type: {feature_type}")
         
         return features
+    
+    def _check_chunk_size(self, chunk_size: float, overlap: Optional[float] = None) -> None:
+        """Ensure consecutive chunks advance, i.e. chunks are longer than their overlap."""
+        overlap = self.chunk_overlap if overlap is None else overlap
+        if chunk_size <= overlap:
+            raise ValueError(
+                f"Chunk size ({chunk_size}s) must be greater than the chunk overlap ({overlap}s)"
+            )
+    
+    def _check_sample_rate(self, audio: AudioBuffer) -> None:
+        """Ensure a decoded buffer matches the rate Whisper expects."""
+        if audio.sample_rate != self.sample_rate:
+            raise ValueError(
+                f"Audio buffer sample rate {audio.sample_rate} does not match {self.sample_rate}"
+            )
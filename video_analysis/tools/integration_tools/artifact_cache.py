@@ -0,0 +1,163 @@
+import numpy as np
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from config.settings import settings
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ArtifactCache:
+    """Content-addressed, size-bounded on-disk cache of analysis stage artifacts."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = settings.ARTIFACT_CACHE_MAX_BYTES
+    ):
+        self.cache_dir = Path(cache_dir or settings.CACHE_DIR) / "artifacts"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """Get the SHA-256 hex digest of in-memory media bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    def hash_media(self, media_path: str, chunk_size: int = 1 << 20) -> str:
+        """
+        Get the SHA-256 hex digest of a media file's bytes.
+
+        Digests are remembered per (path, size, mtime) so re-hashing an
+        unchanged file is free within the process.
+
+        Args:
+            media_path: Path to the media file
+            chunk_size: Bytes read per iteration
+
+        Returns:
+            Hex digest of the file contents
+        """
+        stat = os.stat(media_path)
+        file_id = (str(Path(media_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        digest = self._hashes.get(file_id)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(media_path, 'rb') as f:
+                for block in iter(lambda: f.read(chunk_size), b""):
+                    sha.update(block)
+            digest = sha.hexdigest()
+            self._hashes[file_id] = digest
+        return digest
+
+    def get(self, media_hash: str, stage: str, **params) -> Optional[Any]:
+        """
+        Get a cached artifact.
+
+        Args:
+            media_hash: Digest of the media bytes
+            stage: Pipeline stage name (e.g. 'transcript', 'clip_embeddings')
+            **params: Model names and parameters the artifact depends on
+
+        Returns:
+            The cached artifact, or None on a miss. Arrays are returned as
+            copy-on-write memory maps.
+        """
+        for path in self._paths(media_hash, stage, params):
+            try:
+                if path.suffix == ".npy":
+                    value = np.load(path, mmap_mode='c')
+                else:
+                    with open(path) as f:
+                        value = json.load(f)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable cache entry {path.name}: {str(e)}")
+                path.unlink(missing_ok=True)
+                continue
+
+            # Touch the entry so eviction is least-recently-used
+            os.utime(path)
+            logger.info(f"Cache hit for {stage} ({media_hash[:12]})")
+            return value
+        return None
+
+    def put(self, media_hash: str, stage: str, value: Any, **params) -> None:
+        """
+        Store an artifact, evicting least-recently-used entries if needed.
+
+        Args:
+            media_hash: Digest of the media bytes
+            stage: Pipeline stage name
+            value: numpy array, or any JSON-serializable value
+            **params: Model names and parameters the artifact depends on
+        """
+        npy_path, json_path = self._paths(media_hash, stage, params)
+        path = npy_path if isinstance(value, np.ndarray) else json_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb' if path.suffix == ".npy" else 'w') as f:
+                if path.suffix == ".npy":
+                    np.save(f, value)
+                else:
+                    json.dump(value, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+
+    def get_or_compute(
+        self,
+        media_hash: str,
+        stage: str,
+        compute: Callable[[], Any],
+        **params
+    ) -> Any:
+        """Get a cached artifact, computing and storing it on a miss."""
+        value = self.get(media_hash, stage, **params)
+        if value is None:
+            value = compute()
+            self.put(media_hash, stage, value, **params)
+        return value
+
+    def _paths(self, media_hash: str, stage: str, params: Dict) -> Tuple[Path, Path]:
+        """Get the array and JSON paths for an artifact key."""
+        key = hashlib.sha256(
+            json.dumps({'media': media_hash, 'stage': stage, 'params': params}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        base = self.cache_dir / stage / key
+        return base.with_suffix(".npy"), base.with_suffix(".json")
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*/*"):
+                if path.suffix not in (".npy", ".json"):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                logger.debug(f"Evicted cache entry {path.parent.name}/{path.name}")
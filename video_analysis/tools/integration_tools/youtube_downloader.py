@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from config.settings import settings
+import logging
+import os
+import re
+import threading
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+YOUTUBE_ID_REGEX = re.compile(
+    r'(?:https?://)?(?:www\.|m\.)?'
+    r'(?:youtube|youtu|youtube-nocookie)\.(?:com|be)/'
+    r'(?:watch\?v=|embed/|v/|shorts/|.+\?v=)?([A-Za-z0-9_-]{11})'
+)
+
+# Speech only needs a low bitrate; prefer the smallest audio-only stream at or
+# above MIN_AUDIO_BITRATE kbps, in its native container (m4a/webm) so nothing
+# is transcoded. Videos without audio-only streams fall back to the smallest
+# muxed format.
+MIN_AUDIO_BITRATE = 48
+AUDIO_FORMAT = f'bestaudio[abr>={MIN_AUDIO_BITRATE}]/bestaudio/worst'
+AUDIO_FORMAT_SORT = ['+abr', '+size']
+VIDEO_FORMAT = 'best[ext=mp4]/best'
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Get the 11-character video ID from a YouTube URL, or None."""
+    match = YOUTUBE_ID_REGEX.match(url.strip())
+    return match.group(1) if match else None
+
+def _default_ydl_factory(options: Dict) -> Any:
+    """Create a yt-dlp downloader (imported lazily so stand-ins need no yt-dlp)."""
+    import yt_dlp
+    return yt_dlp.YoutubeDL(options)
+
+def _is_partial(path: Path) -> bool:
+    """Check whether a cache file is an in-progress yt-dlp download (.part, .part-FragN, ...)."""
+    return path.suffix.startswith(".part") or path.suffix in (".ytdl", ".tmp", ".temp")
+
+class YouTubeDownloader:
+    """Downloads YouTube media into a cache keyed by video ID."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = settings.DOWNLOAD_CACHE_MAX_BYTES,
+        ydl_factory: Optional[Callable[[Dict], Any]] = None
+    ):
+        """
+        Initialize the downloader.
+
+        Args:
+            cache_dir: Root cache directory (defaults to settings.CACHE_DIR)
+            max_bytes: Size bound of the download cache
+            ydl_factory: Callable taking yt-dlp options and returning a
+                context manager with extract_info(url, download) and
+                prepare_filename(info), e.g. a local stand-in for tests
+        """
+        self.cache_dir = Path(cache_dir or settings.CACHE_DIR) / "youtube"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ydl_factory = ydl_factory or _default_ydl_factory
+        # Guards the per-video locks and eviction; never held during a download
+        self._lock = threading.Lock()
+        self._video_locks: Dict[str, threading.Lock] = {}
+
+    def download(self, url: str, audio_only: bool = True) -> Path:
+        """
+        Get a local copy of a YouTube video's media.
+
+        Audio-only mode fetches just the smallest adequate audio stream,
+        which is all transcription needs; full video is downloaded only when
+        visual analysis is requested. A cached full video also satisfies an
+        audio-only request.
+
+        Args:
+            url: YouTube URL
+            audio_only: Whether only the audio track is needed
+
+        Returns:
+            Path to the cached media file
+        """
+        video_id = extract_video_id(url)
+        if video_id is None:
+            raise ValueError(f"Not a YouTube URL: {url}")
+
+        mode = "audio" if audio_only else "video"
+        # Only requests for the same video wait on each other; other
+        # downloads proceed concurrently
+        with self._video_lock(video_id):
+            cached = self._find(video_id, ("audio", "video") if audio_only else ("video",))
+            if cached is not None:
+                # Touch the entry so eviction is least-recently-used
+                os.utime(cached)
+                logger.info(f"Using cached {cached.name}")
+                return cached
+
+            options = {
+                'format': AUDIO_FORMAT if audio_only else VIDEO_FORMAT,
+                'outtmpl': str(self.cache_dir / f'{video_id}.{mode}.%(ext)s'),
+                'quiet': True,
+                'no_warnings': True,
+                'noplaylist': True
+            }
+            if audio_only:
+                options['format_sort'] = AUDIO_FORMAT_SORT
+
+            start_time = time.perf_counter()
+            with self.ydl_factory(options) as ydl:
+                info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=True)
+                output_path = Path(ydl.prepare_filename(info))
+
+            # Check if file exists and has content
+            if not output_path.exists() or output_path.stat().st_size == 0:
+                output_path.unlink(missing_ok=True)
+                raise RuntimeError(f"Failed to download {mode} for {video_id}")
+
+            size_mb = output_path.stat().st_size / (1024 * 1024)
+            logger.info(
+                f"Downloaded {mode} for {video_id} "
+                f"({info.get('format_id', '?')}, {size_mb:.1f} MB) in {time.perf_counter() - start_time:.1f}s"
+            )
+
+            with self._lock:
+                self._evict(keep=output_path)
+            return output_path
+
+    def _video_lock(self, video_id: str) -> threading.Lock:
+        """Get the lock serializing lookups and downloads of one video."""
+        with self._lock:
+            return self._video_locks.setdefault(video_id, threading.Lock())
+
+    def _find(self, video_id: str, modes) -> Optional[Path]:
+        """Find a completed cached download for a video in any of the given modes."""
+        for mode in modes:
+            for path in sorted(self.cache_dir.glob(f"{video_id}.{mode}.*")):
+                if not _is_partial(path) and path.stat().st_size > 0:
+                    return path
+        return None
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least-recently-used downloads until the cache fits max_bytes. Caller holds _lock."""
+        entries = []
+        for path in self.cache_dir.iterdir():
+            # Leave other downloads' in-progress files alone
+            if path == keep or not path.is_file() or _is_partial(path):
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = keep.stat().st_size + sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted download {path.name}")
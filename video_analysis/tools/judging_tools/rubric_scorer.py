@@ -0,0 +1,238 @@
+from ...utils.keyword_matcher import KeywordMatcher
+import hashlib
+import inspect
+import sys
+
+# Keywords for each category
+A2A_KEYWORDS = [
+    "agent to agent", "a2a", "agent-to-agent", 
+    "between agents", "agent transaction", "agent transfer",
+    "autonomous agent", "agent payment", "agent interaction"
+]
+
+INNOVATION_KEYWORDS = [
+    "novel", "unique", "innovative", "creative", "new approach", "unconventional",
+    "future of a2a", "agent innovation", "agent automation"
+]
+
+PROTOTYPE_KEYWORDS = [
+    "demo", "demonstration", "transaction", "working", "prototype", "live",
+    "agent demo", "agent transaction demo", "a2a transfer"
+]
+
+TECHNICAL_KEYWORDS = [
+    "implementation", "architecture", "integration", "api", "backend", "security",
+    "authentication", "database", "infrastructure", "technical", "agent protocol",
+    "agent communication", "agent interface"
+]
+
+BUSINESS_KEYWORDS = [
+    "market", "problem", "solution", "opportunity", "customer", "user",
+    "business case", "roi", "implementation path", "adoption",
+    "agent economy", "agent marketplace", "agent use case"
+]
+
+PRESENTATION_KEYWORDS = [
+    "clear", "organized", "structure", "story", "professional",
+    "explanation", "walkthrough", "demonstration"
+]
+
+PARTNER_KEYWORDS = {
+    "story": ["story integration", "integrated with story", "using story", "story platform"],
+    "fxn": ["fxn integration", "integrated with fxn", "using fxn", "fxn platform"],
+    "alliance": ["alliance integration", "integrated with alliance", "using alliance", "alliance platform"],
+    "masumi": ["masumi network integration", "integrated with masumi", "using masumi network", "masumi platform"]
+}
+
+# All rubric keyword lists compiled into one matcher, so each segment is
+# scanned once no matter how many keywords the rubric has
+RUBRIC_KEYWORD_GROUPS = {
+    "a2a": A2A_KEYWORDS,
+    "innovation": INNOVATION_KEYWORDS,
+    "prototype": PROTOTYPE_KEYWORDS,
+    "technical": TECHNICAL_KEYWORDS,
+    "business": BUSINESS_KEYWORDS,
+    "presentation": PRESENTATION_KEYWORDS,
+    **{f"partner:{partner}": keywords for partner, keywords in PARTNER_KEYWORDS.items()}
+}
+RUBRIC_MATCHER = KeywordMatcher(RUBRIC_KEYWORD_GROUPS)
+
+CATEGORIES = [
+    "innovation_and_creativity",
+    "functioning_prototype",
+    "technical_complexity",
+    "business_utility",
+    "presentation_quality",
+    "bonus_integration"
+]
+
+# Categories that only earn points for A2A-related evidence
+A2A_CATEGORIES = ["innovation_and_creativity", "functioning_prototype", "technical_complexity", "business_utility"]
+
+# Keyword group that counts as evidence for each category
+CATEGORY_GROUPS = {
+    "innovation_and_creativity": "innovation",
+    "functioning_prototype": "prototype",
+    "technical_complexity": "technical",
+    "business_utility": "business",
+    "presentation_quality": "presentation"
+}
+
+class PresentationScorer:
+    """Scores presentation segments incrementally against the A2A hackathon rubric."""
+    
+    def __init__(self):
+        # Only the evidence that can appear in results is kept: a count plus
+        # the first few entries per category
+        self.observable = {category: False for category in CATEGORIES}
+        self.evidence_counts = {category: 0 for category in CATEGORIES}
+        self.evidence = {category: [] for category in CATEGORIES}
+        self.non_a2a_demos = []
+        
+        # Track if A2A transactions are demonstrated
+        self.has_a2a_focus = False
+        self.a2a_evidence = []
+        
+        # Track which partners are integrated
+        self.integrated_partners = set()
+        self.segment_count = 0
+    
+    def add_segment(self, segment):
+        """
+        Update evidence and scores with one transcript segment.
+        
+        Args:
+            segment: Dictionary with 'start' and 'text'
+        """
+        text = segment['text'].lower()
+        timestamp = f"[{int(segment['start'])}s]"
+        self.segment_count += 1
+        
+        # One pass over the text finds every keyword group it mentions
+        hits = RUBRIC_MATCHER.match(text)
+        mentions_a2a = "a2a" in hits
+        
+        # Check for A2A specific content
+        if mentions_a2a:
+            self.has_a2a_focus = True
+            if len(self.a2a_evidence) < 2:
+                self.a2a_evidence.append(f"{timestamp} {text}")
+        
+        for category, group in CATEGORY_GROUPS.items():
+            if group not in hits:
+                continue
+            if category in A2A_CATEGORIES and not mentions_a2a:
+                if category == "functioning_prototype":
+                    # Note non-A2A demo as feedback
+                    self.non_a2a_demos.append(
+                        f"{timestamp} Demo shown but not focused on A2A transactions"
+                    )
+                continue
+            self._add_evidence(category, f"{timestamp} {text}")
+        
+        # Bonus Integration - Check each partner specifically
+        for partner in PARTNER_KEYWORDS:
+            if f"partner:{partner}" in hits:
+                self.integrated_partners.add(partner)
+                self._add_evidence("bonus_integration", f"{timestamp} Integration with {partner}: {text}")
+    
+    def add_segments(self, segments):
+        """Update evidence and scores with a batch of transcript segments."""
+        for segment in segments:
+            self.add_segment(segment)
+    
+    def snapshot(self):
+        """
+        Get the results for the segments seen so far.
+        
+        Returns:
+            Dictionary of per-category scores and feedback, plus total_score
+            and categories_scored, identical to analyze_presentation on the
+            same segments
+        """
+        results = {
+            category: {"score": None, "feedback": [], "observable": self.observable[category]}
+            for category in CATEGORIES
+        }
+        results["functioning_prototype"]["feedback"].extend(self.non_a2a_demos)
+        
+        # If no A2A focus is found, add warning feedback
+        if not self.has_a2a_focus:
+            for category in A2A_CATEGORIES:
+                results[category]["feedback"].append(
+                    "WARNING: No clear focus on A2A (Agent-to-Agent) transactions detected"
+                )
+        else:
+            # Add A2A evidence as positive feedback
+            results["functioning_prototype"]["feedback"].extend([
+                "A2A transaction focus detected:",
+                *self.a2a_evidence  # Show first 2 pieces of evidence
+            ])
+        
+        # Score only categories with sufficient evidence
+        for category, data in results.items():
+            if data["observable"]:
+                # Base score on amount and quality of evidence
+                if category == "bonus_integration":
+                    # Score based on number of partners integrated
+                    data["score"] = len(self.integrated_partners)
+                    if data["score"] == 0:
+                        data["feedback"] = ["No clear integration with event partners detected"]
+                    else:
+                        data["feedback"].append(
+                            f"Integrated with {len(self.integrated_partners)} partners: {', '.join(self.integrated_partners)}"
+                        )
+                else:
+                    evidence_count = self.evidence_counts[category]
+                    if evidence_count > 0:
+                        # Score out of 5 points
+                        base_score = min(5, evidence_count)
+                        
+                        # For categories requiring A2A focus, only give full score if A2A is demonstrated
+                        if category in A2A_CATEGORIES:
+                            if not self.has_a2a_focus:
+                                base_score = 0  # No points if no A2A focus
+                                data["feedback"].append("Score: 0 - Project does not demonstrate A2A transactions")
+                            else:
+                                data["feedback"].append(f"Score: {base_score} - Shows A2A transaction focus")
+                        
+                        data["score"] = base_score
+                        
+                        # Add detailed feedback with timestamps
+                        data["feedback"].extend([
+                            f"Evidence found: {e}" for e in self.evidence[category]  # Show top 3 pieces of evidence
+                        ])
+                    else:
+                        data["feedback"].append("Insufficient evidence for scoring")
+            else:
+                data["feedback"].append("No observable evidence in video")
+        
+        # Calculate total score from validated categories only
+        validated_scores = [
+            data["score"] for data in results.values()
+            if data["score"] is not None
+        ]
+        results["total_score"] = sum(validated_scores)
+        results["categories_scored"] = len(validated_scores)
+        
+        return results
+    
+    def _add_evidence(self, category, entry):
+        """Record one piece of evidence, keeping only the entries that are shown."""
+        self.observable[category] = True
+        self.evidence_counts[category] += 1
+        if len(self.evidence[category]) < 3:
+            self.evidence[category].append(entry)
+
+def analyze_presentation(segments):
+    """Analyze presentation segments according to A2A hackathon judging criteria."""
+    scorer = PresentationScorer()
+    scorer.add_segments(segments)
+    return scorer.snapshot()
+
+# Changes whenever the rubric changes, so cached scores are recomputed
+# from the cached transcript instead of re-transcribing. Covers this whole
+# module (categories, groups, keywords and scorer) and the keyword matcher.
+RUBRIC_FINGERPRINT = hashlib.sha256(
+    (inspect.getsource(sys.modules[__name__]) + inspect.getsource(sys.modules[KeywordMatcher.__module__])).encode()
+).hexdigest()[:16]
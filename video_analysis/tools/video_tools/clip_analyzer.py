@@ -2,22 +2,42 @@ import torch
 from transformers import CLIPProcessor, CLIPModel
 from PIL import Image
 import numpy as np
-from typing import List, Dict, Union
+from typing import List, Dict, Tuple, Union
 from config.settings import settings
+from functools import lru_cache
 import logging
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Inference engines: full-precision, or dynamic int8 quantization of the
+# linear layers for CPU-only hosts
+CLIP_ENGINES = ("fp32", "int8")
+
 class CLIPAnalyzer:
     """Analyzes images using OpenAI's CLIP model."""
     
-    def __init__(self, model_name: str = settings.CLIP_MODEL_NAME):
-        logger.info(f"Initializing CLIP analyzer with model: {model_name}")
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+    def __init__(
+        self,
+        model_name: str = settings.CLIP_MODEL_NAME,
+        text_cache_size: int = 32,
+        engine: str = settings.CLIP_ENGINE
+    ):
+        if engine not in CLIP_ENGINES:
+            raise ValueError(f"Unknown CLIP engine '{engine}', expected one of {CLIP_ENGINES}")
+        
+        logger.info(f"Initializing CLIP analyzer with model: {model_name} ({engine})")
+        # Quantized kernels only run on the CPU
+        self.device = "cuda" if torch.cuda.is_available() and engine == "fp32" else "cpu"
         logger.info(f"Using device: {self.device}")
         
+        self.model_name = model_name
+        self.engine = engine
         self.model = CLIPModel.from_pretrained(model_name).to(self.device)
+        if engine == "int8":
+            self.model = self._quantize(self.model)
+        self.model.eval()
         self.processor = CLIPProcessor.from_pretrained(model_name)
         
         # Pre-defined categories for zero-shot classification
@@ -26,6 +46,25 @@ class CLIPAnalyzer:
             "indoor scene", "outdoor scene", "text", "action",
             "emotion", "event"
         ]
+        
+        # Normalized text embeddings per category tuple, so per-frame work is
+        # only the image encoder plus a matrix multiply
+        self._cached_text_embeddings = lru_cache(maxsize=text_cache_size)(
+            self._encode_text
+        )
+    
+    def _quantize(self, model: CLIPModel) -> torch.nn.Module:
+        """Quantize the linear layers' weights to int8; activations are quantized on the fly."""
+        if torch.backends.quantized.engine == "none":
+            # Pick a backend the CPU supports (fbgemm on x86, qnnpack on ARM)
+            torch.backends.quantized.engine = torch.backends.quantized.supported_engines[-1]
+        # In place, so loading does not hold an fp32 copy alongside the quantized model
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    
+    def warm_up(self) -> None:
+        """Run a single blank frame through the model so the first real request is fast."""
+        logger.info("Warming up CLIP model")
+        self.analyze_frame(np.zeros((224, 224, 3), dtype=np.uint8))
     
     def analyze_frame(
         self,
@@ -42,48 +81,7 @@ class CLIPAnalyzer:
         Returns:
             Dictionary containing analysis results
         """
-        # Convert numpy array to PIL Image if necessary
-        if isinstance(frame, np.ndarray):
-            frame = Image.fromarray(frame)
-        
-        # Prepare image
-        inputs = self.processor(
-            images=frame,
-            text=custom_categories or self.base_categories,
-            return_tensors="pt",
-            padding=True
-        ).to(self.device)
-        
-        # Get model outputs
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            image_features = outputs.image_embeds
-            text_features = outputs.text_embeds
-            
-            # Calculate similarity scores
-            similarity = torch.nn.functional.cosine_similarity(
-                image_features[:, None],
-                text_features[None, :],
-                dim=-1
-            )
-            
-        # Process results
-        categories = custom_categories or self.base_categories
-        scores = similarity[0].cpu().numpy()
-        
-        # Create results dictionary
-        results = {
-            'embeddings': image_features[0].cpu().numpy(),
-            'classifications': [
-                {'category': cat, 'score': float(score)}
-                for cat, score in zip(categories, scores)
-            ],
-            'top_categories': [
-                categories[idx] for idx in scores.argsort()[-3:][::-1]
-            ]
-        }
-        
-        return results
+        return self.batch_analyze_frames([frame], custom_categories, batch_size=1)[0]
     
     def batch_analyze_frames(
         self,
@@ -102,18 +100,233 @@ class CLIPAnalyzer:
         Returns:
             List of dictionaries containing analysis results
         """
+        categories = custom_categories or self.base_categories
         results = []
+        start_time = time.perf_counter()
         
         for i in range(0, len(frames), batch_size):
-            batch = frames[i:i + batch_size]
             logger.debug(f"Processing batch {i//batch_size + 1}")
+            image_features = self._encode_images(frames[i:i + batch_size])
+            scores = self._score(image_features, [categories])[0]
             
-            batch_results = [self.analyze_frame(frame, custom_categories) 
-                           for frame in batch]
-            results.extend(batch_results)
+            results.extend(
+                self._format_results(embedding, frame_scores, categories)
+                for embedding, frame_scores in zip(image_features.cpu().numpy(), scores)
+            )
+        
+        elapsed = time.perf_counter() - start_time
+        if len(frames) > 1 and elapsed > 0:
+            logger.info(
+                f"Analyzed {len(frames)} frames in {elapsed:.2f}s "
+                f"({len(frames) / elapsed:.1f} frames/s on {self.device})"
+            )
         
         return results
     
+    def analyze_embeddings(
+        self,
+        embeddings: np.ndarray,
+        custom_categories: List[str] = None
+    ) -> List[Dict]:
+        """
+        Classify precomputed, normalized image embeddings.
+        
+        Lets cached 'embeddings' from earlier analyses be re-scored without
+        decoding or encoding the frames again.
+        
+        Args:
+            embeddings: Array of shape (frames, embedding_dim)
+            custom_categories: Optional list of custom categories
+            
+        Returns:
+            List of dictionaries in the same shape as batch_analyze_frames
+        """
+        categories = custom_categories or self.base_categories
+        if len(embeddings) == 0:
+            return []
+        
+        image_features = torch.as_tensor(np.asarray(embeddings), device=self.device)
+        scores = self._score(image_features, [categories])[0]
+        return [
+            self._format_results(np.array(embedding), frame_scores, categories)
+            for embedding, frame_scores in zip(embeddings, scores)
+        ]
+    
+    def batch_score_category_sets(
+        self,
+        frames: List[Union[np.ndarray, Image.Image]],
+        category_sets: Dict[str, List[str]],
+        batch_size: int = settings.BATCH_SIZE
+    ) -> List[Dict[str, Dict]]:
+        """
+        Score several category sets against the same image embeddings.
+        
+        Each frame is encoded once and every set is scored with a single
+        matrix multiply against the cached text embeddings.
+        
+        Args:
+            frames: List of input frames
+            category_sets: Mapping of set name to list of categories
+            batch_size: Size of batches for processing
+            
+        Returns:
+            List with one dictionary per frame, mapping set name to the same
+            results dictionary returned by analyze_frame
+        """
+        names = list(category_sets)
+        results = []
+        
+        for i in range(0, len(frames), batch_size):
+            image_features = self._encode_images(frames[i:i + batch_size])
+            set_scores = self._score(image_features, [category_sets[name] for name in names])
+            embeddings = image_features.cpu().numpy()
+            
+            for j, embedding in enumerate(embeddings):
+                results.append({
+                    name: self._format_results(embedding, scores[j], category_sets[name])
+                    for name, scores in zip(names, set_scores)
+                })
+        
+        return results
+    
+    def score_category_sets(
+        self,
+        frame: Union[np.ndarray, Image.Image],
+        category_sets: Dict[str, List[str]]
+    ) -> Dict[str, Dict]:
+        """
+        Score several category sets against a single frame.
+        
+        Args:
+            frame: Input frame as numpy array or PIL Image
+            category_sets: Mapping of set name to list of categories
+            
+        Returns:
+            Dictionary mapping set name to analysis results
+        """
+        return self.batch_score_category_sets([frame], category_sets, batch_size=1)[0]
+    
+    def get_text_embeddings(self, categories: List[str]) -> torch.Tensor:
+        """
+        Get normalized text embeddings for a category list, using the cache.
+        
+        Args:
+            categories: List of category prompts
+            
+        Returns:
+            Tensor of shape (len(categories), embedding_dim)
+        """
+        return self._cached_text_embeddings(tuple(categories))
+    
+    def _encode_text(self, categories: Tuple[str, ...]) -> torch.Tensor:
+        """Tokenize and encode category prompts into normalized embeddings."""
+        logger.debug(f"Encoding {len(categories)} category prompts")
+        inputs = self.processor(
+            text=list(categories),
+            return_tensors="pt",
+            padding=True
+        ).to(self.device)
+        
+        with torch.no_grad():
+            text_features = self.model.get_text_features(**inputs)
+        
+        return torch.nn.functional.normalize(text_features, dim=-1)
+    
+    def preprocess(self, frames: List[Union[np.ndarray, Image.Image]]) -> torch.Tensor:
+        """
+        Resize and normalize frames into CLIP pixel values.
+        
+        Runs on the CPU, so it can happen on a decode thread while the
+        model encodes earlier frames.
+        
+        Args:
+            frames: List of input frames
+            
+        Returns:
+            Tensor of shape (len(frames), 3, height, width)
+        """
+        return self.processor(
+            images=[self._to_image(frame) for frame in frames],
+            return_tensors="pt"
+        )['pixel_values']
+    
+    def analyze_pixel_values(
+        self,
+        pixel_values: torch.Tensor,
+        custom_categories: List[str] = None
+    ) -> List[Dict]:
+        """
+        Analyze a batch of frames already passed through preprocess.
+        
+        Args:
+            pixel_values: Tensor of shape (frames, 3, height, width)
+            custom_categories: Optional list of custom categories
+            
+        Returns:
+            List of dictionaries in the same shape as batch_analyze_frames
+        """
+        categories = custom_categories or self.base_categories
+        image_features = self._encode_pixel_values(pixel_values)
+        scores = self._score(image_features, [categories])[0]
+        return [
+            self._format_results(embedding, frame_scores, categories)
+            for embedding, frame_scores in zip(image_features.cpu().numpy(), scores)
+        ]
+    
+    def _encode_images(self, frames: List[Union[np.ndarray, Image.Image]]) -> torch.Tensor:
+        """Encode a batch of frames into normalized image embeddings in one forward pass."""
+        return self._encode_pixel_values(self.preprocess(frames))
+    
+    def _encode_pixel_values(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        """Encode preprocessed pixel values into normalized image embeddings."""
+        with torch.no_grad():
+            image_features = self.model.get_image_features(pixel_values=pixel_values.to(self.device))
+        
+        return torch.nn.functional.normalize(image_features, dim=-1)
+    
+    def _score(
+        self,
+        image_features: torch.Tensor,
+        category_lists: List[List[str]]
+    ) -> List[np.ndarray]:
+        """
+        Compute cosine similarity of image embeddings against category lists.
+        
+        All lists are stacked into one text matrix so scoring is a single
+        matrix multiply, then split back per list.
+        """
+        text_features = [self.get_text_embeddings(categories) for categories in category_lists]
+        with torch.no_grad():
+            similarity = image_features @ torch.cat(text_features).T
+        
+        similarity = similarity.cpu().numpy()
+        splits = np.cumsum([len(categories) for categories in category_lists])[:-1]
+        return np.split(similarity, splits, axis=1)
+    
+    def _to_image(self, frame: Union[np.ndarray, Image.Image]) -> Image.Image:
+        """Convert numpy array to PIL Image if necessary."""
+        if isinstance(frame, np.ndarray):
+            return Image.fromarray(frame)
+        return frame
+    
+    def _format_results(
+        self,
+        embedding: np.ndarray,
+        scores: np.ndarray,
+        categories: List[str]
+    ) -> Dict:
+        """Build the per-frame results dictionary from embedding and scores."""
+        return {
+            'embeddings': embedding,
+            'classifications': [
+                {'category': cat, 'score': float(score)}
+                for cat, score in zip(categories, scores)
+            ],
+            'top_categories': [
+                categories[idx] for idx in scores.argsort()[-3:][::-1]
+            ]
+        }
+    
     def get_frame_embedding(
         self,
         frame: Union[np.ndarray, Image.Image]
@@ -127,15 +340,9 @@ class CLIPAnalyzer:
         Returns:
             Numpy array containing frame embedding
         """
-        if isinstance(frame, np.ndarray):
-            frame = Image.fromarray(frame)
-            
-        inputs = self.processor(
-            images=frame,
-            return_tensors="pt"
-        ).to(self.device)
-        
         with torch.no_grad():
-            image_features = self.model.get_image_features(**inputs)
+            image_features = self.model.get_image_features(
+                pixel_values=self.preprocess([frame]).to(self.device)
+            )
             
         return image_features[0].cpu().numpy()
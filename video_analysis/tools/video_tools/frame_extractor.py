@@ -1,9 +1,14 @@
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Dict, Iterator, List, Tuple, Optional
 from config.settings import settings
+from .scene_detector import SceneDetector
 import logging
+import time
+import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -11,73 +16,342 @@ logger = logging.getLogger(__name__)
 class FrameExtractor:
     """Extracts frames from video files with scene detection capabilities."""
     
-    def __init__(self, sampling_rate: int = settings.FRAME_SAMPLING_RATE):
+    # How unsampled frames are skipped:
+    # - "decode": read (decode and convert) every frame, then discard
+    # - "grab": grab every frame but only retrieve sampled ones
+    # - "seek": seek directly to each sampled frame
+    SAMPLING_MODES = ("decode", "grab", "seek")
+    
+    def __init__(
+        self,
+        sampling_rate: int = settings.FRAME_SAMPLING_RATE,
+        sampling_mode: str = "grab",
+        scene_metric: str = "mse",
+        scene_threshold: Optional[float] = None,
+        workers: int = settings.FRAME_EXTRACTION_WORKERS
+    ):
+        if sampling_mode not in self.SAMPLING_MODES:
+            raise ValueError(f"Unsupported sampling mode: {sampling_mode}")
+        
         self.sampling_rate = sampling_rate
-        self._scene_threshold = 30.0  # Threshold for scene change detection
+        self.sampling_mode = sampling_mode
+        # Processes extract_keyframes decodes time ranges in; 1 decodes sequentially
+        self.workers = workers
+        self.scene_detector = SceneDetector(metric=scene_metric, threshold=scene_threshold)
         
     def extract_keyframes(
         self, 
         video_path: str,
-        max_frames: Optional[int] = None
+        max_frames: Optional[int] = None,
+        metadata: Optional[Dict] = None,
+        workers: Optional[int] = None
     ) -> Tuple[List[np.ndarray], List[float]]:
         """
         Extract key frames from video with scene detection.
         
+        Holds every selected frame in memory; prefer iter_keyframes for
+        long videos.
+        
         Args:
             video_path: Path to the video file
             max_frames: Maximum number of frames to extract
+            metadata: Optional dictionary filled with the video metadata
+                read from the same capture
+            workers: Number of processes to decode time ranges in (defaults
+                to the extractor's workers); more than one uses
+                extract_keyframes_parallel
             
         Returns:
             Tuple containing:
             - List of frames as numpy arrays
             - List of timestamps for each frame
         """
+        workers = workers or self.workers
+        if workers > 1:
+            return self.extract_keyframes_parallel(video_path, max_frames, metadata, workers)
+        
+        frames = []
+        timestamps = []
+        
+        for timestamp, frame in self.iter_keyframes(video_path, max_frames, metadata):
+            frames.append(frame)
+            timestamps.append(timestamp)
+        
+        logger.info(f"Extracted {len(frames)} frames from video")
+        
+        return frames, timestamps
+    
+    def iter_keyframes(
+        self,
+        video_path: str,
+        max_frames: Optional[int] = None,
+        metadata: Optional[Dict] = None
+    ) -> Iterator[Tuple[float, np.ndarray]]:
+        """
+        Stream key frames from video with scene detection.
+        
+        Frames are yielded as soon as they are selected, so only the frame
+        being consumed and a small signature of the previous sampled frame
+        are held in memory.
+        
+        Args:
+            video_path: Path to the video file
+            max_frames: Maximum number of frames to yield
+            metadata: Optional dictionary filled with the video metadata
+                read from the same capture, before the first frame is yielded
+            
+        Yields:
+            Tuples of (timestamp, frame) in presentation order
+        """
         if not Path(video_path).exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
             
+        previous_signature = None
+        yielded = 0
+        stats = {'scanned': 0, 'decoded': 0}
+        
+        cap = cv2.VideoCapture(video_path)
+        video_metadata = self._read_metadata(cap)
+        if metadata is not None:
+            metadata.update(video_metadata)
+        fps = video_metadata['fps']
+        
+        logger.info(f"Starting frame extraction from {video_path} ({self.sampling_mode} mode)")
+        start_time = time.perf_counter()
+        
+        try:
+            for frame_count, frame in self._iter_sampled_frames(cap, fps, video_metadata['frame_count'], stats):
+                current_time = frame_count / fps
+                
+                # Detect scene change on cached thumbnails, always keeping the first frame
+                signature = self.scene_detector.signature(frame)
+                is_keyframe = (
+                    previous_signature is None
+                    or self.scene_detector.is_scene_change(previous_signature, signature)
+                )
+                previous_signature = signature
+                
+                if is_keyframe:
+                    if yielded:
+                        logger.debug(f"Scene change detected at {current_time:.2f}s")
+                    yield current_time, frame
+                    yielded += 1
+                
+                if max_frames and yielded >= max_frames:
+                    logger.info(f"Reached maximum frame limit: {max_frames}")
+                    break
+        finally:
+            cap.release()
+            elapsed = time.perf_counter() - start_time
+            if elapsed > 0:
+                logger.info(
+                    f"Scanned {stats['scanned']} frames, decoded {stats['decoded']} "
+                    f"in {elapsed:.2f}s ({stats['scanned'] / elapsed:.1f} frames/s, "
+                    f"{self.sampling_mode} mode)"
+                )
+    
+    def extract_keyframes_parallel(
+        self,
+        video_path: str,
+        max_frames: Optional[int] = None,
+        metadata: Optional[Dict] = None,
+        workers: Optional[int] = None
+    ) -> Tuple[List[np.ndarray], List[float]]:
+        """
+        Extract key frames by decoding time ranges in parallel processes.
+        
+        The video is split into contiguous frame ranges, one per worker. Each
+        worker seeks to its range, samples frames and makes scene-change
+        decisions within the range; the decision for the first sampled frame
+        of each range is stitched here using the last signature of the
+        previous range. Results match sequential extraction in order and
+        timestamps, provided the container supports frame-accurate seeking.
+        
+        Args:
+            video_path: Path to the video file
+            max_frames: Maximum number of frames to extract
+            metadata: Optional dictionary filled with the video metadata
+            workers: Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            Tuple containing:
+            - List of frames as numpy arrays
+            - List of timestamps for each frame
+        """
+        if not Path(video_path).exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        video_metadata = self.get_video_metadata(video_path)
+        if metadata is not None:
+            metadata.update(video_metadata)
+        
+        fps = video_metadata['fps']
+        total_frames = video_metadata['frame_count']
+        workers = workers or os.cpu_count() or 1
+        
+        # Keep every range at least a few sampling intervals long
+        min_range = max(1, int(fps * self.sampling_rate) * 4)
+        range_count = max(1, min(workers, total_frames // min_range))
+        if total_frames <= 0 or range_count == 1:
+            return self.extract_keyframes(video_path, max_frames, metadata, workers=1)
+        
+        bounds = np.linspace(0, total_frames, range_count + 1).astype(int)
+        ranges = [(int(bounds[i]) + 1, int(bounds[i + 1])) for i in range(range_count)]
+        # Frame counts can be estimates, so the last range reads to the end like the sequential path
+        ranges[-1] = (ranges[-1][0], None)
+        
+        logger.info(f"Extracting frames from {video_path} across {range_count} ranges")
+        start_time = time.perf_counter()
+        
+        # Forking a process with running torch/OpenCV threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=range_count,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            range_results = list(executor.map(
+                self._scan_range,
+                [video_path] * range_count,
+                [start for start, _ in ranges],
+                [end for _, end in ranges]
+            ))
+        
         frames = []
         timestamps = []
-        previous_frame = None
+        previous_signature = None
+        
+        for range_result in range_results:
+            first = range_result['first']
+            if first is not None:
+                frame_count, signature, frame = first
+                if previous_signature is None or self.scene_detector.is_scene_change(previous_signature, signature):
+                    frames.append(frame)
+                    timestamps.append(frame_count / fps)
+            
+            for frame_count, frame in range_result['keyframes']:
+                frames.append(frame)
+                timestamps.append(frame_count / fps)
+            
+            if range_result['last_signature'] is not None:
+                previous_signature = range_result['last_signature']
         
+        if max_frames and len(frames) > max_frames:
+            frames = frames[:max_frames]
+            timestamps = timestamps[:max_frames]
+        
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"Extracted {len(frames)} frames in {elapsed:.2f}s "
+            f"({total_frames / elapsed:.1f} source frames/s, {range_count} workers)"
+        )
+        
+        return frames, timestamps
+    
+    def _scan_range(
+        self,
+        video_path: str,
+        start_frame: int,
+        end_frame: Optional[int]
+    ) -> Dict:
+        """
+        Sample one frame range and make scene-change decisions within it.
+        
+        Runs in a worker process. The first sampled frame is returned
+        undecided together with its signature, since its decision depends on
+        the previous range.
+        
+        Returns:
+            Dictionary with 'first' (frame_count, signature, frame) or None,
+            'keyframes' as (frame_count, frame) tuples after the first, and
+            'last_signature' of the final sampled frame
+        """
         cap = cv2.VideoCapture(video_path)
         fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = 0
+        stats = {'scanned': 0, 'decoded': 0}
+        first = None
+        keyframes = []
+        previous_signature = None
+        
+        try:
+            for frame_count, frame in self._iter_sampled_frames(
+                cap, fps, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), stats, start_frame, end_frame
+            ):
+                signature = self.scene_detector.signature(frame)
+                if previous_signature is None:
+                    first = (frame_count, signature, frame)
+                elif self.scene_detector.is_scene_change(previous_signature, signature):
+                    keyframes.append((frame_count, frame))
+                previous_signature = signature
+        finally:
+            cap.release()
+        
+        return {
+            'first': first,
+            'keyframes': keyframes,
+            'last_signature': previous_signature
+        }
+    
+    def _iter_sampled_frames(
+        self,
+        cap: cv2.VideoCapture,
+        fps: float,
+        total_frames: int,
+        stats: Dict,
+        start_frame: int = 1,
+        end_frame: Optional[int] = None
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield (frame_count, frame) for sampled frames only.
+        
+        frame_count is 1-based, matching the sampling rule. Only frames in
+        [start_frame, end_frame] are scanned; the capture is positioned at
+        start_frame first. stats is updated with the number of frames
+        scanned and fully decoded.
+        """
+        if self.sampling_mode == "seek" and total_frames > 0:
+            last_frame = min(end_frame or total_frames, total_frames)
+            for frame_count in range(start_frame, last_frame + 1):
+                if not self._is_sampled(frame_count, fps):
+                    continue
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count - 1)
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                stats['scanned'] = frame_count - start_frame + 1
+                stats['decoded'] += 1
+                yield frame_count, frame
+            return
         
-        logger.info(f"Starting frame extraction from {video_path}")
+        if start_frame > 1:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame - 1)
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
+        frame_count = start_frame - 1
+        while cap.isOpened() and (end_frame is None or frame_count < end_frame):
+            if self.sampling_mode == "decode":
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                stats['decoded'] += 1
+            elif not cap.grab():
                 break
-                
+            
             frame_count += 1
-            current_time = frame_count / fps
+            stats['scanned'] += 1
             
             # Sample frames based on sampling rate
-            if frame_count % (fps * self.sampling_rate) != 0:
+            if not self._is_sampled(frame_count, fps):
                 continue
-                
-            # Detect scene change
-            if previous_frame is not None:
-                if self._is_scene_change(previous_frame, frame):
-                    frames.append(frame)
-                    timestamps.append(current_time)
-                    logger.debug(f"Scene change detected at {current_time:.2f}s")
-            else:
-                # Always keep first frame
-                frames.append(frame)
-                timestamps.append(current_time)
             
-            previous_frame = frame.copy()
+            if self.sampling_mode != "decode":
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                stats['decoded'] += 1
             
-            if max_frames and len(frames) >= max_frames:
-                logger.info(f"Reached maximum frame limit: {max_frames}")
-                break
-        
-        cap.release()
-        logger.info(f"Extracted {len(frames)} frames from video")
-        
-        return frames, timestamps
+            yield frame_count, frame
+    
+    def _is_sampled(self, frame_count: int, fps: float) -> bool:
+        """Check whether a 1-based frame number falls on the sampling interval."""
+        return frame_count % (fps * self.sampling_rate) == 0
     
     def _is_scene_change(self, prev_frame: np.ndarray, curr_frame: np.ndarray) -> bool:
         """
@@ -90,14 +364,10 @@ class FrameExtractor:
         Returns:
             Boolean indicating if a scene change was detected
         """
-        # Convert frames to grayscale
-        prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-        curr_gray = cv2.cvtColor(curr_frame, cv2.COLOR_BGR2GRAY)
-        
-        # Calculate mean squared error between frames
-        mse = np.mean((prev_gray - curr_gray) ** 2)
-        
-        return mse > self._scene_threshold
+        return self.scene_detector.is_scene_change(
+            self.scene_detector.signature(prev_frame),
+            self.scene_detector.signature(curr_frame)
+        )
     
     def get_video_metadata(self, video_path: str) -> dict:
         """
@@ -110,12 +380,18 @@ class FrameExtractor:
             Dictionary containing video metadata
         """
         cap = cv2.VideoCapture(video_path)
-        metadata = {
-            'fps': cap.get(cv2.CAP_PROP_FPS),
-            'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+        metadata = self._read_metadata(cap)
+        cap.release()
+        return metadata
+    
+    def _read_metadata(self, cap: cv2.VideoCapture) -> dict:
+        """Read metadata from an already opened capture."""
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        return {
+            'fps': fps,
+            'frame_count': frame_count,
             'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
             'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-            'duration': float(cap.get(cv2.CAP_PROP_FRAME_COUNT)) / cap.get(cv2.CAP_PROP_FPS)
+            'duration': float(frame_count) / fps if fps else 0.0
         }
-        cap.release()
-        return metadata
@@ -0,0 +1,202 @@
+import torch
+from typing import Dict, List, Optional, Tuple
+from config.settings import settings
+from .frame_extractor import FrameExtractor
+from .clip_analyzer import CLIPAnalyzer
+import logging
+import queue
+import threading
+import time
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Marks the end of the decoded frame stream
+_DONE = object()
+
+class FramePipeline:
+    """Overlaps frame decoding with CLIP inference through a bounded queue."""
+
+    def __init__(
+        self,
+        frame_extractor: FrameExtractor,
+        clip_analyzer: CLIPAnalyzer,
+        batch_size: int = settings.BATCH_SIZE,
+        queue_size: int = settings.PIPELINE_QUEUE_SIZE,
+        flush_timeout: float = settings.PIPELINE_FLUSH_TIMEOUT
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            frame_extractor: Source of sampled keyframes
+            clip_analyzer: Model the batches are classified with
+            batch_size: Frames per CLIP forward pass
+            queue_size: Maximum preprocessed frames waiting for CLIP; the
+                decoder blocks when the queue is full, which caps memory
+            flush_timeout: Seconds a partial batch may wait for more frames
+                before it is classified anyway
+        """
+        self.frame_extractor = frame_extractor
+        self.clip_analyzer = clip_analyzer
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.flush_timeout = flush_timeout
+
+    def run(
+        self,
+        video_path: str,
+        metadata: Optional[Dict] = None,
+        custom_categories: List[str] = None
+    ) -> Tuple[List[float], List[Dict], Dict]:
+        """
+        Decode, preprocess and classify the keyframes of a video.
+
+        A decode thread samples frames, preprocesses them into CLIP pixel
+        values and pushes them into the bounded queue; the calling thread
+        pulls full batches (or flushes a partial one after flush_timeout)
+        and runs the model.
+
+        Args:
+            video_path: Path to the video file
+            metadata: Optional dict filled with the video metadata
+            custom_categories: Optional list of custom categories
+
+        Returns:
+            Tuple of (timestamps, frame analyses, stage statistics)
+        """
+        frames = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        decode_stats = {'busy': 0.0, 'blocked': 0.0, 'frames': 0}
+
+        decoder = threading.Thread(
+            target=self._decode,
+            args=(video_path, metadata, frames, stop, decode_stats),
+            name="frame-decode",
+            daemon=True
+        )
+
+        timestamps = []
+        frame_analyses = []
+        batch = []
+        clip_stats = {'busy': 0.0, 'waiting': 0.0, 'batches': 0, 'partial_batches': 0}
+        start_time = time.perf_counter()
+        deadline = None
+
+        def flush():
+            flush_start = time.perf_counter()
+            frame_analyses.extend(self.clip_analyzer.analyze_pixel_values(
+                torch.stack([pixel_values for _, pixel_values in batch]),
+                custom_categories
+            ))
+            timestamps.extend(timestamp for timestamp, _ in batch)
+            clip_stats['busy'] += time.perf_counter() - flush_start
+            clip_stats['batches'] += 1
+            clip_stats['partial_batches'] += len(batch) < self.batch_size
+            batch.clear()
+
+        decoder.start()
+        try:
+            while True:
+                timeout = max(0.0, deadline - time.perf_counter()) if batch else None
+                wait_start = time.perf_counter()
+                try:
+                    item = frames.get(timeout=timeout)
+                except queue.Empty:
+                    # The decoder is slower than the model: classify what we have
+                    flush()
+                    continue
+                finally:
+                    clip_stats['waiting'] += time.perf_counter() - wait_start
+
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                if not batch:
+                    deadline = time.perf_counter() + self.flush_timeout
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    flush()
+
+            if batch:
+                flush()
+        finally:
+            stop.set()
+            decoder.join()
+
+        elapsed = time.perf_counter() - start_time
+        stats = self._summarize(elapsed, decode_stats, clip_stats, len(timestamps))
+        logger.info(
+            f"Pipelined {stats['frames']} frames in {elapsed:.2f}s ({stats['frames_per_second']:.1f} frames/s); "
+            f"decode busy {stats['decode']['utilization']:.0%}, "
+            f"CLIP busy {stats['clip']['utilization']:.0%}, bottleneck: {stats['bottleneck']}"
+        )
+        return timestamps, frame_analyses, stats
+
+    def _decode(
+        self,
+        video_path: str,
+        metadata: Optional[Dict],
+        frames: queue.Queue,
+        stop: threading.Event,
+        stats: Dict
+    ) -> None:
+        """Producer: sample and preprocess frames into the queue."""
+        keyframes = self.frame_extractor.iter_keyframes(video_path, metadata=metadata)
+        try:
+            while not stop.is_set():
+                busy_start = time.perf_counter()
+                item = next(keyframes, None)
+                if item is None:
+                    stats['busy'] += time.perf_counter() - busy_start
+                    break
+                timestamp, frame = item
+                pixel_values = self.clip_analyzer.preprocess([frame])[0]
+                stats['busy'] += time.perf_counter() - busy_start
+                stats['frames'] += 1
+
+                self._put(frames, (timestamp, pixel_values), stop, stats)
+            self._put(frames, _DONE, stop, stats)
+        except Exception as e:
+            logger.error(f"Error decoding frames: {str(e)}")
+            self._put(frames, e, stop, stats)
+        finally:
+            # Release the capture even if the consumer stopped early
+            keyframes.close()
+
+    def _put(self, frames: queue.Queue, item, stop: threading.Event, stats: Dict) -> None:
+        """Block while the queue is full (backpressure) unless the consumer stopped."""
+        blocked_start = time.perf_counter()
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        stats['blocked'] += time.perf_counter() - blocked_start
+
+    def _summarize(self, elapsed: float, decode_stats: Dict, clip_stats: Dict, frame_count: int) -> Dict:
+        """Turn busy/wait times into per-stage utilization."""
+        elapsed = max(elapsed, 1e-9)
+        decode_utilization = decode_stats['busy'] / elapsed
+        clip_utilization = clip_stats['busy'] / elapsed
+        return {
+            'frames': frame_count,
+            'seconds': elapsed,
+            'frames_per_second': frame_count / elapsed,
+            'decode': {
+                'busy_seconds': decode_stats['busy'],
+                'blocked_seconds': decode_stats['blocked'],
+                'utilization': decode_utilization
+            },
+            'clip': {
+                'busy_seconds': clip_stats['busy'],
+                'waiting_seconds': clip_stats['waiting'],
+                'batches': clip_stats['batches'],
+                'partial_batches': clip_stats['partial_batches'],
+                'utilization': clip_utilization
+            },
+            'bottleneck': 'decode' if decode_utilization >= clip_utilization else 'clip'
+        }
@@ -0,0 +1,126 @@
+import cv2
+import numpy as np
+from typing import Dict, Optional, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class SceneDetector:
+    """Detects scene changes by comparing small per-frame signatures."""
+
+    # Default thresholds, calibrated with examples/calibrate_scene_detector.py
+    # on 2 x 600 labeled 1280x720 pairs of synthetic presentation footage
+    # (slide advances, deck switches and camera/slide cuts versus pointer,
+    # motion, lighting, noise and JPEG changes; seeds 0 and 1):
+    # - "mse": mean squared error of 64x64 grayscale thumbnails; same-scene
+    #   pairs peak at 66, scene changes start at 90; 0 errors on both seeds
+    # - "phash": Hamming distance between 64-bit DCT perceptual hashes;
+    #   same-scene pairs peak at 6; 1 error in 1200 pairs
+    # The original full-frame uint8 MSE > 30 detector missed 183 of 761
+    # scene changes and raised 60 false alarms on the same pairs.
+    DEFAULT_THRESHOLDS: Dict[str, float] = {
+        "mse": 75.0,
+        "phash": 7
+    }
+
+    # Metrics without a usable default, kept for calibration and comparison:
+    # - "histogram": Bhattacharyya distance of 32-bin gray histograms (0-1);
+    #   flat slide backgrounds make it jump on small lighting changes, so no
+    #   threshold separates the classes (~18% errors at its best, 0.5)
+    UNCALIBRATED_METRICS = ("histogram",)
+
+    def __init__(
+        self,
+        metric: str = "mse",
+        threshold: Optional[float] = None,
+        thumbnail_size: Tuple[int, int] = (64, 64)
+    ):
+        if metric in self.UNCALIBRATED_METRICS:
+            if threshold is None:
+                raise ValueError(f"Scene change metric {metric} has no calibrated threshold; pass one explicitly")
+            logger.warning(f"Scene change metric {metric} misclassifies many frame pairs; prefer mse or phash")
+        elif metric not in self.DEFAULT_THRESHOLDS:
+            raise ValueError(f"Unsupported scene change metric: {metric}")
+
+        self.metric = metric
+        self.threshold = self.DEFAULT_THRESHOLDS[metric] if threshold is None else threshold
+        self.thumbnail_size = thumbnail_size
+
+    def signature(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Compute the compact signature used to compare a frame.
+
+        Signatures are small enough to cache for the previous frame, so the
+        full-resolution frame never needs to be kept or copied.
+
+        Args:
+            frame: BGR frame as numpy array
+
+        Returns:
+            Metric-specific signature array
+        """
+        if self.metric == "phash":
+            return self._phash(frame)
+
+        thumbnail = self.thumbnail(frame)
+        if self.metric == "histogram":
+            hist = cv2.calcHist([thumbnail], [0], None, [32], [0, 256])
+            return cv2.normalize(hist, hist, norm_type=cv2.NORM_L1)
+        return thumbnail
+
+    def thumbnail(
+        self,
+        frame: np.ndarray,
+        size: Optional[Tuple[int, int]] = None
+    ) -> np.ndarray:
+        """
+        Downscale a frame to a small grayscale thumbnail.
+
+        The frame is first strided down to a few times the target size so
+        the resize and color conversion only touch a small fraction of the
+        original pixels.
+
+        Args:
+            frame: BGR (or grayscale) frame as numpy array
+            size: Optional (width, height), defaults to thumbnail_size
+
+        Returns:
+            uint8 grayscale thumbnail
+        """
+        width, height = size or self.thumbnail_size
+        step = max(1, min(frame.shape[0] // (height * 4), frame.shape[1] // (width * 4)))
+        small = cv2.resize(frame[::step, ::step], (width, height), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def distance(self, prev_signature: np.ndarray, curr_signature: np.ndarray) -> float:
+        """
+        Compute the distance between two signatures for the configured metric.
+
+        Args:
+            prev_signature: Signature of the previous frame
+            curr_signature: Signature of the current frame
+
+        Returns:
+            Distance, larger meaning more different
+        """
+        if self.metric == "mse":
+            # absdiff saturates instead of wrapping around on uint8
+            diff = cv2.absdiff(prev_signature, curr_signature).astype(np.float32)
+            return float(np.mean(diff * diff))
+        if self.metric == "histogram":
+            return float(cv2.compareHist(prev_signature, curr_signature, cv2.HISTCMP_BHATTACHARYYA))
+        return float(np.count_nonzero(prev_signature != curr_signature))
+
+    def is_scene_change(self, prev_signature: np.ndarray, curr_signature: np.ndarray) -> bool:
+        """Check whether two signatures differ by more than the threshold."""
+        return self.distance(prev_signature, curr_signature) > self.threshold
+
+    def _phash(self, frame: np.ndarray) -> np.ndarray:
+        """Compute a 64-bit DCT perceptual hash as a boolean array."""
+        thumbnail = self.thumbnail(frame, (32, 32)).astype(np.float32)
+        low_freq = cv2.dct(thumbnail)[:8, :8].flatten()
+        # Exclude the DC term from the median so overall brightness is ignored
+        return low_freq > np.median(low_freq[1:])
@@ -0,0 +1,105 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+class KeywordMatcher:
+    """Matches many keyword groups against text in a single pass (Aho-Corasick)."""
+
+    def __init__(self, keyword_groups: Dict[str, Iterable[str]]):
+        """
+        Build the automaton.
+
+        Args:
+            keyword_groups: Mapping of group name to keywords. Keywords are
+                matched case-insensitively as plain substrings, and one
+                keyword may belong to several groups.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, Tuple[str, ...]]]] = [[]]
+
+        keyword_to_groups: Dict[str, List[str]] = {}
+        for group, keywords in keyword_groups.items():
+            for keyword in keywords:
+                groups = keyword_to_groups.setdefault(keyword.lower(), [])
+                if group not in groups:
+                    groups.append(group)
+
+        for keyword, groups in keyword_to_groups.items():
+            if keyword:
+                self._add(keyword, tuple(groups))
+        self._build_failure_links()
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str, Tuple[str, ...]]]:
+        """
+        Find every keyword occurrence, including overlapping ones.
+
+        Args:
+            text: Text to scan (compared in lower case)
+
+        Returns:
+            List of (start, end, keyword, groups) in order of match end;
+            start and end index the original text
+        """
+        matches = []
+        state = 0
+        # Original index of every lower-cased character: lowering can
+        # lengthen the text (e.g. 'İ' becomes two characters)
+        origins: List[int] = []
+
+        for index, original in enumerate(text):
+            for char in original.lower():
+                origins.append(index)
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                state = self._goto[state].get(char, 0)
+
+                for keyword, groups in self._output[state]:
+                    matches.append((origins[len(origins) - len(keyword)], index + 1, keyword, groups))
+
+        return matches
+
+    def match(self, text: str) -> Dict[str, List[Tuple[int, int, str]]]:
+        """
+        Group keyword occurrences by keyword group.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mapping of each group with at least one hit to its
+            (start, end, keyword) matches
+        """
+        hits: Dict[str, List[Tuple[int, int, str]]] = {}
+        for start, end, keyword, groups in self.find_all(text):
+            for group in groups:
+                hits.setdefault(group, []).append((start, end, keyword))
+        return hits
+
+    def _add(self, keyword: str, groups: Tuple[str, ...]) -> None:
+        """Insert a keyword into the trie."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append((keyword, groups))
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
@@ -0,0 +1,42 @@
+from typing import List
+import re
+
+_WORD_REGEX = re.compile(r"[a-z0-9']+")
+
+def normalize_words(text: str) -> List[str]:
+    """Lower-case text and split it into words, dropping punctuation."""
+    return _WORD_REGEX.findall(text.lower())
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Compute the word error rate of a hypothesis against a reference.
+
+    WER is the word-level edit distance (substitutions, deletions and
+    insertions) divided by the number of reference words, after
+    normalize_words.
+
+    Args:
+        reference: Ground-truth transcript
+        hypothesis: Transcript under test
+
+    Returns:
+        Word error rate (0.0 is a perfect match; can exceed 1.0)
+    """
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    # Single-row dynamic programming over the edit distance table
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + (ref_word != hyp_word)  # substitution
+            )
+        previous = current
+
+    return previous[-1] / len(ref)
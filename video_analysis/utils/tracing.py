@@ -0,0 +1,234 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+import os
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_STATM_PATH = "/proc/self/statm"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size of this process in MB (None if unavailable)."""
+    try:
+        with open(_STATM_PATH) as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / (1024 * 1024)
+    except (OSError, IndexError, ValueError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    return None
+
+def child_process_cpu_seconds() -> float:
+    """CPU time of terminated and reaped child processes (e.g. a closed worker pool)."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+def _max(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+class Span:
+    """One timed stage, with nested child stages."""
+
+    def __init__(self, name: str, start_offset: float = 0.0):
+        self.name = name
+        self.start_offset = start_offset
+        self.wall_seconds = 0.0
+        self.thread_cpu_seconds: Optional[float] = 0.0
+        self.process_cpu_seconds = 0.0
+        self.peak_rss_mb: Optional[float] = None
+        self.rss_delta_mb: Optional[float] = None
+        self.count = 0
+        self.children: List["Span"] = []
+
+    def child(self, name: str, start_offset: float, aggregate: bool) -> "Span":
+        """Get a new child span, or the existing one of that name when aggregating."""
+        if aggregate:
+            for child in self.children:
+                if child.name == name:
+                    return child
+        span = Span(name, start_offset)
+        self.children.append(span)
+        return span
+
+    def to_dict(self) -> Dict:
+        """Convert the span tree into plain dictionaries."""
+        return {
+            'name': self.name,
+            'start_offset': self.start_offset,
+            'wall_seconds': self.wall_seconds,
+            'thread_cpu_seconds': self.thread_cpu_seconds,
+            'process_cpu_seconds': self.process_cpu_seconds,
+            'peak_rss_mb': self.peak_rss_mb,
+            'rss_delta_mb': self.rss_delta_mb,
+            'count': self.count,
+            'children': [child.to_dict() for child in self.children]
+        }
+
+class Tracer:
+    """
+    Records nested timing spans for one analysis.
+
+    Each span records:
+    - wall time;
+    - thread CPU time: CPU used by the thread that opened the span, so it
+      excludes other sessions' and jobs' work but also any helper threads
+      the stage starts;
+    - process CPU time: CPU used by every thread of the process while the
+      span was open, including concurrent work outside this analysis;
+    - peak RSS: the highest current RSS sampled while the span was open,
+      and the RSS change from its start to its end.
+
+    Neither CPU figure includes worker processes; the CPU of worker pools
+    closed during the analysis is reported once on the root as
+    'child_process_cpu_seconds'.
+
+    Spans nest per thread; spans opened on a thread with no open span
+    attach to the root, so concurrent branches appear side by side.
+    """
+
+    def __init__(self, name: str = "analysis", sample_interval: float = 0.05):
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._children_cpu_start = child_process_cpu_seconds()
+        self.root = Span(name)
+        self.root.thread_cpu_seconds = None  # Spans several threads
+        self.root.peak_rss_mb = current_rss_mb()
+        self.sample_interval = sample_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Open spans, once per open occurrence (aggregated spans may overlap)
+        self._open: List[Span] = []
+        self._sampler: Optional[threading.Thread] = None
+
+    @contextmanager
+    def span(self, name: str, aggregate: bool = False) -> Iterator[Span]:
+        """
+        Time a stage.
+
+        Args:
+            name: Stage name
+            aggregate: Accumulate repeated spans of the same name under the
+                same parent (e.g. per-batch work) into one span with a count
+
+        Yields:
+            The span being recorded
+        """
+        stack = self._stack()
+        parent = stack[-1] if stack else self.root
+        wall_start = time.perf_counter()
+        thread_cpu_start = time.thread_time()
+        process_cpu_start = time.process_time()
+        rss_start = current_rss_mb()
+
+        with self._lock:
+            span = parent.child(name, wall_start - self._start, aggregate)
+            span.peak_rss_mb = _max(span.peak_rss_mb, rss_start)
+            self._open.append(span)
+            self._start_sampler()
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            stack.pop()
+            rss_end = current_rss_mb()
+            with self._lock:
+                self._open.remove(span)
+                span.wall_seconds += time.perf_counter() - wall_start
+                span.thread_cpu_seconds += time.thread_time() - thread_cpu_start
+                span.process_cpu_seconds += time.process_time() - process_cpu_start
+                span.peak_rss_mb = _max(span.peak_rss_mb, rss_end)
+                if rss_start is not None and rss_end is not None:
+                    span.rss_delta_mb = (span.rss_delta_mb or 0.0) + rss_end - rss_start
+                self._record_rss(rss_end)
+                span.count += 1
+
+    def to_dict(self) -> Dict:
+        """Get the span tree, with the root covering the time since the tracer started."""
+        with self._lock:
+            self.root.wall_seconds = time.perf_counter() - self._start
+            self.root.process_cpu_seconds = time.process_time() - self._cpu_start
+            self._record_rss(current_rss_mb())
+            self.root.count = 1
+            timings = self.root.to_dict()
+        timings['child_process_cpu_seconds'] = child_process_cpu_seconds() - self._children_cpu_start
+        return timings
+
+    def _stack(self) -> List[Span]:
+        """Get this thread's stack of open spans."""
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _record_rss(self, rss: Optional[float]) -> None:
+        """Fold an RSS sample into the root and every open span. Caller holds _lock."""
+        self.root.peak_rss_mb = _max(self.root.peak_rss_mb, rss)
+        for span in self._open:
+            span.peak_rss_mb = _max(span.peak_rss_mb, rss)
+
+    def _start_sampler(self) -> None:
+        """Start sampling RSS while spans are open. Caller holds _lock."""
+        if self._sampler is None or not self._sampler.is_alive():
+            self._sampler = threading.Thread(target=self._sample, name="tracer-rss", daemon=True)
+            self._sampler.start()
+
+    def _sample(self) -> None:
+        """Sample the current RSS until no span is open."""
+        while True:
+            time.sleep(self.sample_interval)
+            rss = current_rss_mb()
+            with self._lock:
+                if not self._open:
+                    self._sampler = None
+                    return
+                self._record_rss(rss)
+
+def flatten_spans(span: Dict, depth: int = 0) -> List[Dict]:
+    """
+    Flatten a span tree into rows for display, depth-first.
+
+    Args:
+        span: Span dictionary from Tracer.to_dict
+        depth: Nesting depth of span
+
+    Returns:
+        List of rows with 'stage' (indented by depth), timings and share of
+        the root's wall time
+    """
+    rows = []
+    total = span['wall_seconds'] or 1e-9
+
+    def rounded(value: Optional[float], digits: int) -> Optional[float]:
+        return round(value, digits) if value is not None else None
+
+    def visit(node: Dict, level: int) -> None:
+        rows.append({
+            # Em spaces, so the indentation survives HTML whitespace collapsing
+            'stage': "\u2003\u2003" * level + node['name'] + (f" (x{node['count']})" if node['count'] > 1 else ""),
+            'wall_s': round(node['wall_seconds'], 3),
+            'thread_cpu_s': rounded(node['thread_cpu_seconds'], 3),
+            'process_cpu_s': round(node['process_cpu_seconds'], 3),
+            'peak_rss_mb': rounded(node['peak_rss_mb'], 1),
+            'rss_delta_mb': rounded(node['rss_delta_mb'], 1),
+            'share': f"{node['wall_seconds'] / total:.0%}"
+        })
+        for child in node['children']:
+            visit(child, level + 1)
+
+    visit(span, depth)
+    return rows